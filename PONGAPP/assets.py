@@ -0,0 +1,141 @@
+"""
+Module assets.py
+Registre des ressources du jeu (sons et images du dossier assets), partagé par tout le processus.
+
+Chaque fichier est lu et décodé une seule fois ; les images redimensionnées sont gardées
+par taille demandée. preload() charge toutes les ressources dans un thread en arrière-plan
+(pendant l'affichage du premier menu) : revenir au menu ou lancer une nouvelle partie ne
+relit plus rien sur le disque.
+
+Fonctions:
+    - init_mixer(): Initialise le mixer avec la fréquence et le tampon des paramètres.
+    - get_sound(name): Retourne le son demandé (pygame.mixer.Sound).
+    - get_image(name): Retourne l'image demandée, convertie au format de l'écran si possible.
+    - get_scaled_image(name, size): Retourne l'image redimensionnée (lissée) à la taille demandée.
+    - preload(): Charge toutes les ressources dans un thread en arrière-plan.
+"""
+
+import os
+import threading
+import pygame
+import settings
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+SOUND_EXTENSIONS = (".wav", ".ogg")
+IMAGE_EXTENSIONS = (".png", ".jpg", ".bmp")
+
+_lock = threading.RLock()
+_sounds = {}
+_images = {}
+_converted = {}
+_scaled = {}
+_preload_thread = None
+
+
+def init_mixer():
+    """
+    Initialise le mixer de pygame, si ce n'est pas déjà fait, avec la fréquence et la
+    taille de tampon de settings (AUDIO_FREQUENCY, AUDIO_BUFFER_SIZE).
+    """
+    if not pygame.mixer.get_init():
+        pygame.mixer.init(settings.AUDIO_FREQUENCY, -16, 2, settings.AUDIO_BUFFER_SIZE)
+
+
+def get_sound(name):
+    """
+    Retourne le son demandé, chargé au premier appel. Le mixer est initialisé si besoin.
+
+    Args:
+        name (str): Nom du fichier dans le dossier assets (ex : "ping_a.wav").
+
+    Returns:
+        pygame.mixer.Sound: Le son.
+    """
+    sound = _sounds.get(name)
+    if sound is None:
+        with _lock:
+            sound = _sounds.get(name)
+            if sound is None:
+                init_mixer()
+                sound = _sounds[name] = pygame.mixer.Sound(os.path.join(ASSET_DIR, name))
+    return sound
+
+
+def load_image(name):
+    """Retourne l'image décodée (sans conversion), lue sur le disque au premier appel."""
+    image = _images.get(name)
+    if image is None:
+        with _lock:
+            image = _images.get(name)
+            if image is None:
+                image = _images[name] = pygame.image.load(os.path.join(ASSET_DIR, name))
+    return image
+
+
+def get_image(name):
+    """
+    Retourne l'image demandée. Dès qu'une fenêtre est ouverte, l'image est convertie
+    une fois pour toutes au format de l'écran (avec transparence).
+
+    Args:
+        name (str): Nom du fichier dans le dossier assets (ex : "arrow.png").
+
+    Returns:
+        pygame.Surface: L'image.
+    """
+    image = _converted.get(name)
+    if image is not None:
+        return image
+    image = load_image(name)
+    if pygame.display.get_surface() is None:
+        return image
+    with _lock:
+        image = _converted[name] = image.convert_alpha()
+    return image
+
+
+def get_scaled_image(name, size):
+    """
+    Retourne l'image redimensionnée (pygame.transform.smoothscale), calculée une seule fois
+    pour chaque taille.
+
+    Args:
+        name (str): Nom du fichier dans le dossier assets.
+        size (tuple): Largeur et hauteur voulues.
+
+    Returns:
+        pygame.Surface: L'image à la taille demandée.
+    """
+    key = (name, size)
+    image = _scaled.get(key)
+    if image is None:
+        image = pygame.transform.smoothscale(get_image(name), size)
+        if name in _converted:
+            _scaled[key] = image
+    return image
+
+
+def preload():
+    """
+    Charge tous les sons et toutes les images du dossier assets dans un thread en
+    arrière-plan. Le mixer est initialisé ici, dans le thread principal.
+
+    Returns:
+        threading.Thread: Le thread de chargement (déjà lancé).
+    """
+    global _preload_thread
+    if _preload_thread is not None:
+        return _preload_thread
+    init_mixer()
+
+    def load_all():
+        for name in sorted(os.listdir(ASSET_DIR)):
+            extension = os.path.splitext(name)[1].lower()
+            if extension in SOUND_EXTENSIONS:
+                get_sound(name)
+            elif extension in IMAGE_EXTENSIONS:
+                load_image(name)
+
+    _preload_thread = threading.Thread(target=load_all, name="preload-assets", daemon=True)
+    _preload_thread.start()
+    return _preload_thread
@@ -0,0 +1,55 @@
+"""
+Module background.py
+Fond statique du terrain (couleur de fond, ligne centrale, futurs marquages),
+composé une seule fois puis réutilisé par chaque frame en une seule copie.
+
+Le fond est reconstruit seulement quand la taille du terrain ou le mode plein écran
+change (settings.get_current_screen_size()).
+
+Fonctions:
+    - build_background(width, height): Compose la surface du fond.
+    - get_background(width, height): Retourne le fond en cache, reconstruit si nécessaire.
+"""
+
+import pygame
+from constants import WHITE, BLACK
+import settings
+
+_cache = {"key": None, "surface": None}
+
+
+def build_background(width, height):
+    """
+    Compose la surface du fond du terrain.
+
+    Args:
+        width, height (int): Dimensions du terrain.
+
+    Returns:
+        pygame.Surface: Le fond (au format de l'écran si une fenêtre est ouverte).
+    """
+    surface = pygame.Surface((width, height))
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    surface.fill(BLACK)
+    pygame.draw.aaline(surface, WHITE, (width//2, 0), (width//2, height))
+    return surface
+
+
+def get_background(width, height):
+    """
+    Retourne le fond du terrain, reconstruit seulement si la taille ou le mode
+    plein écran a changé depuis le dernier appel.
+
+    Args:
+        width, height (int): Dimensions du terrain.
+
+    Returns:
+        pygame.Surface: Le fond du terrain.
+    """
+    fullscreen = settings.get_current_screen_size_label() == "Fullscreen"
+    key = (width, height, fullscreen)
+    if _cache["key"] != key:
+        _cache["surface"] = build_background(width, height)
+        _cache["key"] = key
+    return _cache["surface"]
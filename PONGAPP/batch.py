@@ -0,0 +1,471 @@
+"""
+Module batch.py
+Simulation vectorisée de N parties de Pong avec NumPy. Les parties sont stockées en
+structure de tableaux (un tableau par attribut, une case par partie) et avancent
+toutes ensemble à chaque pas grâce à des opérations masquées.
+
+Les règles sont celles de simulation.step (rebonds, accélération, bonus, effets,
+score jusqu'à WIN_SCORE). Une partie terminée est réinitialisée sur place et ses
+statistiques (victoires, points, frappes, bonus ramassés) sont cumulées.
+
+Classes:
+    - BatchSimulation: N parties avancées en parallèle.
+    - BatchPredictController: Contrôleur prédictif (controllers.PredictController) vectorisé.
+
+Dépendances:
+    - numpy
+"""
+
+import numpy as np
+from constants import (
+    FRAME_MS, PADDLE_WIDTH, PADDLE_SPEED, EFFECT_TYPES,
+    PADDEL_MARGIN_X, PADDLE_HEIGHT, WIN_SCORE, SPEEDUP_INTERVAL, SPEEDUP_FACTOR,
+    BALL_SPEED_INIT_X, BALL_SPEED_INIT_Y, RESET_DELAY_MS,
+    BONUS_TYPES, BONUS_RADIUS, BONUS_DURATION, BONUS_SPAWN_INTERVAL,
+    BONUS_MARGIN_X, BONUS_LEFT_ZONE, BONUS_RIGHT_ZONE
+)
+from simulation import EFFECT_NAMES, EFFECT_OWNERS, OPPONENTS, MAX_BOUNCES_PER_STEP
+from controllers import predict_crossing
+
+# Colonne de active_effects à activer pour chaque type de bonus, par joueur
+EFFECT_COLUMNS = np.array([
+    [EFFECT_NAMES.index(bonus_type["effect"] + "_" + player) for bonus_type in BONUS_TYPES]
+    for player in ("a", "b")
+])
+# Par type de bonus : durée de l'effet, règle de cumul "replace" ou "extend"
+EFFECT_SPECS = [EFFECT_TYPES[bonus_type["effect"]] for bonus_type in BONUS_TYPES]
+EFFECT_DURATIONS = np.array([spec["duration"] for spec in EFFECT_SPECS], dtype=np.float64)
+EFFECT_REPLACES = np.array([spec["stacking"] == "replace" for spec in EFFECT_SPECS])
+EFFECT_EXTENDS = np.array([spec["stacking"] == "extend" for spec in EFFECT_SPECS])
+
+
+def effect_targets():
+    """
+    Returns:
+        list: (colonne, paddle visé, attribut, facteur) de chaque effet de EFFECT_NAMES,
+        par priorité croissante (appliqués dans cet ordre, le dernier l'emporte).
+    """
+    targets = []
+    for column, name in enumerate(EFFECT_NAMES):
+        effect, player = EFFECT_OWNERS[name]
+        spec = EFFECT_TYPES[effect]
+        target = player if spec["target"] == "self" else OPPONENTS[player]
+        targets.append((spec["priority"], column, target, spec["attribute"], spec["factor"]))
+    return [target[1:] for target in sorted(targets)]
+
+
+EFFECT_TARGETS = effect_targets()
+# Colonnes des effets "replace" de chaque joueur
+REPLACE_COLUMNS = [
+    np.array([column for column, name in enumerate(EFFECT_NAMES)
+              if EFFECT_OWNERS[name][1] == player
+              and EFFECT_TYPES[EFFECT_OWNERS[name][0]]["stacking"] == "replace"])
+    for player in ("a", "b")
+]
+
+
+class BatchSimulation:
+    """
+    N parties de Pong simulées en parallèle.
+
+    Attributs (tableaux de taille N) :
+    - ball_x, ball_y, speed_x, speed_y : Position et vitesse des balles.
+    - paddle_a_y, paddle_b_y : Position verticale des paddles.
+    - paddle_a_height, paddle_b_height : Hauteur des paddles.
+    - paddle_a_speed, paddle_b_speed : Vitesse des paddles.
+    - score_a, score_b : Scores de la partie en cours.
+    - time, last_speedup, last_bonus_spawn, serve_timer : Timers en millisecondes.
+    - bonus_active, bonus_type, bonus_x, bonus_y, bonus_spawn_time : État des bonus.
+    - active_effects : Tableau (N, 6) des effets actifs, colonnes dans l'ordre de EFFECT_NAMES.
+    - effect_expiry : Tableau (N, 6) des temps de fin des effets actifs.
+    - point_a, point_b : Points marqués par A et par B au dernier pas.
+    - done : Parties terminées au dernier pas (avant leur réinitialisation).
+    - wins_a, wins_b, points, paddle_hits, bonus_pickups : Statistiques cumulées.
+
+    Méthodes :
+    - reset(mask) : Réinitialise les parties sélectionnées.
+    - step(inputs, dt) : Avance toutes les parties d'un pas.
+    """
+    def __init__(self, n, width, height, paddle_height, ball_size, seed=None):
+        self.n = n
+        self.width = width
+        self.height = height
+        self.base_paddle_height = paddle_height
+        self.ball_size = ball_size
+        self.rng = np.random.default_rng(seed)
+        self.paddle_a_x = PADDEL_MARGIN_X
+        self.paddle_b_x = width - PADDEL_MARGIN_X - PADDLE_WIDTH
+
+        self.ball_x = np.zeros(n)
+        self.ball_y = np.zeros(n)
+        self.speed_x = np.zeros(n)
+        self.speed_y = np.zeros(n)
+        self.paddle_a_y = np.zeros(n)
+        self.paddle_b_y = np.zeros(n)
+        self.paddle_a_height = np.zeros(n)
+        self.paddle_b_height = np.zeros(n)
+        self.paddle_a_speed = np.zeros(n)
+        self.paddle_b_speed = np.zeros(n)
+        self.score_a = np.zeros(n, dtype=np.int16)
+        self.score_b = np.zeros(n, dtype=np.int16)
+        self.time = np.zeros(n)
+        self.last_speedup = np.zeros(n)
+        self.last_bonus_spawn = np.zeros(n)
+        self.serve_timer = np.zeros(n)
+        self.bonus_active = np.zeros(n, dtype=bool)
+        self.bonus_type = np.zeros(n, dtype=np.int8)
+        self.bonus_x = np.zeros(n)
+        self.bonus_y = np.zeros(n)
+        self.bonus_spawn_time = np.zeros(n)
+        self.active_effects = np.zeros((n, len(EFFECT_NAMES)), dtype=bool)
+        self.effect_expiry = np.zeros((n, len(EFFECT_NAMES)))
+        self.point_a = np.zeros(n, dtype=bool)
+        self.point_b = np.zeros(n, dtype=bool)
+        self.done = np.zeros(n, dtype=bool)
+
+        self.wins_a = np.zeros(n, dtype=np.int64)
+        self.wins_b = np.zeros(n, dtype=np.int64)
+        self.points = np.zeros(n, dtype=np.int64)
+        self.paddle_hits = np.zeros(n, dtype=np.int64)
+        self.bonus_pickups = np.zeros(n, dtype=np.int64)
+
+        self.reset(np.ones(n, dtype=bool))
+
+
+    def reset(self, mask):
+        """
+        Réinitialise sur place les parties sélectionnées (scores, timers, bonus, balle).
+
+        Args:
+            mask (np.ndarray): Masque booléen des parties à réinitialiser.
+        """
+        start_y = self.height//2 - self.base_paddle_height//2
+        self.paddle_a_y[mask] = start_y
+        self.paddle_b_y[mask] = start_y
+        self.paddle_a_height[mask] = self.base_paddle_height
+        self.paddle_b_height[mask] = self.base_paddle_height
+        self.paddle_a_speed[mask] = PADDLE_SPEED
+        self.paddle_b_speed[mask] = PADDLE_SPEED
+        self.score_a[mask] = 0
+        self.score_b[mask] = 0
+        self.time[mask] = 0
+        self.last_bonus_spawn[mask] = 0
+        self.bonus_active[mask] = False
+        self.active_effects[mask] = False
+        self.serve(mask)
+        self.serve_timer[mask] = 0
+
+
+    def serve(self, mask):
+        """
+        Replace les balles sélectionnées au centre avec une vitesse aléatoire.
+        """
+        count = int(np.count_nonzero(mask))
+        if count == 0:
+            return
+        self.ball_x[mask] = self.width//2 - self.ball_size//2
+        self.ball_y[mask] = self.height//2 - self.ball_size//2
+        self.speed_x[mask] = self.rng.choice((-1, 1), count) * BALL_SPEED_INIT_X
+        self.speed_y[mask] = self.rng.choice((-1, 1), count) * BALL_SPEED_INIT_Y
+        self.last_speedup[mask] = self.time[mask]
+
+
+    def spawn_bonus(self, mask):
+        """
+        Fait apparaître un bonus aléatoire dans les parties sélectionnées.
+        """
+        idx = np.flatnonzero(mask)
+        if idx.size == 0:
+            return
+        rng = self.rng
+        left = rng.integers(0, 2, idx.size, dtype=bool)
+        self.bonus_type[idx] = rng.integers(0, len(BONUS_TYPES), idx.size)
+        self.bonus_x[idx] = np.where(
+            left,
+            rng.integers(BONUS_MARGIN_X, BONUS_LEFT_ZONE, idx.size, endpoint=True),
+            rng.integers(BONUS_RIGHT_ZONE, self.width - BONUS_MARGIN_X, idx.size, endpoint=True))
+        self.bonus_y[idx] = rng.integers(PADDLE_HEIGHT, self.height - PADDLE_HEIGHT, idx.size,
+                                         endpoint=True)
+        self.bonus_active[idx] = True
+        self.bonus_spawn_time[idx] = self.time[idx]
+        self.last_bonus_spawn[idx] = self.time[idx]
+
+
+    def collect_bonus(self, paddle_x, paddle_y, paddle_height, player):
+        """
+        Vérifie la collecte des bonus actifs par un paddle et active l'effet gagné,
+        selon sa règle de cumul (voir simulation.start_effect).
+
+        Args:
+            paddle_x (int): Abscisse du paddle.
+            paddle_y, paddle_height (np.ndarray): Position et hauteur du paddle.
+            player (int): 0 pour le joueur A, 1 pour le joueur B.
+
+        Returns:
+            bool: True si au moins un bonus a été collecté.
+        """
+        size = BONUS_RADIUS * 2
+        hit = (self.bonus_active
+               & (self.bonus_x < paddle_x + PADDLE_WIDTH) & (paddle_x < self.bonus_x + size)
+               & (self.bonus_y < paddle_y + paddle_height) & (paddle_y < self.bonus_y + size))
+        idx = np.flatnonzero(hit)
+        if idx.size == 0:
+            return False
+        self.bonus_active[idx] = False
+        self.bonus_pickups[idx] += 1
+        bonus_type = self.bonus_type[idx]
+        columns = EFFECT_COLUMNS[player][bonus_type]
+        extend = EFFECT_EXTENDS[bonus_type] & self.active_effects[idx, columns]
+        start = np.where(extend, self.effect_expiry[idx, columns], self.time[idx])
+        replace = idx[EFFECT_REPLACES[bonus_type]]
+        self.active_effects[replace[:, None], REPLACE_COLUMNS[player]] = False
+        self.active_effects[idx, columns] = True
+        self.effect_expiry[idx, columns] = start + EFFECT_DURATIONS[bonus_type]
+        return True
+
+
+    def expire_effects(self):
+        """
+        Termine les effets dont la fin est atteinte.
+
+        Returns:
+            bool: True si au moins un effet s'est terminé.
+        """
+        expired = self.active_effects & (self.effect_expiry <= self.time[:, None])
+        if not expired.any():
+            return False
+        self.active_effects &= ~expired
+        return True
+
+
+    def apply_effects(self):
+        """
+        Recalcule la vitesse et la hauteur des paddles à partir des effets actifs
+        (table EFFECT_TYPES, l'effet de plus haute priorité l'emporte sur un attribut).
+        Appelée seulement quand un effet commence ou se termine.
+        """
+        effects = self.active_effects
+        bases = {"speed": PADDLE_SPEED, "height": self.base_paddle_height}
+        for player in ("a", "b"):
+            for attribute, base in bases.items():
+                getattr(self, f"paddle_{player}_{attribute}")[:] = base
+        for column, target, attribute, factor in EFFECT_TARGETS:
+            values = getattr(self, f"paddle_{target}_{attribute}")
+            values[effects[:, column]] = bases[attribute] * factor
+
+
+    def move_paddles(self, inputs, scale):
+        """
+        Déplace les paddles selon les directions demandées, sans dépasser les bords.
+        """
+        limit = self.height - 1
+        for y, height, speed, direction in (
+                (self.paddle_a_y, self.paddle_a_height, self.paddle_a_speed, inputs[:, 0]),
+                (self.paddle_b_y, self.paddle_b_height, self.paddle_b_speed, inputs[:, 1])):
+            up = (direction < 0) & (y > 0)
+            down = (direction > 0) & (y + height < limit)
+            y += (down.astype(np.float64) - up) * speed * scale
+
+
+    def paddle_impact(self, dx, dy, face, paddle_y, paddle_height, crossing):
+        """
+        Fraction du déplacement à laquelle chaque balle touche la face avant d'un paddle
+        (inf si pas de contact pendant ce déplacement).
+
+        Args:
+            dx, dy (np.ndarray): Déplacements des balles.
+            face (float): Abscisse de la balle au contact (bord gauche de la balle).
+            paddle_y, paddle_height (np.ndarray): Position et hauteur du paddle.
+            crossing (np.ndarray): Masque des balles qui franchissent cette abscisse.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(crossing, (face - self.ball_x) / dx, np.inf)
+        y = self.ball_y + dy * np.where(crossing, t, 0)
+        touching = crossing & (y < paddle_y + paddle_height) & (paddle_y < y + self.ball_size)
+        return np.where(touching, t, np.inf)
+
+
+    def move_balls(self, scale):
+        """
+        Déplace les balles en jeu, gère les rebonds sur les murs et les paddles,
+        et retourne les masques des points marqués par A et par B.
+
+        Comme simulation.move_ball, le déplacement est balayé : chaque balle est avancée
+        jusqu'à son premier contact, rebondit, puis parcourt le reste de son déplacement.
+        """
+        size = self.ball_size
+        bottom = self.height - 1 - size
+        face_a = self.paddle_a_x + PADDLE_WIDTH
+        face_b = self.paddle_b_x - size
+        remaining = np.where(self.serve_timer <= 0, 1.0, 0.0)
+        for _ in range(MAX_BOUNCES_PER_STEP):
+            active = remaining > 0
+            if not active.any():
+                break
+            dx = self.speed_x * scale * remaining
+            dy = self.speed_y * scale * remaining
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t_wall = np.where((dy < 0) & (self.ball_y + dy <= 0), np.maximum(0, self.ball_y / -dy), np.inf)
+                t_wall = np.where((dy > 0) & (self.ball_y + dy >= bottom),
+                                  np.maximum(0, (bottom - self.ball_y) / dy), t_wall)
+            t_a = self.paddle_impact(dx, dy, face_a, self.paddle_a_y, self.paddle_a_height,
+                                     (dx < 0) & (self.ball_x >= face_a) & (self.ball_x + dx < face_a))
+            t_b = self.paddle_impact(dx, dy, face_b, self.paddle_b_y, self.paddle_b_height,
+                                     (dx > 0) & (self.ball_x <= face_b) & (self.ball_x + dx > face_b))
+
+            t = np.minimum(np.minimum(t_wall, t_a), t_b)
+            hit = active & (t <= 1)
+            t = np.where(hit, t, 1.0)
+            self.ball_x += dx * t
+            self.ball_y += dy * t
+
+            wall = hit & (t_wall == t)
+            paddle = hit & ~wall
+            self.speed_y[wall] *= -1
+            self.speed_x[paddle] *= -1
+            self.paddle_hits += paddle
+            remaining = np.where(hit, remaining * (1 - t), 0.0)
+
+        # Paddle déplacé sur la balle : on la repousse devant sa face
+        moving = self.serve_timer <= 0
+        overlap_a = (moving & (self.ball_y < self.paddle_a_y + self.paddle_a_height)
+                     & (self.paddle_a_y < self.ball_y + size)
+                     & (self.ball_x < face_a) & (self.paddle_a_x < self.ball_x + size))
+        self.ball_x[overlap_a] = face_a
+        self.speed_x[overlap_a] = np.abs(self.speed_x[overlap_a])
+        overlap_b = (moving & ~overlap_a & (self.ball_y < self.paddle_b_y + self.paddle_b_height)
+                     & (self.paddle_b_y < self.ball_y + size)
+                     & (self.ball_x < self.paddle_b_x + PADDLE_WIDTH) & (self.paddle_b_x < self.ball_x + size))
+        self.ball_x[overlap_b] = face_b
+        self.speed_x[overlap_b] = -np.abs(self.speed_x[overlap_b])
+        self.paddle_hits += overlap_a
+        self.paddle_hits += overlap_b
+
+        point_b = moving & (self.ball_x <= 0)
+        point_a = moving & ~point_b & (self.ball_x + size >= self.width)
+        return point_a, point_b
+
+
+    def step(self, inputs, dt=FRAME_MS):
+        """
+        Avance toutes les parties d'un pas de simulation.
+
+        Args:
+            inputs (np.ndarray): Tableau (N, 2) des directions des paddles (-1, 0, 1).
+            dt (float): Durée du pas en millisecondes.
+
+        Returns:
+            np.ndarray: Masque des parties terminées pendant ce pas (déjà réinitialisées).
+        """
+        inputs = np.broadcast_to(np.asarray(inputs), (self.n, 2))
+        scale = dt / FRAME_MS
+        self.time += dt
+
+        # Gestion des bonus
+        self.spawn_bonus(~self.bonus_active & (self.time - self.last_bonus_spawn > BONUS_SPAWN_INTERVAL))
+        changed = self.expire_effects()
+        if self.bonus_active.any():
+            changed |= self.collect_bonus(self.paddle_a_x, self.paddle_a_y, self.paddle_a_height, 0)
+            changed |= self.collect_bonus(self.paddle_b_x, self.paddle_b_y, self.paddle_b_height, 1)
+        if changed:
+            self.apply_effects()
+
+        speedup = self.time - self.last_speedup > SPEEDUP_INTERVAL
+        if speedup.any():
+            self.speed_x[speedup] *= SPEEDUP_FACTOR
+            self.speed_y[speedup] *= SPEEDUP_FACTOR
+            self.last_speedup[speedup] = self.time[speedup]
+
+        self.move_paddles(inputs, scale)
+        self.point_a, self.point_b = point_a, point_b = self.move_balls(scale)
+        self.serve_timer -= np.where(self.serve_timer > 0, dt, 0)
+
+        scored = point_a | point_b
+        if scored.any():
+            self.score_a += point_a
+            self.score_b += point_b
+            self.points += scored
+            self.serve(scored)
+            self.serve_timer[scored] = RESET_DELAY_MS
+            self.active_effects[scored] = False
+            self.apply_effects()
+
+        self.bonus_active &= self.time - self.bonus_spawn_time <= BONUS_DURATION
+
+        won_a = self.score_a == WIN_SCORE
+        won_b = self.score_b == WIN_SCORE
+        self.done = won_a | won_b
+        if self.done.any():
+            self.wins_a += won_a
+            self.wins_b += won_b
+            self.reset(self.done)
+        return self.done
+
+
+class BatchPredictController:
+    """
+    Version vectorisée de controllers.PredictController : décide la direction d'un
+    paddle dans les N parties d'une BatchSimulation en une seule opération.
+
+    Attributs :
+        sim (BatchSimulation) : Parties contrôlées.
+        side (str) : Côté contrôlé ("a" ou "b").
+        reaction_ms (float) : Retard de réaction en millisecondes (anneau des balles
+            observées, d'autant de pas que ce retard en contient).
+        error (float) : Erreur de visée maximale, en fraction de la hauteur du paddle.
+    """
+    def __init__(self, sim, side, reaction_ms=0.0, error=0.0, seed=None):
+        self.sim = sim
+        self.side = side
+        self.reaction_ms = reaction_ms
+        self.error = error
+        self.rng = np.random.default_rng(seed)
+        self.observations = np.zeros((round(reaction_ms / FRAME_MS) + 1, 4, sim.n))
+        self.count = 0
+        self.aim_offset = np.zeros(sim.n)
+        self.heading = np.zeros(sim.n)
+
+    def decide(self, dt=FRAME_MS):
+        """
+        Args:
+            dt (float): Durée du pas à venir en millisecondes.
+
+        Returns:
+            np.ndarray: Directions (-1, 0, 1) du paddle dans chaque partie.
+        """
+        sim = self.sim
+        steps = round(self.reaction_ms / dt) + 1
+        if len(self.observations) != steps:
+            # Durée de pas changée : anneau redimensionné, rempli à nouveau
+            self.observations = np.zeros((steps, 4, sim.n))
+            self.count = 0
+        ring = self.observations
+        slot = self.count % len(ring)
+        ring[slot] = sim.ball_x, sim.ball_y, sim.speed_x, sim.speed_y
+        self.count += 1
+        x, y, speed_x, speed_y = ring[self.count % len(ring) if self.count >= len(ring) else 0]
+
+        if self.side == "a":
+            paddle_y, height, speed = sim.paddle_a_y, sim.paddle_a_height, sim.paddle_a_speed
+            face, approaching = sim.paddle_a_x + PADDLE_WIDTH, speed_x < 0
+        else:
+            paddle_y, height, speed = sim.paddle_b_y, sim.paddle_b_height, sim.paddle_b_speed
+            face, approaching = sim.paddle_b_x - sim.ball_size, speed_x > 0
+
+        heading = np.sign(speed_x)
+        changed = heading != self.heading
+        if self.error and changed.any():
+            self.aim_offset[changed] = self.rng.uniform(-self.error, self.error, changed.sum()) * height[changed]
+        self.heading = heading
+
+        dead_zone = speed * (dt / FRAME_MS / 2)
+        limit = np.maximum(0.0, (height + sim.ball_size) / 2 - dead_zone)
+        aim = np.clip(self.aim_offset, -limit, limit)
+        bottom = sim.height - 1 - sim.ball_size
+        frames = np.maximum(0.0, (face - x) / np.where(speed_x == 0, 1, speed_x))
+        target = np.where(approaching,
+                          predict_crossing(y, speed_y, frames, bottom) + sim.ball_size / 2 + aim,
+                          sim.height / 2)
+        offset = target - (paddle_y + height / 2)
+        return np.where(offset > dead_zone, 1, np.where(offset < -dead_zone, -1, 0)).astype(np.int8)
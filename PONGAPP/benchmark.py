@@ -0,0 +1,340 @@
+"""
+Banc d'essai des performances du jeu, sans fenêtre ni son (pilotes SDL "dummy").
+
+Mesures (graines fixes, médiane de plusieurs répétitions) :
+- simulation_steps_per_s : pas de simulation.step par seconde (deux contrôleurs prédictifs) ;
+- game_update_steps_per_s : pas de PongGame.update par seconde (sons compris, sans attente) ;
+- audio_latency_estimate_ms : latence estimée entre le déclenchement d'un son et sa sortie
+  (sounds.SoundBoard : attente moyenne plus durée du tampon du mixer), pendant la mesure précédente ;
+- draw_fps[<taille>] : PongGame.draw par seconde pour chaque taille de settings.SCREEN_SIZES ;
+- render_scale_fps[<échelle>] : PongGame.draw par seconde en plein écran pour chaque échelle
+  de rendu de settings.RENDER_SCALES autre que "Natif" (agrandissement compris) ;
+- multiball_fps[<balles>] : frames (update + draw) par seconde en mode multiball avec des
+  centaines ou des milliers de balles (paddles de la hauteur du terrain : aucune ne sort ;
+  mesure absente sans numpy) ;
+- env_steps_per_s[<observation>] : pas de parties par seconde de l'environnement
+  d'apprentissage env.PongEnv (ENV_COUNT parties, observations "state" ou "pixels" ;
+  mesure absente sans numpy) ;
+- main_menu_frame_ms / parametres_menu_frame_ms : coût d'une frame des menus ;
+- cold_start_ms : lancement de main.py jusqu'à la première frame du menu (nouveau processus),
+  à comparer à COLD_START_BUDGET_MS.
+
+Les résultats sont écrits en JSON et comparés à une référence enregistrée : une mesure
+moins bonne que la référence de plus de --tolerance, ou un démarrage au-delà du budget,
+est signalé comme régression (code de sortie 1). Sans référence, le code de sortie est 2,
+sauf avec --allow-missing-baseline (mesures et budget de démarrage seuls).
+
+Exemple :
+    python benchmark.py --output resultats.json
+    python benchmark.py --save-baseline          (enregistre la référence de cette machine)
+    python benchmark.py --allow-missing-baseline (mesures seules, sans référence)
+"""
+
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+import argparse
+import importlib.util
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import pygame
+from constants import FONT_SIZE, COLD_START_BUDGET_MS, WIDTH, HEIGHT
+import settings
+import simulation
+import menu
+import scenes
+import display
+from controllers import PredictController
+from fonts import get_font
+
+MULTIBALL_COUNTS = (250, 1000, 4000)
+ENV_COUNT = 64
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "baseline.json")
+
+# Sens de chaque mesure : True si une valeur plus grande est meilleure
+HIGHER_IS_BETTER = {
+    "simulation_steps_per_s": True,
+    "game_update_steps_per_s": True,
+    "audio_latency_estimate_ms": False,
+    "draw_fps": True,
+    "render_scale_fps": True,
+    "multiball_fps": True,
+    "env_steps_per_s": True,
+    "main_menu_frame_ms": False,
+    "parametres_menu_frame_ms": False,
+    "cold_start_ms": False,
+}
+
+
+def median_of(repeats, function):
+    """Exécute la mesure `repeats` fois et retourne la médiane."""
+    return statistics.median(function() for _ in range(repeats))
+
+
+def bench_simulation(steps):
+    """Pas de simulation par seconde, parties enchaînées entre deux contrôleurs prédictifs."""
+    state = simulation.new_match(800, 400, 80, 15, 1)
+    controller_a = PredictController("a")
+    controller_b = PredictController("b", error=0.5)
+    start = time.perf_counter()
+    for _ in range(steps):
+        if not state.running:
+            state = simulation.new_match(800, 400, 80, 15, 1)
+        simulation.step(state, (controller_a.decide(state), controller_b.decide(state)))
+    return steps / (time.perf_counter() - start)
+
+
+def new_game(label, render_scale_index=0):
+    """Crée une partie dans la taille d'écran et l'échelle de rendu demandées, comme main.py."""
+    from game import PongGame
+    settings.CURRENT_SCREEN_SIZE_INDEX = [size[0] for size in settings.SCREEN_SIZES].index(label)
+    settings.CURRENT_RENDER_SCALE_INDEX = render_scale_index
+    width, height = display.get_screen().get_size()
+    if settings.get_current_render_scale() is not None:
+        width, height = WIDTH, HEIGHT
+    game = PongGame(settings.get_current_paddle_height(), width, height, seed=1, ai_side="a")
+    game.recorder = None
+    game.controllers["b"] = PredictController("b")
+    return game
+
+
+def bench_game_update(steps):
+    """
+    Returns:
+        tuple: Pas de PongGame.update par seconde, latence estimée des sons (ms).
+    """
+    game = new_game(settings.SCREEN_SIZES[0][0])
+    start = time.perf_counter()
+    for _ in range(steps):
+        game.update(game.read_inputs())
+    return steps / (time.perf_counter() - start), game.audio.stats()["latency_estimate_ms"]
+
+
+def bench_draw(label, frames, render_scale_index=0):
+    """PongGame.draw par seconde dans une taille d'écran (la partie avance entre deux frames)."""
+    game = new_game(label, render_scale_index)
+    elapsed = 0.0
+    for _ in range(frames):
+        game.update(game.read_inputs())
+        start = time.perf_counter()
+        game.draw()
+        elapsed += time.perf_counter() - start
+    return frames / elapsed
+
+
+def bench_multiball(count, frames):
+    """
+    Frames (PongGame.update + PongGame.draw) par seconde en mode multiball avec `count`
+    balles, lancées au hasard (graine fixe) entre deux paddles de la hauteur du terrain.
+    """
+    import numpy as np
+    from game import PongGame
+    settings.CURRENT_SCREEN_SIZE_INDEX = 1
+    width, height = display.get_screen().get_size()
+    game = PongGame(height, width, height, seed=1, ai_side=None, multiball=True)
+    rng = np.random.default_rng(1)
+    balls = game.state.balls
+    balls.count = 0
+    balls.add(rng.uniform(width * 0.2, width * 0.8, count), rng.uniform(0, height - balls.size, count),
+              rng.choice((-1.0, 1.0), count) * 5, rng.uniform(-6, 6, count))
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.update((0, 0))
+        game.draw()
+    return frames / (time.perf_counter() - start)
+
+
+def bench_env(observation, steps):
+    """
+    Pas de parties par seconde de env.PongEnv : ENV_COUNT parties, paddle A immobile
+    contre le contrôleur prédictif.
+    """
+    import numpy as np
+    from env import PongEnv
+    env = PongEnv(ENV_COUNT, observation=observation, seed=1)
+    env.reset()
+    actions = np.zeros(ENV_COUNT, dtype=np.int8)
+    start = time.perf_counter()
+    for _ in range(steps):
+        env.step(actions)
+    elapsed = time.perf_counter() - start
+    env.close()
+    return steps * ENV_COUNT / elapsed
+
+
+def bench_menu(make_menu, frames):
+    """
+    Coût moyen d'une frame de menu en millisecondes, dans la boucle de scènes. Le menu
+    reçoit une touche par frame (bas puis haut), puis remonte sur sa dernière option et
+    la valide pour en sortir.
+    """
+    keys = [pygame.K_DOWN, pygame.K_UP] * (frames // 2) + [pygame.K_UP, pygame.K_RETURN]
+    events = iter([pygame.event.Event(pygame.KEYDOWN, key=key) for key in keys])
+    timestamps = []
+
+    def scripted_events(timeout=0):
+        timestamps.append(time.perf_counter())
+        return [next(events)]
+
+    font = get_font("Arial", FONT_SIZE)
+    manager = scenes.SceneManager()
+    real_wait_events = scenes.wait_events
+    scenes.wait_events = scripted_events
+    try:
+        start = time.perf_counter()
+        manager.push(make_menu(font))
+        manager.run()
+    finally:
+        scenes.wait_events = real_wait_events
+    return (timestamps[-1] - start) / len(timestamps) * 1000
+
+
+def bench_cold_start():
+    """Temps en millisecondes entre le lancement de main.py et sa première frame de menu."""
+    child = ("import sys, time, pygame\n"
+             "flip = pygame.display.flip\n"
+             "def first_flip():\n"
+             "    flip()\n"
+             "    sys.stdout.write('ready\\n'); sys.stdout.flush()\n"
+             "    pygame.quit(); raise SystemExit\n"
+             "pygame.display.flip = first_flip\n"
+             "import main; main.main()\n")
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-c", child], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), env=os.environ)
+    elapsed = (time.perf_counter() - start) * 1000
+    if "ready" not in process.stdout:
+        raise RuntimeError(f"main.py n'a pas affiché de menu : {process.stderr.strip()}")
+    return elapsed
+
+
+def run_benchmarks(repeats=3, quick=False):
+    """
+    Lance toutes les mesures.
+
+    Returns:
+        dict: Nom de la mesure → valeur (draw_fps : taille d'écran → valeur).
+    """
+    steps = 2000 if quick else 20000
+    frames = 100 if quick else 600
+    display.init()
+    updates = [bench_game_update(steps // 4) for _ in range(repeats)]
+    results = {
+        "simulation_steps_per_s": median_of(repeats, lambda: bench_simulation(steps)),
+        "game_update_steps_per_s": statistics.median(rate for rate, _ in updates),
+        "audio_latency_estimate_ms": statistics.median(latency for _, latency in updates),
+        "draw_fps": {label: median_of(repeats, lambda: bench_draw(label, frames))
+                     for label, _, _ in settings.SCREEN_SIZES},
+        "render_scale_fps": {name: median_of(repeats, lambda: bench_draw("Fullscreen", frames, index))
+                             for index, (name, scale) in enumerate(settings.RENDER_SCALES) if scale},
+    }
+    settings.CURRENT_RENDER_SCALE_INDEX = 0
+    if importlib.util.find_spec("numpy") is not None:
+        results["multiball_fps"] = {str(count): median_of(repeats, lambda: bench_multiball(count, frames // 2))
+                                    for count in MULTIBALL_COUNTS}
+        results["env_steps_per_s"] = {observation: median_of(repeats, lambda: bench_env(observation, frames))
+                                      for observation in ("state", "pixels")}
+    settings.CURRENT_SCREEN_SIZE_INDEX = 1
+    results["main_menu_frame_ms"] = median_of(repeats, lambda: bench_menu(lambda font: menu.MainMenu(font, {}), frames // 4))
+    results["parametres_menu_frame_ms"] = median_of(repeats, lambda: bench_menu(menu.SettingsMenu, frames // 4))
+    pygame.quit()
+    results["cold_start_ms"] = median_of(repeats, bench_cold_start)
+    return results
+
+
+def flatten(results):
+    """Aplatit les mesures : draw_fps[<taille>] devient une mesure à part."""
+    flat = {}
+    for name, value in results.items():
+        if isinstance(value, dict):
+            for key, sub_value in value.items():
+                flat[f"{name}[{key}]"] = sub_value
+        else:
+            flat[name] = value
+    return flat
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare les mesures à la référence.
+
+    Args:
+        results, baseline (dict): Mesures (format de run_benchmarks).
+        tolerance (float): Dégradation relative tolérée (0.1 pour 10 %).
+
+    Returns:
+        list: Tuples (mesure, référence, valeur, écart relatif, régression) des mesures communes.
+    """
+    rows = []
+    current, reference = flatten(results), flatten(baseline)
+    for name, value in current.items():
+        if name not in reference:
+            continue
+        base = reference[name]
+        change = (value - base) / base if base else 0.0
+        higher_is_better = HIGHER_IS_BETTER[name.split("[")[0]]
+        regression = change < -tolerance if higher_is_better else change > tolerance
+        rows.append((name, base, value, change, regression))
+    return rows
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Banc d'essai des performances de Pong.")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Fichier JSON de référence")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Enregistre les résultats comme nouvelle référence")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="Sans fichier de référence, affiche les mesures sans échouer")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Dégradation relative tolérée avant de signaler une régression")
+    parser.add_argument("--repeats", type=int, default=3, help="Répétitions de chaque mesure (médiane)")
+    parser.add_argument("--quick", action="store_true", help="Mesures courtes (moins précises)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": f"{platform.system()} {platform.machine()}",
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": run_benchmarks(args.repeats, args.quick),
+    }
+    for name, value in flatten(report["results"]).items():
+        print(f"{name:<36}{value:>14.2f}")
+    over_budget = report["results"]["cold_start_ms"] > COLD_START_BUDGET_MS
+    if over_budget:
+        print(f"Démarrage au-delà du budget de {COLD_START_BUDGET_MS} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Référence enregistrée : {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"Pas de référence ({args.baseline}) : lancer avec --save-baseline pour en "
+              "enregistrer une, ou --allow-missing-baseline pour ne faire que les mesures.")
+        if not args.allow_missing_baseline:
+            return 2
+        return 1 if over_budget else 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    print(f"\nComparaison avec la référence du {baseline['date']} ({baseline['machine']}) :")
+    regressions = 0
+    for name, base, value, change, regression in compare(report["results"], baseline["results"], args.tolerance):
+        regressions += regression
+        print(f"{name:<36}{base:>14.2f}{value:>14.2f}{change:>+9.1%}{'  RÉGRESSION' if regression else ''}")
+    return 1 if regressions or over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
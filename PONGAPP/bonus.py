@@ -6,30 +6,30 @@ Classes:
     - Bonus: Représente un bonus avec des propriétés, effets, et gestion de durée.
 Constantes importées:
     - WHITE, BLACK: Couleurs.
-    - PADDLE_HEIGHT: height des paddles.
-    - BONUS_RADIUS: Rayon du bonus.
-    - BONUS_DURATION: Durée d'un bonus actif.
+    - BONUS_TYPES: Types de bonus disponibles.
     - BONUS_BLINK_INTERVAL: Intervalle de clignotement.
-Fonctions utilitaires:
-    - format_time: Formate le temps restant pour affichage.
+Modules:
+    - simulation: Logique du bonus (apparition, collecte) indépendante de pygame.
 """
 
-import random
 import pygame
 from constants import (
-    WHITE, BLACK, GREEN, YELLOW, RED,
-    PADDLE_HEIGHT, BONUS_RADIUS, BONUS_DURATION, BONUS_BLINK_INTERVAL,
-    BONUS_LEFT_ZONE, BONUS_RIGHT_ZONE, BONUS_MARGIN_X,
+    WHITE, BLACK, BONUS_TYPES, BONUS_BLINK_INTERVAL,
     BONUS_INFO_Y_PLAYER1, BONUS_INFO_Y_PLAYER2,
     BONUS_FONT_SIZE, BONUS_INFO_FONT_SIZE
 )
+import simulation
+from fonts import get_font, render_text
 
 
 class Bonus:
     """
     Classe représentant un bonus dans le jeu Pong.
+    La logique (apparition, collecte, expiration) est portée par un simulation.BonusState ;
+    cette classe l'expose avec des objets pygame et se charge de son affichage.
 
     Attributs :
+        state (simulation.BonusState) : État du bonus partagé avec la simulation.
         radius (int) : Rayon du bonus.
         active (bool) : Indique si le bonus est actif.
         type (dict) : Type de bonus (nom, couleur, effet).
@@ -43,71 +43,84 @@ class Bonus:
         visible (bool) : Indique si le bonus est visible.
 
     Méthodes :
-        spawn(screen) : Fait apparaître un bonus aléatoire sur le terrain.
-        update() : Met à jour l'état du bonus (expiration).
         draw(screen) : Dessine le bonus et affiche ses infos.
-        check_collision(rect, player) : Vérifie la collision avec un joueur.
-        is_active() : Vérifie si le bonus est encore actif.
     """
-    def __init__(self):
-        self.radius = BONUS_RADIUS
-        self.active = False
-        self.type = None
-        self.rect = pygame.Rect(0, 0, self.radius*2, self.radius*2)
-        self.spawn_time = 0
-        self.collected_time = 0
-        self.duration = BONUS_DURATION
-        self.color = WHITE
-        self.types = [
-            {"name": "FAST", "color": GREEN, "effect": "increase_speed"},
-            {"name": "BIG", "color": YELLOW, "effect": "increase_size"},
-            {"name": "SLOW", "color": RED, "effect": "slow_opponent"}
-        ]
+    def __init__(self, state=None):
+        self.state = state if state is not None else simulation.BonusState()
+        self.types = BONUS_TYPES
         self.blink_timer = 0
         self.visible = True
+        self.was_active = self.state.active
 
 
-    def spawn(self, screen):
-        """
-        Fait apparaître un bonus sur l'écran. Définit son type, couleur, position aléatoire
-        et initialise les attributs liés à son état (actif, temps d'apparition, visibilité).
-        """
-        if not self.active:
-            self.type = random.choice(self.types)
-            self.color = self.type["color"]
-            spawn_side = random.choice(["left", "right"])
-
-            if spawn_side == "left":
-                self.rect.x = random.randint(BONUS_MARGIN_X, BONUS_LEFT_ZONE)
-            else:
-                self.rect.x = random.randint(BONUS_RIGHT_ZONE, screen.get_width() - BONUS_MARGIN_X)
-
-            self.rect.y = random.randint(PADDLE_HEIGHT, screen.get_height() - PADDLE_HEIGHT)
-            self.active = True
-            self.spawn_time = pygame.time.get_ticks()
-            self.blink_timer = 0
-            self.visible = True
+    @property
+    def radius(self):
+        """Rayon du bonus."""
+        return self.state.radius
 
+    @property
+    def active(self):
+        """Indique si le bonus est présent sur le terrain."""
+        return self.state.active
 
-    def update(self):
-        """
-        Met à jour l'état du bonus. 
-        Désactive le bonus si 10 secondes se sont écoulées depuis son apparition.
-        """
-        # Faire disparaître le bonus après 10 secondes
-        if self.active and pygame.time.get_ticks() - self.spawn_time > self.duration:
-            self.active = False
+    @active.setter
+    def active(self, value):
+        self.state.active = value
+
+    @property
+    def type(self):
+        """Type du bonus (dict de BONUS_TYPES) ou None."""
+        return None if self.state.type is None else self.types[self.state.type]
+
+    @property
+    def color(self):
+        """Couleur du bonus."""
+        return WHITE if self.state.type is None else self.type["color"]
 
+    @property
+    def rect(self):
+        """Rectangle englobant le bonus."""
+        return pygame.Rect(self.state.x, self.state.y, self.radius*2, self.radius*2)
 
-    def draw(self, screen):
+    @property
+    def spawn_time(self):
+        """Temps d'apparition du bonus."""
+        return self.state.spawn_time
+
+    @property
+    def collected_time(self):
+        """Temps de collecte du bonus."""
+        return self.state.collected_time
+
+    @property
+    def duration(self):
+        """Durée de vie du bonus et de son effet."""
+        return self.state.duration
+
+
+    def draw(self, screen, now=None, scale=1):
         """
         Dessine le bonus sur l'écran s'il est actif et gère son clignotement.
         Args:
             screen (pygame.Surface): Surface sur laquelle dessiner le bonus.
+            now (int): Temps actuel en millisecondes (par défaut : pygame.time.get_ticks()).
+            scale (float): Facteur entre les coordonnées du terrain et celles de screen
+                (rendu à l'échelle, voir settings.RENDER_SCALES).
 
         Affiche également le type et le temps restant du bonus, ainsi que le temps
         restant des bonus actifs.
+
+        Returns:
+            list: Rectangles des zones dessinées.
         """
+        rects = []
+        now = pygame.time.get_ticks() if now is None else now
+        if self.active and not self.was_active:
+            # Nouveau bonus : le clignotement repart de zéro
+            self.blink_timer = 0
+            self.visible = True
+        self.was_active = self.active
+
         if self.active:
             # Clignotement
             self.blink_timer += 1
@@ -115,59 +128,31 @@ class Bonus:
                 self.visible = not self.visible
                 
             if self.visible:
-                pygame.draw.circle(screen, self.color, self.rect.center, self.radius)
-                pygame.draw.circle(screen, WHITE, self.rect.center, self.radius + 2, 2)
+                rect = self.rect
+                center = (round(rect.centerx * scale), round(rect.centery * scale))
+                radius = round(self.radius * scale)
+                pygame.draw.circle(screen, self.color, center, radius)
+                rects.append(pygame.draw.circle(screen, WHITE, center, radius + 2, 2))
                 
                 # Afficher le type et temps restant
-                remaining_time = max(0, (self.duration - (pygame.time.get_ticks() - self.spawn_time))) // 1000
-                font = pygame.font.SysFont("Arial", BONUS_FONT_SIZE)
-                text = font.render(f"{self.type['name']} {remaining_time}s", True, BLACK)
-                screen.blit(text, (self.rect.centerx - text.get_width()//2,
-                self.rect.centery - text.get_height()//2))
+                remaining_time = max(0, (self.duration - (now - self.spawn_time))) // 1000
+                font = get_font("Arial", round(BONUS_FONT_SIZE * scale))
+                text = render_text(font, f"{self.type['name']} {remaining_time}s", BLACK)
+                rects.append(screen.blit(text, (center[0] - text.get_width()//2,
+                center[1] - text.get_height()//2)))
 
         # Afficher le temps restant pour les bonus actifs
         if self.collected_time > 0:
-            remaining_time = max(0, self.duration - (pygame.time.get_ticks() - self.collected_time))
+            remaining_time = max(0, self.duration - (now - self.collected_time))
             if remaining_time > 0:
                 time_text = f"BONUS: {self.type['name']} ({remaining_time//1000}s)"
-                font = pygame.font.SysFont("Arial", BONUS_INFO_FONT_SIZE)
-                text_surface = font.render(time_text, True, self.color)
-                y_pos = (
+                font = get_font("Arial", round(BONUS_INFO_FONT_SIZE * scale))
+                text_surface = render_text(font, time_text, self.color)
+                y_pos = round((
                     BONUS_INFO_Y_PLAYER1
-                    if self.type['effect'].endswith('a')
+                    if self.state.collected_by == "a"
                     else BONUS_INFO_Y_PLAYER2
-                    )
-                screen.blit(text_surface, (screen.get_width()//2 - text_surface.get_width()//2, y_pos))
-
-
-    def check_collision(self, rect, player):
-        """
-        Vérifie la collision entre un rectangle et un joueur. Si actif et collision détectée, 
-        désactive l'objet, enregistre le temps de collecte et retourne l'effet appliqué au joueur.
-        
-        Args:
-            rect (pygame.Rect): Rectangle à tester pour la collision.
-            player (int): Identifiant ou attribut du joueur.
-
-        Returns:
-            Optional[int]: Effet appliqué au joueur ou None si pas de collision.
-        """
-        if self.active and self.rect.colliderect(rect):
-            self.active = False
-            self.collected_time = pygame.time.get_ticks()
-            return self.type['effect'] + player
-        return None
-
-
-    def is_active(self):
-        """
-        Détermine si le bonus est actif.
-
-        Returns:
-            True si le temps écoulé depuis la collecte est inférieur à la durée,
-            sinon False.
-        """
-        return (
-            pygame.time.get_ticks() - self.collected_time < self.duration
-            if self.collected_time > 0
-            else False)
+                    ) * scale)
+                rects.append(screen.blit(text_surface,
+                                         (screen.get_width()//2 - text_surface.get_width()//2, y_pos)))
+        return rects
@@ -0,0 +1,593 @@
+"""
+Diffusion d'une partie en direct à de nombreux spectateurs (UDP, asyncio).
+
+À chaque frame, l'état de la partie est quantifié (positions au quart de pixel, vitesses
+au seizième sur 32 bits, indicateurs et effets actifs regroupés en champs de bits) puis envoyé
+à chaque spectateur sous forme de delta : seuls les champs qui diffèrent de la dernière frame
+confirmée par ce spectateur sont transmis, avec un masque de 32 bits. Un spectateur sans
+frame confirmée (ou trop en retard) reçoit une frame complète. Les spectateurs confirmant
+la même frame partagent le même paquet, encodé une seule fois.
+
+Contrôle de flux par spectateur : le serveur estime le temps d'aller-retour (RTT) de chaque
+spectateur à partir de ses confirmations, et en déduit le nombre de frames qui peuvent être
+en vol sans perte : ACK_INTERVAL + 2 RTT (en frames). Un spectateur qui dépasse cette fenêtre
+ne reçoit plus qu'une frame sur SLOW_INTERVAL, et il est retiré après SUBSCRIBER_TIMEOUT_S
+secondes sans confirmation. Quand le tampon d'envoi du système est plein (pause_writing),
+les frames sont sautées pour tout le monde.
+
+La source des frames est libre : BroadcastServer.publish(state) accepte n'importe quelle
+partie (MatchState), à chaque pas. La commande serve diffuse des parties automatiques ;
+le serveur de jeu en réseau peut diffuser une de ses parties (network.py server
+--broadcast-port).
+
+Messages (little-endian, premier octet = type) :
+- SUBSCRIBE / UNSUBSCRIBE (spectateur → serveur).
+- INFO (serveur → spectateur) : dimensions du terrain, des paddles et de la balle.
+- FRAME (serveur → spectateur) : numéro de frame, frame de référence (0 = complète),
+  masque des champs présents puis les champs.
+- ACK (spectateur → serveur) : dernière frame reçue, au plus toutes les ACK_INTERVAL frames.
+
+Classes :
+- BroadcastServer : Serveur de diffusion.
+- Spectator : Spectateur (décodage des deltas et confirmations).
+
+Exemple :
+    python broadcast.py serve --port 9998
+    python broadcast.py watch 127.0.0.1 9998
+    python broadcast.py loadgen --subscribers 2000 --seconds 10 --loss 0.01
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import struct
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from constants import WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, FRAME_MS
+import simulation
+from network import NetworkConditions, pack_flags, unpack_flags
+
+SUBSCRIBE, UNSUBSCRIBE, INFO, FRAME, ACK = range(1, 6)
+
+INFO_PACKET = struct.Struct("<BHHHH")
+FRAME_HEADER = struct.Struct("<BIII")
+ACK_PACKET = struct.Struct("<BI")
+
+POSITION_SCALE = 4   # Positions au quart de pixel
+SPEED_SCALE = 16     # Vitesses au seizième de pixel par frame
+# La balle accélère sans limite pendant un long échange : les vitesses quantifiées sont
+# bornées à ce que leur champ "i" peut contenir
+SPEED_LIMIT = 2**31 - 1
+
+# Champs d'une frame, dans l'ordre des bits du masque
+FIELDS = (
+    ("time", "I"), ("ball_x", "h"), ("ball_y", "h"), ("speed_x", "i"), ("speed_y", "i"),
+    ("paddle_a_y", "h"), ("paddle_b_y", "h"), ("paddle_a_height", "H"), ("paddle_b_height", "H"),
+    ("score_a", "B"), ("score_b", "B"), ("flags", "B"), ("effects", "B"),
+    ("bonus_type", "b"), ("bonus_x", "h"), ("bonus_y", "h"),
+    ("bonus_spawn_time", "I"), ("bonus_collected_time", "I"),
+)
+FULL_MASK = (1 << len(FIELDS)) - 1
+
+# Frames gardées comme références possibles des deltas, avec leur instant de publication
+# pour mesurer le RTT : au-delà de SUBSCRIBER_TIMEOUT_S, le spectateur est retiré
+HISTORY_SIZE = 300
+ACK_INTERVAL = 4           # Le spectateur confirme au plus une frame sur 4
+INITIAL_RTT_S = 0.1        # Temps d'aller-retour supposé avant la première confirmation
+RTT_GAIN = 1 / 8           # Poids d'une nouvelle mesure dans le RTT lissé
+SLOW_INTERVAL = 8          # Un spectateur ralenti reçoit une frame sur 8
+SUBSCRIBER_TIMEOUT_S = 5.0   # 300 frames
+NEXT_MATCH_DELAY_S = 2.0   # Pause entre deux parties diffusées
+
+_formats = {}
+
+
+def frame_format(mask):
+    """Retourne (en cache) le struct des champs présents dans le masque."""
+    fmt = _formats.get(mask)
+    if fmt is None:
+        fmt = _formats[mask] = struct.Struct(
+            "<" + "".join(code for i, (_, code) in enumerate(FIELDS) if mask >> i & 1))
+    return fmt
+
+
+def quantize_speed(speed):
+    """Quantifie une vitesse, bornée à ±SPEED_LIMIT."""
+    return round(max(-SPEED_LIMIT, min(SPEED_LIMIT, speed * SPEED_SCALE)))
+
+
+def in_flight_window(rtt):
+    """
+    Nombre de frames non confirmées acceptées pour un spectateur : les frames envoyées
+    entre deux confirmations, plus celles publiées pendant deux temps d'aller-retour.
+    """
+    return ACK_INTERVAL + math.ceil(2 * rtt / (FRAME_MS / 1000)) + 1
+
+
+def quantize(state):
+    """
+    Quantifie l'état de la partie.
+
+    Returns:
+        tuple: Valeurs entières des champs de FIELDS.
+    """
+    ball, paddle_a, paddle_b, bonus = state.ball, state.paddle_a, state.paddle_b, state.bonus
+    flags, effects = pack_flags(state)
+    return (
+        int(state.time),
+        round(ball.x * POSITION_SCALE), round(ball.y * POSITION_SCALE),
+        quantize_speed(ball.speed_x), quantize_speed(ball.speed_y),
+        round(paddle_a.y * POSITION_SCALE), round(paddle_b.y * POSITION_SCALE),
+        int(paddle_a.height), int(paddle_b.height), state.score_a, state.score_b,
+        flags, effects, -1 if bonus.type is None else bonus.type, int(bonus.x), int(bonus.y),
+        int(bonus.spawn_time), int(bonus.collected_time),
+    )
+
+
+def dequantize(state, values):
+    """Recopie les valeurs d'une frame dans une partie locale."""
+    (game_time, ball_x, ball_y, speed_x, speed_y, paddle_a_y, paddle_b_y,
+     paddle_a_height, paddle_b_height, score_a, score_b, flags, effects,
+     bonus_type, bonus_x, bonus_y, spawn_time, collected_time) = values
+    state.time = game_time
+    ball = state.ball
+    ball.x, ball.y = ball_x / POSITION_SCALE, ball_y / POSITION_SCALE
+    ball.speed_x, ball.speed_y = speed_x / SPEED_SCALE, speed_y / SPEED_SCALE
+    state.paddle_a.y, state.paddle_b.y = paddle_a_y / POSITION_SCALE, paddle_b_y / POSITION_SCALE
+    state.score_a, state.score_b = score_a, score_b
+    unpack_flags(state, flags, effects)
+    simulation.apply_effects(state)
+    state.paddle_a.height, state.paddle_b.height = paddle_a_height, paddle_b_height
+    bonus = state.bonus
+    bonus.type = None if bonus_type < 0 else bonus_type
+    bonus.x, bonus.y = bonus_x, bonus_y
+    bonus.spawn_time, bonus.collected_time = spawn_time, collected_time
+
+
+def encode_frame(seq, values, base_seq=0, base_values=None):
+    """
+    Encode une frame, complète ou en delta par rapport à une frame de référence.
+
+    Args:
+        seq (int): Numéro de la frame.
+        values (tuple): Valeurs quantifiées de la frame.
+        base_seq (int): Numéro de la frame de référence (0 : frame complète).
+        base_values (tuple): Valeurs de la frame de référence.
+
+    Returns:
+        bytes: Paquet FRAME.
+    """
+    if base_values is None:
+        mask, fields = FULL_MASK, values
+    else:
+        mask, fields = 0, []
+        for i, (value, base) in enumerate(zip(values, base_values)):
+            if value != base:
+                mask |= 1 << i
+                fields.append(value)
+    return FRAME_HEADER.pack(FRAME, seq, base_seq, mask) + frame_format(mask).pack(*fields)
+
+
+def decode_frame(data, base_values=None):
+    """
+    Décode les champs d'un paquet FRAME.
+
+    Args:
+        data (bytes): Paquet FRAME.
+        base_values (tuple): Valeurs de la frame de référence (pour un delta).
+
+    Returns:
+        tuple: Valeurs complètes de la frame.
+    """
+    _, _, base_seq, mask = FRAME_HEADER.unpack_from(data)
+    fields = iter(frame_format(mask).unpack_from(data, FRAME_HEADER.size))
+    if not base_seq:
+        return tuple(fields)
+    return tuple(next(fields) if mask >> i & 1 else base
+                 for i, base in enumerate(base_values))
+
+
+class Subscriber:
+    """
+    Spectateur connu du serveur.
+
+    Attributs :
+        addr (tuple) : Adresse UDP.
+        acked (int) : Dernière frame confirmée (0 : aucune).
+        since (int) : Dernière frame publiée au moment de l'abonnement.
+        last_sent (int) : Dernière frame envoyée.
+        last_ack_time (float) : Instant de la dernière confirmation (ou de l'abonnement).
+        rtt (float) : Temps d'aller-retour lissé, en secondes (None avant la première mesure).
+        window (int) : Frames non confirmées acceptées avant de le ralentir (in_flight_window).
+        bytes_sent, frames_sent, skipped (int) : Compteurs.
+    """
+    __slots__ = ("addr", "acked", "since", "last_sent", "last_ack_time", "rtt", "window",
+                 "bytes_sent", "frames_sent", "skipped")
+
+    def __init__(self, addr, since, now):
+        self.addr = addr
+        self.acked = 0
+        self.since = since
+        self.last_sent = 0
+        self.last_ack_time = now
+        self.rtt = None
+        self.window = in_flight_window(INITIAL_RTT_S)
+        self.bytes_sent = 0
+        self.frames_sent = 0
+        self.skipped = 0
+
+    def acknowledge(self, seq, sent_at, now):
+        """
+        Enregistre la confirmation de la frame seq, publiée à l'instant sent_at (None si
+        elle n'est plus dans l'historique), et met à jour le RTT et la fenêtre.
+        """
+        self.acked = seq
+        self.last_ack_time = now
+        if sent_at is not None:
+            sample = now - sent_at
+            self.rtt = sample if self.rtt is None else self.rtt + (sample - self.rtt) * RTT_GAIN
+            self.window = in_flight_window(self.rtt)
+
+
+class BroadcastServer(asyncio.DatagramProtocol):
+    """
+    Serveur de diffusion : publish(state) encode la frame et l'envoie à tous les spectateurs.
+
+    Attributs :
+        subscribers (dict) : Adresse → Subscriber.
+        seq (int) : Numéro de la dernière frame publiée.
+        history (dict) : Numéro → valeurs des HISTORY_SIZE dernières frames.
+        published (list) : Instants de publication des mêmes frames (frame seq à l'index
+            seq % HISTORY_SIZE).
+        paused (bool) : Tampon d'envoi du système plein.
+        bytes_sent, packets_sent, full_frames, skipped (int) : Compteurs globaux.
+    """
+    def __init__(self, width=WIDTH, height=HEIGHT, paddle_height=PADDLE_HEIGHT,
+                 ball_size=BALL_SIZE, conditions=None):
+        self.transport = None
+        self.info = INFO_PACKET.pack(INFO, width, height, paddle_height, ball_size)
+        self.conditions = conditions or NetworkConditions()
+        self.subscribers = {}
+        self.seq = 0
+        self.history = {}
+        self.published = [0.0] * HISTORY_SIZE
+        self.order = deque()
+        self.last_publish = None
+        self.paused = False
+        self.bytes_sent = 0
+        self.packets_sent = 0
+        self.full_frames = 0
+        self.skipped = 0
+        self.dropped_subscribers = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def pause_writing(self):
+        self.paused = True
+
+    def resume_writing(self):
+        self.paused = False
+
+    def datagram_received(self, data, addr):
+        if not data:
+            return
+        kind = data[0]
+        if kind == ACK and len(data) == ACK_PACKET.size:
+            subscriber = self.subscribers.get(addr)
+            if subscriber is not None:
+                seq = ACK_PACKET.unpack(data)[1]
+                if subscriber.acked < seq <= self.seq:
+                    sent_at = (self.published[seq % HISTORY_SIZE]
+                               if self.seq - seq < HISTORY_SIZE else None)
+                    subscriber.acknowledge(seq, sent_at, time.monotonic())
+        elif kind == SUBSCRIBE:
+            if addr not in self.subscribers:
+                self.subscribers[addr] = Subscriber(addr, self.seq, time.monotonic())
+            self.conditions.sendto(self.transport, self.info, addr)
+        elif kind == UNSUBSCRIBE:
+            self.subscribers.pop(addr, None)
+
+    def publish(self, state):
+        """
+        Quantifie l'état de la partie et l'envoie à chaque spectateur.
+
+        Args:
+            state (MatchState): Partie diffusée, quelle que soit sa source.
+        """
+        now = time.monotonic()
+        if self.last_publish is not None and now - self.last_publish > SUBSCRIBER_TIMEOUT_S:
+            # Diffusion interrompue (pas de partie en cours) : les spectateurs n'avaient
+            # rien à confirmer, leur délai repart de zéro
+            for subscriber in self.subscribers.values():
+                subscriber.last_ack_time = now
+        self.last_publish = now
+        self.seq += 1
+        seq = self.seq
+        values = quantize(state)
+        history = self.history
+        history[seq] = values
+        self.published[seq % HISTORY_SIZE] = now
+        self.order.append(seq)
+        if len(self.order) > HISTORY_SIZE:
+            del history[self.order.popleft()]
+
+        packets = {}
+        send = self.conditions.sendto
+        for addr, subscriber in list(self.subscribers.items()):
+            if now - subscriber.last_ack_time > SUBSCRIBER_TIMEOUT_S:
+                del self.subscribers[addr]
+                self.dropped_subscribers += 1
+                continue
+            slow = seq - max(subscriber.acked, subscriber.since) > subscriber.window
+            if self.paused or (slow and seq - subscriber.last_sent < SLOW_INTERVAL):
+                subscriber.skipped += 1
+                self.skipped += 1
+                continue
+            base = subscriber.acked if subscriber.acked in history else 0
+            packet = packets.get(base)
+            if packet is None:
+                packet = packets[base] = encode_frame(seq, values, base, history.get(base))
+            if not base:
+                self.full_frames += 1
+            send(self.transport, packet, addr)
+            subscriber.last_sent = seq
+            subscriber.bytes_sent += len(packet)
+            subscriber.frames_sent += 1
+            self.bytes_sent += len(packet)
+            self.packets_sent += 1
+
+
+class Spectator(asyncio.DatagramProtocol):
+    """
+    Spectateur : reconstruit les frames à partir des deltas et confirme régulièrement
+    la dernière reçue.
+
+    Attributs :
+        state (MatchState) : Copie locale de la partie (None avant INFO).
+        decode (bool) : Recopie chaque frame dans state (inutile pour le générateur de charge).
+        frames (dict) : Numéro → valeurs des frames reçues récentes.
+        latest (int) : Dernière frame reçue.
+        received, missing_base, bytes_received (int) : Compteurs.
+    """
+    def __init__(self, decode=True):
+        self.transport = None
+        self.decode = decode
+        self.state = None
+        self.frames = {}
+        self.order = deque()
+        self.latest = 0
+        self.last_ack = 0
+        self.received = 0
+        self.missing_base = 0
+        self.bytes_received = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.sendto(bytes([SUBSCRIBE]))
+
+    def datagram_received(self, data, addr):
+        if not data:
+            return
+        if data[0] == INFO and len(data) == INFO_PACKET.size:
+            if self.state is None:
+                _, width, height, paddle_height, ball_size = INFO_PACKET.unpack(data)
+                self.state = simulation.new_match(width, height, paddle_height, ball_size, 0)
+            return
+        if data[0] != FRAME or len(data) < FRAME_HEADER.size:
+            return
+        self.bytes_received += len(data)
+        _, seq, base_seq, _ = FRAME_HEADER.unpack_from(data)
+        if seq <= self.latest:
+            return  # Frame en retard ou dupliquée
+        base_values = None
+        if base_seq:
+            base_values = self.frames.get(base_seq)
+            if base_values is None:
+                self.missing_base += 1
+                return
+        values = decode_frame(data, base_values)
+        self.frames[seq] = values
+        self.order.append(seq)
+        if len(self.order) > HISTORY_SIZE:
+            del self.frames[self.order.popleft()]
+        self.latest = seq
+        self.received += 1
+        if self.decode and self.state is not None:
+            dequantize(self.state, values)
+        if seq - self.last_ack >= ACK_INTERVAL:
+            self.last_ack = seq
+            self.transport.sendto(ACK_PACKET.pack(ACK, seq))
+
+    def unsubscribe(self):
+        """Se désabonne de la diffusion."""
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.sendto(bytes([UNSUBSCRIBE]))
+
+
+async def broadcast_matches(server, duration=None, seed=0):
+    """
+    Joue des parties entre deux contrôleurs suiveurs et publie chaque frame, sans fin
+    si duration est None (une nouvelle partie commence NEXT_MATCH_DELAY_S après la fin).
+    """
+    from controllers import FollowController
+    loop = asyncio.get_running_loop()
+    next_frame = loop.time()
+    end = None if duration is None else next_frame + duration
+    rng = random.Random(seed)
+    state = None
+    finished_at = None
+    while end is None or loop.time() < end:
+        if state is None or (finished_at is not None and loop.time() - finished_at > NEXT_MATCH_DELAY_S):
+            state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, rng.randrange(2**32))
+            controller_a = FollowController("a", random.Random(rng.getrandbits(32)))
+            controller_b = FollowController("b", random.Random(rng.getrandbits(32)))
+            finished_at = None
+        simulation.step(state, (controller_a.decide(state), controller_b.decide(state)))
+        if not state.running and finished_at is None:
+            finished_at = loop.time()
+        server.publish(state)
+        next_frame = max(next_frame + FRAME_MS / 1000, loop.time())
+        await asyncio.sleep(next_frame - loop.time())
+
+
+async def run_server(host, port):
+    """Lance un serveur de diffusion d'une partie automatique."""
+    loop = asyncio.get_running_loop()
+    transport, server = await loop.create_datagram_endpoint(BroadcastServer, local_addr=(host, port))
+    print(f"Diffusion en direct sur {host}:{port}")
+    try:
+        await broadcast_matches(server)
+    finally:
+        transport.close()
+
+
+async def watch(host, port):
+    """Affiche une partie diffusée dans une fenêtre pygame."""
+    import pygame
+    from game import PongGame
+    from bonus import Bonus
+    loop = asyncio.get_running_loop()
+    transport, spectator = await loop.create_datagram_endpoint(Spectator, remote_addr=(host, port))
+    game = PongGame(PADDLE_HEIGHT, WIDTH, HEIGHT)
+    game.recorder = None
+    game.controllers = {}
+    pygame.display.set_caption("Pong - spectateur")
+    next_frame = loop.time()
+    try:
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+            if spectator.state is not None:
+                if game.state is not spectator.state:
+                    game.state = spectator.state
+                    game.bonus = Bonus(spectator.state.bonus)
+                game.sync_rects()
+                game.draw()
+            elif loop.time() - next_frame > 1:
+                transport.sendto(bytes([SUBSCRIBE]))
+            next_frame = max(next_frame + FRAME_MS / 1000, loop.time())
+            await asyncio.sleep(next_frame - loop.time())
+    finally:
+        spectator.unsubscribe()
+        transport.close()
+
+
+async def run_spectators(host, port, count, idle_timeout=1.0):
+    """
+    Ouvre `count` spectateurs sans affichage, jusqu'à ce qu'aucune frame ne soit
+    arrivée depuis `idle_timeout` secondes (fin de la diffusion).
+
+    Returns:
+        dict: Statistiques cumulées des spectateurs.
+    """
+    loop = asyncio.get_running_loop()
+    endpoints = [await loop.create_datagram_endpoint(lambda: Spectator(decode=False),
+                                                     remote_addr=(host, port))
+                 for _ in range(count)]
+    spectators = [spectator for _, spectator in endpoints]
+    received = -1
+    while received != sum(spectator.received for spectator in spectators):
+        received = sum(spectator.received for spectator in spectators)
+        await asyncio.sleep(idle_timeout)
+    for transport, spectator in endpoints:
+        spectator.unsubscribe()
+        transport.close()
+    return {
+        "spectators": count,
+        "received": received,
+        "missing_base": sum(spectator.missing_base for spectator in spectators),
+        "bytes_received": sum(spectator.bytes_received for spectator in spectators),
+    }
+
+
+def spectator_process(host, port, count):
+    """Lance run_spectators dans sa propre boucle asyncio (pour un processus séparé)."""
+    return asyncio.run(run_spectators(host, port, count))
+
+
+async def load_test(subscribers, duration, loss=0.0, workers=None):
+    """
+    Générateur de charge : un serveur diffusant une partie automatique et `subscribers`
+    spectateurs répartis sur des processus séparés. La mesure commence quand tous les
+    spectateurs sont abonnés. Affiche les octets envoyés par spectateur et par seconde
+    et le temps CPU du serveur par spectateur.
+    """
+    loop = asyncio.get_running_loop()
+    transport, server = await loop.create_datagram_endpoint(
+        lambda: BroadcastServer(conditions=NetworkConditions(loss=loss, seed=0)),
+        local_addr=("127.0.0.1", 0))
+    host, port = transport.get_extra_info("sockname")[:2]
+    workers = workers or min(4, os.cpu_count() or 1)
+    counts = [subscribers // workers + (i < subscribers % workers) for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [loop.run_in_executor(executor, spectator_process, host, port, count)
+                   for count in counts if count]
+        source = asyncio.ensure_future(broadcast_matches(server))
+        while len(server.subscribers) < subscribers:
+            await asyncio.sleep(0.1)
+        await asyncio.sleep(1.0)  # Premières frames complètes envoyées
+        bytes_start, packets_start, frames_start = server.bytes_sent, server.packets_sent, server.seq
+        skipped_start = server.skipped
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        await asyncio.sleep(duration)
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+        sent = server.bytes_sent - bytes_start
+        packets = server.packets_sent - packets_start
+        frames = server.seq - frames_start
+        skipped = server.skipped - skipped_start
+        active = len(server.subscribers)
+        rtts = [subscriber.rtt for subscriber in server.subscribers.values() if subscriber.rtt is not None]
+        rtt = sum(rtts) / max(1, len(rtts))
+        window = sum(subscriber.window for subscriber in server.subscribers.values()) / max(1, active)
+        source.cancel()
+        results = await asyncio.gather(*futures)
+    transport.close()
+
+    total = {key: sum(result[key] for result in results) for key in results[0]}
+    full_size = FRAME_HEADER.size + frame_format(FULL_MASK).size
+    print(f"{total['spectators']} spectateurs ({active} actifs), {frames} frames en {wall:.1f} s")
+    print(f"Envoyé : {sent / max(1, active) / wall:.0f} octets par spectateur et par seconde, "
+          f"{sent / max(1, packets):.1f} octets par frame en moyenne (frame complète : {full_size})")
+    print(f"CPU serveur : {cpu / wall:.1%}, {cpu / wall / max(1, active) * 1e6:.1f} µs par seconde "
+          f"et par spectateur")
+    print(f"Frames sautées (contrôle de flux) : {skipped / max(1, skipped + packets):.1%}, "
+          f"spectateurs retirés : {server.dropped_subscribers}")
+    print(f"RTT moyen : {rtt * 1000:.0f} ms, fenêtre moyenne : {window:.0f} frames en vol")
+    print(f"Côté spectateurs : {total['received']} frames reçues, {total['missing_base']} sans référence")
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande (serve, watch ou loadgen)."""
+    parser = argparse.ArgumentParser(description="Diffusion de parties Pong aux spectateurs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="Diffuse une partie automatique")
+    serve_parser.add_argument("--host", default="0.0.0.0")
+    serve_parser.add_argument("--port", type=int, default=9998)
+    watch_parser = commands.add_parser("watch", help="Regarde une partie diffusée")
+    watch_parser.add_argument("host")
+    watch_parser.add_argument("port", type=int)
+    load_parser = commands.add_parser("loadgen", help="Mesure la diffusion à de nombreux spectateurs")
+    load_parser.add_argument("--subscribers", type=int, default=1000)
+    load_parser.add_argument("--seconds", type=float, default=10.0)
+    load_parser.add_argument("--loss", type=float, default=0.0, help="Taux de perte (0 à 1)")
+    load_parser.add_argument("--workers", type=int, default=None, help="Processus des spectateurs")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        asyncio.run(run_server(args.host, args.port))
+    elif args.command == "watch":
+        asyncio.run(watch(args.host, args.port))
+    else:
+        asyncio.run(load_test(args.subscribers, args.seconds, args.loss, args.workers))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""
+Module capture.py
+Capture vidéo des parties et captures d'écran, écrites sur disque par un thread.
+
+La boucle de rendu ne fait que copier l'image dans un anneau de surfaces allouées une
+fois pour toutes (un blit, sans compression ni accès disque). Un thread d'écriture
+encode ces images, en séquence de PNG ou en flux d'images brutes, puis rend leur
+surface à l'anneau. Quand il prend du retard et que l'anneau est plein, l'image est
+abandonnée et comptée au lieu de bloquer la frame. Les captures d'écran ont leur propre
+surface, en plus de l'anneau : une capture vidéo en retard ne les fait pas abandonner.
+
+Les PNG sont encodés ici avec zlib, qui libère le GIL pendant la compression :
+pygame.image.save le garde pendant tout l'encodage et bloquerait la boucle de rendu.
+
+Chaque capture écrit dans son propre dossier CAPTURE_DIR/<date> (suffixé -2, -3...
+si une autre capture l'a déjà créé dans la même seconde) :
+- "png" : frame-000001.png, une image par frame ;
+- "raw" : video-<largeur>x<hauteur>.rgb, images RGB 8 bits bout à bout
+  (par exemple : ffmpeg -f rawvideo -pix_fmt rgb24 -s 800x400 -r 60 -i fichier.rgb) ;
+- captures d'écran : screenshot-1.png, quel que soit le mode.
+
+Classes:
+    - FrameCapture: Anneau d'images et thread d'écriture.
+Fonctions:
+    - encode_png(rows, width, height): Encode des lignes RGB en PNG.
+"""
+
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+import pygame
+from constants import CAPTURE_RING_SIZE, CAPTURE_PNG_LEVEL, CAPTURE_NICE
+
+CAPTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "captures")
+CAPTURE_MODES = ("png", "raw")
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Masques d'une surface dont les octets sont dans l'ordre R, G, B (comme en PNG)
+RGB_MASKS = (0x0000FF, 0x00FF00, 0xFF0000, 0) if pygame.get_sdl_byteorder() == pygame.LIL_ENDIAN \
+    else (0xFF0000, 0x00FF00, 0x0000FF, 0)
+
+
+def png_chunk(kind, data):
+    """Retourne un bloc PNG (taille, type, données, CRC)."""
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(rows, width, height):
+    """
+    Encode une image en PNG (RGB 8 bits, sans filtre).
+
+    Args:
+        rows (list): Lignes de pixels RGB (width * 3 octets chacune), de haut en bas.
+        width, height (int): Dimensions de l'image.
+
+    Returns:
+        bytes: Le fichier PNG.
+    """
+    data = b"\x00" + b"\x00".join(rows)  # Octet de filtre (aucun) devant chaque ligne
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (PNG_SIGNATURE + png_chunk(b"IHDR", header)
+            + png_chunk(b"IDAT", zlib.compress(data, CAPTURE_PNG_LEVEL)) + png_chunk(b"IEND", b""))
+
+
+class FrameCapture:
+    """
+    Capture des images d'une partie, écrites par un thread.
+
+    Attributs :
+        size (tuple) : Dimensions des images.
+        mode (str) : "png", "raw" ou None (captures d'écran seulement).
+        path (str) : Dossier de la capture, créé à la première image écrite (None avant).
+        ring (list) : Surfaces de l'anneau (CAPTURE_RING_SIZE, allouées à la création),
+            plus une dernière réservée aux captures d'écran.
+        frames, screenshots (int) : Images vidéo et captures d'écran demandées.
+        captured (int) : Images copiées dans l'anneau.
+        written (int) : Images écrites sur disque.
+        dropped (int) : Images abandonnées (anneau plein : l'écriture a pris du retard).
+        errors (int) : Images perdues sur une erreur d'écriture (disque plein...).
+
+    Méthodes :
+        capture(surface) : Ajoute une image à la capture vidéo.
+        screenshot(surface) : Enregistre une capture d'écran.
+        close() : Attend l'écriture des images en attente et arrête le thread.
+        stats() : Compteurs de la capture.
+    """
+    def __init__(self, size, mode="png", directory=CAPTURE_DIR, capacity=CAPTURE_RING_SIZE):
+        if mode not in CAPTURE_MODES + (None,):
+            raise ValueError(f"Mode de capture inconnu : {mode}")
+        self.size = size
+        self.mode = mode
+        self.directory = directory
+        self.name = time.strftime("%Y%m%d-%H%M%S")
+        self.path = None
+        self.ring = [pygame.Surface(size, 0, 24, RGB_MASKS) for _ in range(capacity + 1)]
+        self.free = queue.SimpleQueue()
+        for slot in range(capacity):
+            self.free.put(slot)
+        self.screenshot_slot = capacity
+        self.screenshot_free = queue.SimpleQueue()
+        self.screenshot_free.put(self.screenshot_slot)
+        self.pending = queue.SimpleQueue()
+        self.frames = self.screenshots = 0
+        self.captured = self.written = self.dropped = self.errors = 0
+        self.stream = None
+        self.worker = threading.Thread(target=self.write_frames, name="capture", daemon=True)
+        self.worker.start()
+
+
+    def capture(self, surface):
+        """
+        Copie l'image dans l'anneau pour la capture vidéo (rien sans mode vidéo).
+
+        Returns:
+            bool: False si l'image a été abandonnée faute de place dans l'anneau.
+        """
+        if self.mode is None:
+            return True
+        self.frames += 1
+        return self.push(surface, self.mode, self.frames, self.free)
+
+
+    def screenshot(self, surface):
+        """
+        Copie l'image dans la surface réservée aux captures d'écran (ou, si la précédente
+        n'est pas encore écrite, dans l'anneau) pour l'enregistrer en PNG.
+        """
+        self.screenshots += 1
+        free = self.screenshot_free if not self.screenshot_free.empty() else self.free
+        return self.push(surface, "screenshot", self.screenshots, free)
+
+
+    def push(self, surface, kind, index, free):
+        """Copie l'image dans une surface libre (prise dans `free`) et la confie au thread."""
+        try:
+            slot = free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+        self.ring[slot].blit(surface, (0, 0))
+        self.captured += 1
+        self.pending.put((slot, kind, index))
+        return True
+
+
+    def write_frames(self):
+        """
+        Thread d'écriture : encode et écrit les images confiées, jusqu'à close(). Sous Linux,
+        sa priorité est abaissée (nice par thread) pour qu'il ne prenne le processeur à la
+        boucle de rendu que quand elle attend.
+        """
+        if sys.platform.startswith("linux"):
+            try:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), CAPTURE_NICE)
+            except OSError:
+                pass
+        while True:
+            item = self.pending.get()
+            if item is None:
+                break
+            slot, kind, index = item
+            try:
+                self.write(self.ring[slot], kind, index)
+                self.written += 1
+            except OSError:
+                self.errors += 1
+            (self.screenshot_free if slot == self.screenshot_slot else self.free).put(slot)
+        if self.stream is not None:
+            self.stream.close()
+
+
+    def write(self, surface, kind, index):
+        """Écrit une image de l'anneau selon son type et son numéro (thread d'écriture)."""
+        width, height = self.size
+        pitch = surface.get_pitch()
+        # Vue sur les pixels (la surface reste verrouillée tant qu'elle existe)
+        view = memoryview(surface.get_buffer())
+        rows = [view[y * pitch:y * pitch + width * 3] for y in range(height)]
+        directory = self.make_directory()
+        if kind == "raw":
+            if self.stream is None:
+                self.stream = open(os.path.join(directory, f"video-{width}x{height}.rgb"), "wb")
+            self.stream.writelines(rows)
+            return
+        data = encode_png(rows, width, height)
+        del view, rows
+
+        if kind == "png":
+            path = os.path.join(directory, f"frame-{index:06d}.png")
+        else:
+            path = os.path.join(directory, f"screenshot-{index}.png")
+        with open(path, "wb") as file:
+            file.write(data)
+
+
+    def make_directory(self):
+        """
+        Crée le dossier de la capture au premier appel (thread d'écriture). os.mkdir échoue
+        si le dossier existe déjà : deux captures lancées dans la même seconde, même par
+        deux processus, prennent chacune un nom différent.
+
+        Returns:
+            str: Chemin du dossier.
+        """
+        if self.path is None:
+            os.makedirs(self.directory, exist_ok=True)
+            suffix = 1
+            while True:
+                name = self.name if suffix == 1 else f"{self.name}-{suffix}"
+                try:
+                    os.mkdir(os.path.join(self.directory, name))
+                    break
+                except FileExistsError:
+                    suffix += 1
+            self.path = os.path.join(self.directory, name)
+        return self.path
+
+
+    def close(self):
+        """
+        Attend l'écriture des images en attente (au plus CAPTURE_RING_SIZE + 1) et arrête le thread.
+
+        Returns:
+            dict: Compteurs de la capture (voir stats).
+        """
+        if self.worker.is_alive():
+            self.pending.put(None)
+            self.worker.join()
+        return self.stats()
+
+
+    def stats(self):
+        """
+        Returns:
+            dict: Images copiées, écrites, abandonnées et perdues, et captures d'écran demandées.
+        """
+        return {
+            "captured": self.captured,
+            "written": self.written,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "screenshots": self.screenshots,
+        }
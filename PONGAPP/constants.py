@@ -28,7 +28,9 @@ BALL_SPEED_INIT_X = 5
 BALL_SPEED_INIT_Y = 5
 PADDLE_WIDTH, PADDLE_HEIGHT = 10, 100
 PADDLE_SPEED = 15
+CONTROLLER_SEED_SALT = 0x5EED0A11  # Graine de l'ordinateur : graine de la partie ^ sel (tirages indépendants)
 FONT_SIZE = 20 # Taille de la police par defaut
+TEXT_CACHE_SIZE = 256 # Nombre de textes rendus gardés en cache
 PADDEL_MARGIN_X = 30
 END_TEXT_OFFSET_Y = 50
 
@@ -48,6 +50,43 @@ SPEED_BOOST = 1.8
 SPEED_SLOW = 0.6
 SIZE_BOOST = 1.5
 
+# Sons : fichier, canaux réservés et intervalle minimal entre deux lectures, par catégorie
+# (les catégories sont les événements de simulation.step)
+SOUND_CATEGORIES = {
+    "paddle": {"file": "ping_a.wav", "channels": 2, "min_interval_ms": 30},
+    "wall": {"file": "pong_b.wav", "channels": 2, "min_interval_ms": 50},
+    "point": {"file": "ping_pong_c.wav", "channels": 1, "min_interval_ms": 0},
+}
+
+# Mode multiball : chaque balle qui touche le bonus se divise
+MULTIBALL_SPLIT = 3  # Balles obtenues à partir de chaque balle divisée
+MULTIBALL_SPREAD = 0.3  # Écart d'angle (radians) entre les balles issues d'une division
+MULTIBALL_MAX_BALLS = 4096  # Nombre maximal de balles sur le terrain
+
+# Effets des bonus, appliqués par simulation.start_effect :
+# - target : paddle modifié ("self" : celui du joueur qui collecte, "opponent" : l'adversaire) ;
+# - attribute, factor : attribut du paddle ("speed" ou "height") et facteur appliqué à sa valeur de base ;
+# - duration : durée de l'effet en millisecondes ;
+# - priority : sur un même attribut, l'effet actif de plus haute priorité l'emporte ;
+# - stacking : règle de cumul quand le joueur collecte l'effet :
+#   "replace" (met fin à ses autres effets "replace" et relance la durée de celui-ci)
+#   ou "extend" (ajoute la durée au temps restant, sans toucher aux autres effets).
+EFFECT_TYPES = {
+    "increase_speed": {"target": "self", "attribute": "speed", "factor": SPEED_BOOST,
+                       "duration": BONUS_DURATION, "priority": 0, "stacking": "replace"},
+    "increase_size": {"target": "self", "attribute": "height", "factor": SIZE_BOOST,
+                      "duration": BONUS_DURATION, "priority": 0, "stacking": "replace"},
+    "slow_opponent": {"target": "opponent", "attribute": "speed", "factor": SPEED_SLOW,
+                      "duration": BONUS_DURATION, "priority": 1, "stacking": "replace"},
+}
+
+# Types de bonus (nom affiché, couleur, effet appliqué au joueur qui le collecte)
+BONUS_TYPES = [
+    {"name": "FAST", "color": GREEN, "effect": "increase_speed"},
+    {"name": "BIG", "color": YELLOW, "effect": "increase_size"},
+    {"name": "SLOW", "color": RED, "effect": "slow_opponent"}
+]
+
 # Affichage menu
 POS_Y_TITRE = 80
 MENU_OPTIONS_START_Y = 200
@@ -65,3 +104,14 @@ CURRENT_PADDLE_SIZE_INDEX = 1  # Taille moyen par défaut
 PADDLE_HEIGHT = PADDLE_SIZES[CURRENT_PADDLE_SIZE_INDEX][1]
 
 FPS = 60
+FRAME_MS = 1000 / FPS  # Durée d'une frame de référence en millisecondes
+REPLAY_SEEK_MS = 5000  # Saut avant/arrière pendant la relecture d'un replay
+IDLE_REDRAW_MS = 1000  # Rafraîchissement des écrans d'attente sans entrée utilisateur
+MAX_FRAME_LAG_MS = 250  # Retard maximal rattrapé en une frame (au-delà, la partie ralentit)
+CAPTURE_RING_SIZE = 8  # Images en attente d'écriture avant d'en abandonner (capture.py)
+CAPTURE_PNG_LEVEL = 1  # Compression zlib des PNG capturés (1 : la plus rapide)
+CAPTURE_NICE = 10  # Priorité (nice) du thread d'écriture des captures, sous Linux
+PROFILER_CAPACITY = 600  # Frames gardées par le profileur (10 secondes)
+PROFILER_REFRESH_MS = 500  # Rafraîchissement de l'overlay du profileur
+PROFILER_FONT_SIZE = 16
+COLD_START_BUDGET_MS = 800  # Budget du lancement jusqu'à l'ouverture du premier menu
@@ -0,0 +1,201 @@
+"""
+Module controllers.py
+Contrôleurs de paddle pour faire jouer l'ordinateur sur une simulation.MatchState.
+
+Un contrôleur est créé pour un côté ("a" ou "b") avec un générateur aléatoire,
+et sa méthode decide(state, dt) retourne la direction du paddle pour un pas de dt
+millisecondes : -1 haut, 0 immobile, 1 bas.
+
+Classes:
+    - Controller: Classe de base (paddle immobile).
+    - RandomController: Direction aléatoire, changée régulièrement.
+    - FollowController: Suit la hauteur de la balle.
+    - PredictController: Anticipe le point d'arrivée de la balle (niveaux de difficulté).
+
+Fonctions:
+    - predict_crossing(y, speed_y, frames, bottom): Hauteur de la balle après rebonds.
+    - create_controller(name, side, rng): Crée un contrôleur à partir de son nom.
+"""
+
+import random
+from collections import deque
+from functools import partial
+from constants import FRAME_MS
+
+# Niveaux de l'ordinateur : retard de réaction (en millisecondes) et erreur de visée
+# (fraction de la hauteur du paddle)
+DIFFICULTIES = {
+    "facile": {"reaction_ms": 250, "error": 0.9},
+    "moyen": {"reaction_ms": 133, "error": 0.5},
+    "difficile": {"reaction_ms": 50, "error": 0.2},
+}
+
+
+class Controller:
+    """
+    Contrôleur de base : le paddle ne bouge pas.
+
+    Attributs :
+        side (str) : Côté contrôlé ("a" ou "b").
+        rng (random.Random) : Générateur aléatoire propre au contrôleur.
+    """
+    def __init__(self, side, rng=None):
+        self.side = side
+        self.rng = rng if rng is not None else random.Random()
+
+    def paddle(self, state):
+        """Retourne le paddle contrôlé dans l'état de la partie."""
+        return state.paddle_a if self.side == "a" else state.paddle_b
+
+    def decide(self, state, dt=FRAME_MS):
+        """Retourne la direction du paddle pour un pas de dt millisecondes."""
+        return 0
+
+
+class RandomController(Controller):
+    """
+    Choisit une direction aléatoire et la garde pendant quelques pas.
+    """
+    def __init__(self, side, rng=None, hold_steps=10):
+        super().__init__(side, rng)
+        self.hold_steps = hold_steps
+        self.steps_left = 0
+        self.direction = 0
+
+    def decide(self, state, dt=FRAME_MS):
+        if self.steps_left <= 0:
+            self.direction = self.rng.choice((-1, 0, 1))
+            self.steps_left = self.hold_steps
+        self.steps_left -= 1
+        return self.direction
+
+
+class FollowController(Controller):
+    """
+    Déplace le paddle vers la hauteur actuelle de la balle.
+    """
+    def __init__(self, side, rng=None, dead_zone=10):
+        super().__init__(side, rng)
+        self.dead_zone = dead_zone
+
+    def decide(self, state, dt=FRAME_MS):
+        paddle = self.paddle(state)
+        ball = state.ball
+        offset = (ball.y + ball.size / 2) - (paddle.y + paddle.height / 2)
+        if offset > self.dead_zone:
+            return 1
+        if offset < -self.dead_zone:
+            return -1
+        return 0
+
+
+def predict_crossing(y, speed_y, frames, bottom):
+    """
+    Hauteur de la balle après `frames` frames, rebonds sur les murs haut et bas compris.
+    Les rebonds sont des symétries : la trajectoire dépliée est une droite, repliée sur
+    une période de 2 × bottom. Le coût ne dépend ni de la vitesse ni du nombre de rebonds,
+    et la fonction accepte aussi des tableaux NumPy.
+
+    Args:
+        y, speed_y: Hauteur et vitesse verticale de la balle.
+        frames: Nombre de frames (de FRAME_MS) jusqu'au point voulu.
+        bottom: Hauteur maximale du haut de la balle (hauteur du terrain - 1 - taille).
+
+    Returns:
+        Hauteur du haut de la balle, entre 0 et bottom.
+    """
+    position = (y + speed_y * frames) % (2 * bottom)
+    return bottom - abs(bottom - position)
+
+
+class PredictController(Controller):
+    """
+    Place le paddle là où la balle va croiser sa face, calculé en une fois à partir
+    de sa position et de sa vitesse (predict_crossing). Balle qui s'éloigne : retour au centre.
+
+    Le retard et la zone morte suivent la durée du pas : le niveau reste le même quand
+    la simulation avance de plusieurs frames par pas.
+
+    Attributs :
+        reaction_ms (float) : Retard de réaction : la décision utilise la balle vue
+            reaction_ms millisecondes plus tôt (arrondi au pas).
+        error (float) : Erreur de visée maximale, en fraction de la hauteur du paddle,
+            tirée à chaque changement de direction de la balle.
+    """
+    def __init__(self, side, rng=None, reaction_ms=0.0, error=0.0):
+        super().__init__(side, rng)
+        self.reaction_ms = reaction_ms
+        self.error = error
+        self.dt = FRAME_MS
+        self.observations = deque(maxlen=round(reaction_ms / FRAME_MS) + 1)
+        self.aim_offset = 0.0
+        self.heading = 0
+
+    def decide(self, state, dt=FRAME_MS):
+        if dt != self.dt:
+            # Autant d'observations que le retard contient de pas (les plus récentes gardées)
+            self.dt = dt
+            self.observations = deque(self.observations, maxlen=round(self.reaction_ms / dt) + 1)
+        ball = state.ball
+        self.observations.append((ball.x, ball.y, ball.speed_x, ball.speed_y))
+        x, y, speed_x, speed_y = self.observations[0]
+        paddle = self.paddle(state)
+
+        heading = (speed_x > 0) - (speed_x < 0)
+        if heading != self.heading:
+            self.heading = heading
+            self.aim_offset = self.rng.uniform(-self.error, self.error) * paddle.height
+
+        # Zone morte : la moitié du déplacement du paddle pendant ce pas. L'erreur de visée
+        # est bornée pour que la balle touche encore le paddle arrêté au bord de cette zone
+        dead_zone = paddle.speed * dt / FRAME_MS / 2
+        if self.side == "a":
+            face, approaching = paddle.x + paddle.width, speed_x < 0
+        else:
+            face, approaching = paddle.x - ball.size, speed_x > 0
+        if approaching:
+            frames = max(0.0, (face - x) / speed_x)
+            bottom = state.height - 1 - ball.size
+            aim, limit = self.aim_offset, (paddle.height + ball.size) / 2 - dead_zone
+            if aim > limit or aim < -limit:
+                aim = max(0.0, limit) if aim > 0 else -max(0.0, limit)
+            target = predict_crossing(y, speed_y, frames, bottom) + ball.size / 2 + aim
+        else:
+            target = state.height / 2
+
+        offset = target - (paddle.y + paddle.height / 2)
+        if offset > dead_zone:
+            return 1
+        if offset < -dead_zone:
+            return -1
+        return 0
+
+
+# Contrôleurs disponibles, par nom
+CONTROLLERS = {
+    "immobile": Controller,
+    "aleatoire": RandomController,
+    "suiveur": FollowController,
+    "predictif": PredictController,
+}
+for level, parameters in DIFFICULTIES.items():
+    CONTROLLERS["ia_" + level] = partial(PredictController, **parameters)
+
+
+def create_controller(name, side, rng=None):
+    """
+    Crée un contrôleur à partir de son nom.
+
+    Args:
+        name (str): Nom du contrôleur (clé de CONTROLLERS).
+        side (str): Côté contrôlé ("a" ou "b").
+        rng (random.Random): Générateur aléatoire du contrôleur.
+
+    Returns:
+        Controller: Le contrôleur créé.
+    """
+    try:
+        controller_class = CONTROLLERS[name]
+    except KeyError:
+        raise ValueError(f"Contrôleur inconnu : {name} (disponibles : {', '.join(CONTROLLERS)})") from None
+    return controller_class(side, rng)
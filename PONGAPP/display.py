@@ -0,0 +1,80 @@
+"""
+Module display.py
+Gestion de la fenêtre du jeu, partagée par les menus et les parties.
+
+Seuls les sous-systèmes de pygame utilisés sont initialisés (affichage et polices ;
+le son est initialisé par assets.py au chargement des sons). La fenêtre est créée une
+fois et gardée : pygame.display.set_mode n'est rappelé que si le mode demandé (taille
+ou plein écran) change vraiment, ce qui évite l'écran noir et l'attente de chaque
+changement de mode.
+
+Fonctions:
+    - init(): Initialise l'affichage et les polices (une seule fois).
+    - get_screen(size): Retourne la fenêtre, recréée seulement si le mode change.
+    - check_cold_start(): Mesure le temps de démarrage et le compare au budget.
+"""
+
+import sys
+import time
+
+# Instant de l'import du module (avant celui de pygame), au tout début du lancement du jeu
+STARTED = time.perf_counter()
+
+import pygame
+from constants import COLD_START_BUDGET_MS
+import settings
+
+_display = {"mode": None, "mode_changes": 0}
+
+
+def init():
+    """Initialise l'affichage et les polices de pygame, si ce n'est pas déjà fait."""
+    if not pygame.display.get_init():
+        pygame.display.init()
+        pygame.display.set_caption("Pong")
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+
+def get_screen(size=None):
+    """
+    Retourne la fenêtre du jeu dans le mode demandé, sans la recréer si elle y est déjà.
+
+    Args:
+        size (tuple): Taille voulue (largeur, hauteur). Par défaut : taille sélectionnée
+            dans les paramètres (settings), plein écran compris. Une fenêtre ouverte qui
+            a déjà cette taille est réutilisée telle quelle (plein écran compris).
+
+    Returns:
+        pygame.Surface: La surface de la fenêtre.
+    """
+    init()
+    screen = pygame.display.get_surface()
+    if size is not None:
+        if screen is not None and screen.get_size() == tuple(size):
+            return screen
+        mode = (tuple(size), 0)
+    elif settings.get_current_screen_size_label() == "Fullscreen":
+        mode = ((0, 0), pygame.FULLSCREEN)
+    else:
+        mode = (tuple(settings.get_current_screen_size()), 0)
+
+    if screen is None or mode != _display["mode"]:
+        screen = pygame.display.set_mode(*mode)
+        _display["mode"] = mode
+        _display["mode_changes"] += 1
+    return screen
+
+
+def check_cold_start():
+    """
+    Mesure le temps écoulé depuis le lancement (import de ce module) et affiche un
+    avertissement s'il dépasse COLD_START_BUDGET_MS.
+
+    Returns:
+        float: Temps de démarrage en millisecondes.
+    """
+    elapsed = (time.perf_counter() - STARTED) * 1000
+    if elapsed > COLD_START_BUDGET_MS:
+        print(f"Démarrage lent : {elapsed:.0f} ms (budget : {COLD_START_BUDGET_MS} ms)", file=sys.stderr)
+    return elapsed
@@ -0,0 +1,219 @@
+"""
+Module env.py
+Environnement d'apprentissage par renforcement à la Gym : N parties de Pong avancées
+ensemble (batch.BatchSimulation), pilotées par reset()/step() pour un ou les deux paddles.
+
+Les observations sont des tableaux NumPy réutilisés d'un pas à l'autre (aucune
+allocation par pas) :
+- "state" : vecteur compact par partie, float32 de taille (N, len(STATE_FIELDS)) : balle,
+  vitesses, paddles, bonus et effets actifs (colonnes dans l'ordre de STATE_FIELDS) ;
+- "pixels" : image par partie, uint8 de taille (N, hauteur, largeur, 3). Les N terrains
+  sont dessinés l'un sous l'autre sur une seule surface hors écran, et l'observation est
+  une vue pygame.surfarray.pixels3d sur ses pixels, découpée par partie : elle n'est
+  jamais copiée.
+
+Le tableau retourné est réécrit au pas suivant : le copier pour le garder. Une partie
+terminée est réinitialisée sur place (comme les environnements vectorisés de Gym) ;
+l'observation retournée est alors celle de la nouvelle partie.
+
+Récompense : +1 pour un point marqué, -1 pour un point encaissé, du point de vue de
+chaque paddle contrôlé. Le paddle non contrôlé suit un contrôleur prédictif vectorisé
+(batch.BatchPredictController, niveau de controllers.DIFFICULTIES).
+
+Classes:
+    - PongEnv: N parties de Pong vues comme un environnement vectorisé.
+
+Exemple :
+    env = PongEnv(64, players="a", observation="pixels", seed=1)
+    obs, info = env.reset()
+    obs, reward, terminated, truncated, info = env.step(np.ones(64, dtype=np.int8))
+
+Dépendances:
+    - numpy
+"""
+
+import numpy as np
+import pygame
+from constants import (
+    WHITE, BLACK, WIDTH, HEIGHT, PADDLE_HEIGHT, PADDLE_WIDTH, BALL_SIZE,
+    BONUS_TYPES, BONUS_RADIUS
+)
+from batch import BatchSimulation, BatchPredictController
+from controllers import DIFFICULTIES
+from simulation import EFFECT_NAMES
+
+# Colonnes de l'observation "state" (attributs de BatchSimulation), suivies d'une colonne
+# par effet de simulation.EFFECT_NAMES
+STATE_FIELDS = ("ball_x", "ball_y", "speed_x", "speed_y", "paddle_a_y", "paddle_b_y",
+                "paddle_a_height", "paddle_b_height", "bonus_active", "bonus_type",
+                "bonus_x", "bonus_y") + EFFECT_NAMES
+OBSERVATIONS = ("state", "pixels")
+
+
+class PongEnv:
+    """
+    N parties de Pong vues comme un environnement vectorisé.
+
+    Attributs :
+        sim (BatchSimulation) : Parties en cours.
+        players (str) : Paddles contrôlés par l'agent ("a", "b" ou "ab").
+        observation (str) : Type d'observation ("state" ou "pixels").
+        frame_skip (int) : Pas de simulation joués avec la même action à chaque step().
+        max_steps (int) : Nombre de step() après lequel une partie est interrompue et
+            réinitialisée (None : sans limite).
+        opponent (BatchPredictController) : Contrôleur du paddle non contrôlé (None si
+            l'agent contrôle les deux paddles).
+        pixel_scale (float) : Facteur entre le terrain et l'image des observations "pixels".
+        surface (pygame.Surface) : Surface hors écran des N images (observation "pixels").
+
+    Méthodes :
+        reset(seed) : Réinitialise toutes les parties.
+        step(actions) : Joue une action par partie et par paddle contrôlé.
+        render() : Dessine les parties et retourne leurs images.
+        close() : Libère la surface hors écran.
+    """
+    def __init__(self, n=1, players="a", observation="state", width=WIDTH, height=HEIGHT,
+                 paddle_height=PADDLE_HEIGHT, ball_size=BALL_SIZE, opponent_level="moyen",
+                 frame_skip=1, max_steps=None, pixel_scale=0.25, seed=None):
+        if players not in ("a", "b", "ab"):
+            raise ValueError(f"Paddles contrôlés inconnus : {players}")
+        if observation not in OBSERVATIONS:
+            raise ValueError(f"Type d'observation inconnu : {observation}")
+        self.n = n
+        self.players = players
+        self.observation = observation
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.sim = BatchSimulation(n, width, height, paddle_height, ball_size, seed)
+        self.columns = ["ab".index(player) for player in players]
+        self.opponent = None
+        if len(players) == 1:
+            side = "b" if players == "a" else "a"
+            self.opponent = BatchPredictController(self.sim, side, seed=seed, **DIFFICULTIES[opponent_level])
+            self.opponent_column = "ab".index(side)
+
+        # Tampons réutilisés à chaque pas
+        self.inputs = np.zeros((n, 2), dtype=np.int8)
+        self.rewards = np.zeros((n, len(players)), dtype=np.float32)
+        self.terminated = np.zeros(n, dtype=bool)
+        self.truncated = np.zeros(n, dtype=bool)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.state = np.zeros((n, len(STATE_FIELDS)), dtype=np.float32)
+
+        # Observation "pixels" : N terrains empilés sur une surface, vus sans copie
+        self.pixel_scale = pixel_scale
+        self.surface = None
+        self.pixels = None
+        if observation == "pixels":
+            image_width, image_height = round(width * pixel_scale), round(height * pixel_scale)
+            self.surface = pygame.Surface((image_width, image_height * n), depth=24)
+            view = pygame.surfarray.pixels3d(self.surface)
+            self.pixels = view.reshape(image_width, n, image_height, 3).transpose(1, 2, 0, 3)
+
+
+    def reset(self, seed=None):
+        """
+        Réinitialise toutes les parties.
+
+        Args:
+            seed (int): Nouvelle graine des parties (None : suite de la graine actuelle).
+
+        Returns:
+            tuple: (observation, info).
+        """
+        if seed is not None:
+            self.sim.rng = np.random.default_rng(seed)
+        self.sim.reset(np.ones(self.n, dtype=bool))
+        self.steps[:] = 0
+        return self.observe(), {}
+
+
+    def step(self, actions):
+        """
+        Joue une action par partie et par paddle contrôlé, pendant frame_skip pas de simulation.
+
+        Args:
+            actions (array-like): Directions (-1 haut, 0 immobile, 1 bas), de taille (N,)
+                pour un paddle ou (N, 2) pour les deux (colonnes A puis B).
+
+        Returns:
+            tuple: (observation, récompenses, terminées, interrompues, info). Les
+            récompenses sont de taille (N,) pour un paddle, (N, 2) pour les deux.
+        """
+        sim = self.sim
+        self.inputs[:, self.columns] = np.asarray(actions).reshape(self.n, len(self.columns))
+        self.rewards[:] = 0
+        self.terminated[:] = False
+        for _ in range(self.frame_skip):
+            if self.opponent is not None:
+                self.inputs[:, self.opponent_column] = self.opponent.decide()
+            sim.step(self.inputs)
+            points = sim.point_a.astype(np.float32) - sim.point_b
+            for i, player in enumerate(self.players):
+                self.rewards[:, i] += points if player == "a" else -points
+            self.terminated |= sim.done
+
+        self.steps += 1
+        self.steps[self.terminated] = 0
+        self.truncated[:] = False
+        if self.max_steps is not None:
+            np.greater_equal(self.steps, self.max_steps, out=self.truncated)
+            if self.truncated.any():
+                sim.reset(self.truncated)
+                self.steps[self.truncated] = 0
+        rewards = self.rewards[:, 0] if len(self.players) == 1 else self.rewards
+        return self.observe(), rewards, self.terminated, self.truncated, {}
+
+
+    def observe(self):
+        """Remplit et retourne l'observation du type choisi."""
+        if self.observation == "pixels":
+            return self.render()
+        sim, state = self.sim, self.state
+        for column, name in enumerate(STATE_FIELDS[:-len(EFFECT_NAMES)]):
+            state[:, column] = getattr(sim, name)
+        state[:, -len(EFFECT_NAMES):] = sim.active_effects
+        return state
+
+
+    def render(self):
+        """
+        Dessine les N parties sur la surface hors écran : paddles et balle en blanc (balle
+        carrée), bonus de la couleur de son type.
+
+        Returns:
+            np.ndarray: Vue (N, hauteur, largeur, 3) sur les pixels de la surface.
+        """
+        if self.surface is None:
+            raise ValueError("render() demande l'observation \"pixels\"")
+        sim, surface, scale = self.sim, self.surface, self.pixel_scale
+        surface.fill(BLACK)
+        image_height = surface.get_height() // self.n
+        paddle_width = max(1, round(PADDLE_WIDTH * scale))
+        ball_size = max(1, round(sim.ball_size * scale))
+        radius = max(1, round(BONUS_RADIUS * scale))
+        colors = [bonus_type["color"] for bonus_type in BONUS_TYPES]
+        paddle_a_x, paddle_b_x = round(sim.paddle_a_x * scale), round(sim.paddle_b_x * scale)
+        # Coordonnées de toutes les parties converties en une fois
+        top = np.arange(self.n) * image_height
+        ball_x = (sim.ball_x * scale).astype(int).tolist()
+        ball_y = (sim.ball_y * scale + top).astype(int).tolist()
+        paddle_a_y = (sim.paddle_a_y * scale + top).astype(int).tolist()
+        paddle_b_y = (sim.paddle_b_y * scale + top).astype(int).tolist()
+        paddle_a_height = (sim.paddle_a_height * scale).astype(int).tolist()
+        paddle_b_height = (sim.paddle_b_height * scale).astype(int).tolist()
+        for i in range(self.n):
+            surface.fill(WHITE, (paddle_a_x, paddle_a_y[i], paddle_width, paddle_a_height[i]))
+            surface.fill(WHITE, (paddle_b_x, paddle_b_y[i], paddle_width, paddle_b_height[i]))
+            surface.fill(WHITE, (ball_x[i], ball_y[i], ball_size, ball_size))
+        for i in np.flatnonzero(sim.bonus_active).tolist():
+            center = (round((sim.bonus_x[i] + BONUS_RADIUS) * scale),
+                      round((sim.bonus_y[i] + BONUS_RADIUS) * scale) + i * image_height)
+            pygame.draw.circle(surface, colors[sim.bonus_type[i]], center, radius)
+        return self.pixels
+
+
+    def close(self):
+        """Libère la surface hors écran (la vue sur ses pixels la verrouille)."""
+        self.pixels = None
+        self.surface = None
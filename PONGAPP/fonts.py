@@ -0,0 +1,73 @@
+"""
+Module fonts.py
+Cache des polices et des textes rendus.
+
+pygame.font.SysFont parcourt la liste des polices du système à chaque appel et
+font.render rastérise le texte à chaque frame. Ce module garde les polices déjà
+chargées et les surfaces de texte déjà rendues, pour que les textes inchangés
+(score, chronomètre, options des menus) soient réutilisés d'une frame à l'autre.
+
+Fonctions:
+    - get_font(name, size): Retourne la police (name, size), chargée une seule fois.
+    - render_text(font, text, color, antialias): Retourne la surface du texte, depuis le cache si possible.
+    - clear_cache(): Vide les caches.
+"""
+
+from collections import OrderedDict
+import pygame
+from constants import TEXT_CACHE_SIZE
+
+_fonts = {}
+_texts = OrderedDict()
+
+
+def get_font(name, size):
+    """
+    Retourne la police système demandée, chargée au premier appel puis réutilisée.
+
+    Args:
+        name (str): Nom de la police (ex : "Arial").
+        size (int): Taille de la police.
+
+    Returns:
+        pygame.font.Font: La police.
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+
+def render_text(font, text, color, antialias=True):
+    """
+    Retourne la surface du texte rendu avec la police et la couleur données.
+    Les surfaces sont gardées dans un cache LRU de TEXT_CACHE_SIZE entrées :
+    un texte qui ne change pas n'est rastérisé qu'une fois.
+
+    Args:
+        font (pygame.font.Font): Police utilisée.
+        text (str): Texte à afficher.
+        color (tuple): Couleur du texte.
+        antialias (bool): Lissage du texte.
+
+    Returns:
+        pygame.Surface: Surface du texte (à ne pas modifier, elle est partagée).
+    """
+    key = (font, text, color, antialias)
+    surface = _texts.get(key)
+    if surface is not None:
+        _texts.move_to_end(key)
+        return surface
+    surface = font.render(text, antialias, color)
+    _texts[key] = surface
+    if len(_texts) > TEXT_CACHE_SIZE:
+        _texts.popitem(last=False)
+    return surface
+
+
+def clear_cache():
+    """Vide les caches de polices et de textes (ex : après pygame.quit())."""
+    _fonts.clear()
+    _texts.clear()
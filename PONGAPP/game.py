@@ -1,314 +1,518 @@
 """
-Classe PongGame pour gérer le jeu Pong avec bonus, scores et effets visuels/sonores.
+Classe PongGame pour gérer le jeu Pong avec bonus, scores et effets visuels/sonores,
+et WinnerScene pour l'écran de fin de partie.
 """
 
-import sys
+import random
 import pygame
 from constants import (
-    WHITE, BLACK, FPS, PADDLE_WIDTH, PADDLE_SPEED, SIZE_BOOST,
-    FONT_SIZE, TIME_Y_OFFSET, WIN_SCORE, SPEEDUP_INTERVAL,
-    SPEEDUP_FACTOR, BONUS_SPAWN_INTERVAL, SPEED_BOOST, SPEED_SLOW,
-    PADDEL_MARGIN_X, PADDLE_HEIGHT, WINNER_DISPLAY_MS, RESET_DELAY_MS
+    WHITE, BLACK, FRAME_MS, FONT_SIZE, SCORE_Y, TIME_Y_OFFSET, WINNER_DISPLAY_MS,
+    IDLE_REDRAW_MS, REPLAY_SEEK_MS, MAX_FRAME_LAG_MS, END_TEXT_OFFSET_Y, CONTROLLER_SEED_SALT
 )
 import settings
-from sounds import init_sounds
-from utils import reset_ball, format_time
+import simulation
+import display
+from sounds import SoundBoard
+from utils import format_time
 from bonus import Bonus
+from fonts import get_font, render_text
+from background import get_background
+from replay import ReplayRecorder
+from controllers import PredictController, DIFFICULTIES
+from profiler import FrameProfiler
+from scenes import Scene, SceneManager
+from capture import FrameCapture
 
 
-class PongGame:
+class PongGame(Scene):
     """
     Classe PongGame représentant le jeu Pong.
+    La logique de la partie est déléguée au moteur simulation ; PongGame lit le clavier,
+    fait avancer la simulation, joue les sons et dessine l'état. C'est une scène de la
+    boucle principale (scenes.SceneManager).
 
     Attributs :
-    - screen : Surface de l'écran de jeu.
-    - clock : Horloge pour gérer le temps.
+    - width, height : Dimensions du terrain (coordonnées de la simulation).
+    - screen : Surface sur laquelle la partie est dessinée (la fenêtre, ou la surface de
+      rendu à l'échelle).
+    - window, target : En rendu à l'échelle, la fenêtre et la zone (aux proportions du
+      terrain) où screen est agrandie à chaque frame ; None en rendu natif.
+    - render_scale : Facteur entre les coordonnées du terrain et celles de screen.
     - font : Police utilisée pour afficher le text.
+    - state : État de la partie (simulation.MatchState).
     - paddle_a, paddle_b : Rectangles représentant les paddles des joueurs.
     - ball : Rectangle représentant la ball.
-    - ball_speed_x, ball_speed_y : Vitesse de la ball en x et y.
     - score_a, score_b : Scores des joueurs A et B.
-    - ping_a, pong_b, ping_pong_c : Sons du jeu.
+    - audio : Lecture des sons (sounds.SoundBoard).
     - winner : Gagnant de la partie.
     - paused : Indique si le jeu est en pause.
-    - start_time : Temps de début de la partie.
+    - lag : Temps écoulé pas encore simulé (moins d'un pas), en millisecondes.
     - running : Indique si le jeu est en cours.
-    - bonus : Instance du système de bonus.
-    - last_bonus_spawn : Temps du dernier spawn de bonus.
-    - bonus_spawn_interval : Intervalle entre les spawns de bonus.
+    - bonus : Affichage du bonus de la partie.
     - active_effects : Effets actifs des bonus.
-    - paddle_a_speed, paddle_b_speed : Vitesse des paddles.
-    - original_paddle_height : height originale des paddles.
+    - controllers : Contrôleurs de l'ordinateur, par côté ("a" ou "b").
+    - recorder : Enregistreur du replay de la partie (None si désactivé ou en mode multiball).
+    - replay, replay_frames, replay_frame : Replay en cours de relecture, ses directions
+      et le pas courant (flèches gauche/droite pour reculer ou avancer).
+    - dirty_rects : Mode de rendu par zones modifiées (seules ces zones sont envoyées à l'écran).
+    - previous_rects : Zones dessinées à la frame précédente (mode dirty_rects).
+    - profiler : Temps de chaque phase des frames (overlay avec F3).
+    - capture : Capture vidéo et captures d'écran (capture.FrameCapture), None tant
+      qu'aucune n'est demandée.
+    - previous_positions : Positions mobiles avant le dernier pas (interpolation de
+      l'affichage), None juste après un point ou un saut dans le replay.
 
     Méthodes :
-    - run(screen) : Boucle principale du jeu.
-    - update(now) : Met à jour l'état du jeu.
-    - apply_bonus_effects() : Applique les effets des bonus.
-    - move_paddles() : Gère le déplacement des paddles.
-    - move_ball() : Gère le déplacement de la ball.
-    - reset_game() : Réinitialise le jeu après un point.
+    - run(screen) : Joue la partie dans sa propre boucle de scènes.
+    - wait_ms(), handle_events(events), frame(elapsed) : Scène de la boucle principale.
+    - finish() : Termine la partie et laisse place à l'écran du gagnant.
+    - screenshot() : Enregistre une capture d'écran de la dernière image.
+    - read_inputs() : Lit les directions des paddles au clavier.
+    - advance(lag) : Enchaîne les pas fixes de simulation correspondant au temps écoulé.
+    - update(inputs, dt) : Met à jour l'état du jeu.
+    - seek_replay(frame) : Saute à un pas du replay en cours de relecture.
+    - sync_rects(alpha) : Recopie les positions (interpolées) de la simulation dans les rectangles pygame.
     - draw() : Dessine les éléments du jeu à l'écran.
+    - draw_elements() : Dessine les éléments mobiles et retourne les zones modifiées.
+    - present() : Envoie l'image dessinée à l'écran.
     - show_winner() : Affiche le gagnant à la fin de la partie.
     """
-    def __init__(self, paddle_height, width, height):
+    def __init__(self, paddle_height, width, height, seed=None, dirty_rects=None,
+                 ball_size=None, replay=None, ai_side=None, ai_level=None, multiball=None,
+                 render_scale=None):
         self.width = width
         self.height = height
-        pygame.init()
-        self.screen = pygame.display.set_mode((width, height))
-        pygame.display.set_caption("Pong")
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("Arial", FONT_SIZE)
-
-        self.paddle_a = pygame.Rect(PADDEL_MARGIN_X,
-                                    height//2 - paddle_height//2,
-                                    PADDLE_WIDTH,
-                                    paddle_height)
-        self.paddle_b = pygame.Rect(width - PADDEL_MARGIN_X - PADDLE_WIDTH,
-                                    height//2 - paddle_height//2,
-                                    PADDLE_WIDTH,
-                                    paddle_height)
-
-        self.ball, self.ball_speed_x, self.ball_speed_y, self.last_speedup = reset_ball(width, height)
-
-        self.score_a, self.score_b = 0, 0
-        self.ping_a, self.pong_b, self.ping_pong_c = init_sounds()
-        self.winner = None
-        self.paused = False
-        self.start_time = pygame.time.get_ticks()
-        self.running = True
+        render_scale = settings.get_current_render_scale() if render_scale is None else render_scale
+        if not render_scale:
+            # Rendu natif : fenêtre partagée, réutilisée si elle a déjà la taille du terrain
+            self.render_scale = 1
+            self.screen = display.get_screen((width, height))
+            self.window = self.target = None
+        else:
+            # Rendu à l'échelle : surface de taille fixe agrandie à la fenêtre actuelle,
+            # en gardant les proportions du terrain
+            self.render_scale = render_scale
+            self.window = display.get_screen()
+            self.window.fill(BLACK)
+            self.screen = pygame.Surface((round(width * render_scale), round(height * render_scale))).convert()
+            fit = min(self.window.get_width() / width, self.window.get_height() / height)
+            target = pygame.Rect(0, 0, round(width * fit), round(height * fit))
+            target.center = self.window.get_rect().center
+            self.target = self.window.subsurface(target)
+        self.font = get_font("Arial", round(FONT_SIZE * self.render_scale))
+
+        # Relecture d'un replay : la partie enregistrée est reconstruite à l'identique
+        self.replay = replay
+        self.replay_frames = None
+        self.replay_frame = 0
+        if replay is not None:
+            seed, ball_size = replay.seed, replay.ball_size
+            self.replay_frames = replay.frames()
+        if ball_size is None:
+            ball_size = settings.get_current_ball_size()
+        self.state = simulation.new_match(width, height, paddle_height, ball_size, seed)
+        # Mode multiball : balles stockées dans des tableaux NumPy (jamais en relecture)
+        if replay is None and (settings.MULTIBALL if multiball is None else multiball):
+            from multiball import enable
+            enable(self.state)
+        self.paddle_a = pygame.Rect(0, 0, 0, 0)
+        self.paddle_b = pygame.Rect(0, 0, 0, 0)
+        self.ball = pygame.Rect(0, 0, 0, 0)
+        self.previous_positions = None
+        self.sync_rects()
+
+        self.audio = SoundBoard()
+        self.paused = self.was_paused = False
+        self.lag = 0.0
 
         # Système de bonus
-        self.bonus = Bonus()
-        self.last_bonus_spawn = pygame.time.get_ticks()
-        self.bonus_spawn_interval = BONUS_SPAWN_INTERVAL
-        self.active_effects = {
-            "increase_speed_a": False,
-            "increase_size_a": False,
-            "slow_opponent_a": False,
-            "increase_speed_b": False,
-            "increase_size_b": False,
-            "slow_opponent_b": False
-        }
-        self.paddle_a_speed = self.paddle_b_speed = PADDLE_SPEED
-        self.original_paddle_height = PADDLE_HEIGHT
+        self.bonus = Bonus(self.state.bonus)
+
+        # Joueur tenu par l'ordinateur (réglages du menu par défaut, jamais en relecture).
+        # Sa graine est dérivée de celle de la partie, sans rejouer les mêmes tirages
+        self.controllers = {}
+        if replay is None:
+            ai_side = settings.get_current_ai_side() if ai_side is None else ai_side
+            ai_level = settings.get_current_ai_level() if ai_level is None else ai_level
+            if ai_side is not None:
+                self.controllers[ai_side] = PredictController(
+                    ai_side, random.Random(self.state.seed ^ CONTROLLER_SEED_SALT), **DIFFICULTIES[ai_level])
+
+        # Rendu par zones modifiées (optionnel)
+        self.dirty_rects = settings.DIRTY_RECT_RENDERING if dirty_rects is None else dirty_rects
+        self.previous_rects = None
+
+        # Enregistrement du replay de la partie
+        self.recorder = None
+        if settings.RECORD_REPLAYS and replay is None and self.state.balls is None:
+            self.recorder = ReplayRecorder.from_state(self.state)
+
+        # Capture vidéo (settings.CAPTURE_MODE), écrite par un thread
+        self.capture = None
+        if settings.CAPTURE_MODE is not None:
+            self.capture = FrameCapture(self.screen.get_size(), settings.CAPTURE_MODE)
+
+        # Mesure des temps de frame
+        self.profiler = FrameProfiler(budget_ms=1000 / settings.RENDER_FPS if settings.RENDER_FPS else FRAME_MS)
+
+
+    @property
+    def score_a(self):
+        """Score du joueur A."""
+        return self.state.score_a
+
+    @property
+    def score_b(self):
+        """Score du joueur B."""
+        return self.state.score_b
+
+    @property
+    def winner(self):
+        """Gagnant de la partie ou None."""
+        return self.state.winner
+
+    @property
+    def running(self):
+        """Indique si la partie est en cours."""
+        return self.state.running
+
+    @property
+    def active_effects(self):
+        """Effets actifs des bonus."""
+        return self.state.active_effects
 
 
     def run(self, screen):
         """
-        Exécute la boucle principale du jeu, gère les événements, met à jour l'état du jeu 
-        et affiche les éléments graphiques. Permet de mettre le jeu en pause avec la barre d'espace.
+        Joue la partie dans sa propre boucle de scènes (relecture d'un replay) : la partie
+        puis l'écran du gagnant.
         """
-        while self.running:
-            now = pygame.time.get_ticks()
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        self.paused = not self.paused
+        manager = SceneManager()
+        manager.push(self)
+        manager.run()
 
-            if not self.paused:
-                self.update(now, screen)
-                self.bonus.update()  # Mettre à jour l'état du bonus
 
-            self.draw()
-        self.show_winner()
+    def wait_ms(self):
+        """En pause, la boucle attend les événements au lieu de redessiner en continu."""
+        return IDLE_REDRAW_MS if self.paused else None
 
 
-    def update(self, now, screen):
+    def handle_events(self, events):
         """
-        Met à jour l'état du jeu.
-        Args:
-            now (int): Temps actuel en millisecondes.
-        Fonctionnalités :
-        - Gère l'apparition et les effets des bonus.
-        - Applique les effets actifs des bonus.
-        - Augmente progressivement la speed de la ball.
-        - Met à jour les positions des paddles et de la ball.
+        Barre d'espace : pause ; F3 : temps de frame (les frames en pause ne sont pas
+        mesurées) ; F12 : capture d'écran ; en relecture, flèches gauche/droite : -/+ REPLAY_SEEK_MS.
         """
-        # Gestion du bonus
-        if now - self.last_bonus_spawn > self.bonus_spawn_interval and not self.bonus.active:
-            self.bonus.spawn(screen)
-            self.last_bonus_spawn = now
-
-        effect = (self.bonus.check_collision(self.paddle_a, "a")
-                or self.bonus.check_collision(self.paddle_b, "b"))
-        if effect:
-            self.active_effects[effect] = True
-            player = effect[-1]
-            for key in self.active_effects:
-                if key.endswith(player) and key != effect:
-                    self.active_effects[key] = False
-
-        self.apply_bonus_effects()
-
-        if now - self.last_speedup > SPEEDUP_INTERVAL:
-            self.ball_speed_x = int(self.ball_speed_x * SPEEDUP_FACTOR)
-            self.ball_speed_y = int(self.ball_speed_y * SPEEDUP_FACTOR)
-            self.last_speedup = now
-
-        self.clock.tick(FPS)
-        self.move_paddles()
-        self.move_ball()
-
-
-    def apply_bonus_effects(self):
+        profiler = self.profiler
+        profiler.begin()
+        self.was_paused = self.paused
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    self.paused = not self.paused
+                elif event.key == pygame.K_F3:
+                    profiler.toggle()
+                elif event.key == pygame.K_F12:
+                    self.screenshot()
+                elif self.replay is not None and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    direction = 1 if event.key == pygame.K_RIGHT else -1
+                    self.seek_replay(self.replay_frame + direction * int(REPLAY_SEEK_MS // FRAME_MS))
+        profiler.mark("events")
+
+
+    def frame(self, elapsed):
         """
-        Applique les effets bonus actifs sur les paddles :
-        - Augmente ou réduit la speed des paddles.
-        - Modifie la taille des paddles.
-        - Ralentit l'adversaire si applicable.
+        Avance la simulation par pas fixes de FRAME_MS pour le temps écoulé, quelle que soit
+        la cadence d'affichage, puis dessine. À la fin de la partie (ou du replay), laisse
+        place à l'écran du gagnant.
         """
-        # Effet speed
-        if self.active_effects["increase_speed_a"]:
-            self.paddle_a_speed = PADDLE_SPEED * SPEED_BOOST
-        else:
-            self.paddle_a_speed = PADDLE_SPEED
-            
-        if self.active_effects["increase_speed_b"]:
-            self.paddle_b_speed = PADDLE_SPEED * SPEED_BOOST
-        else:
-            self.paddle_b_speed = PADDLE_SPEED
-            
-        # Effet taille
-        if self.active_effects["increase_size_a"]:
-            self.paddle_a.height = settings.get_current_paddle_height() * SIZE_BOOST
-        else:
-            self.paddle_a.height = settings.get_current_paddle_height()
+        profiler = self.profiler
+        profiler.mark("wait")
+        paused = self.was_paused or self.paused
+        if not paused:
+            self.lag = self.advance(self.lag + min(elapsed, MAX_FRAME_LAG_MS))
+        if self.lag is None or not self.running:
+            self.finish()
+            return
+
+        self.sync_rects(self.lag / FRAME_MS)
+        self.draw()
+        if not paused:
+            profiler.end()
+
+
+    def finish(self):
+        """
+        Enregistre le replay et les temps de frame, termine l'écriture de la capture
+        (au plus CAPTURE_RING_SIZE + 1 images en attente), puis affiche le gagnant.
+        """
+        if self.recorder is not None:
+            self.recorder.save()
+        if self.capture is not None:
+            self.capture.close()
+        if settings.EXPORT_FRAME_PROFILES:
+            self.profiler.save_csv()
+        self.manager.replace(WinnerScene(self, prompt=self.replay is None))
 
-        if self.active_effects["increase_size_b"]:
-            self.paddle_b.height = settings.get_current_paddle_height() * SIZE_BOOST
-        else:
-            self.paddle_b.height = settings.get_current_paddle_height()
 
-        # Effet ralentissement
-        if self.active_effects["slow_opponent_a"]:
-            self.paddle_b_speed = PADDLE_SPEED * SPEED_SLOW
-        elif not self.active_effects["increase_speed_b"]:
-            self.paddle_b_speed = PADDLE_SPEED
-            
-        if self.active_effects["slow_opponent_b"]:
-            self.paddle_a_speed = PADDLE_SPEED * SPEED_SLOW
-        elif not self.active_effects["increase_speed_a"]:
-            self.paddle_a_speed = PADDLE_SPEED
+    def screenshot(self):
+        """Enregistre une capture d'écran de la dernière image, écrite par le thread de capture."""
+        if self.capture is None:
+            self.capture = FrameCapture(self.screen.get_size(), None)
+        self.capture.screenshot(self.screen)
 
 
-    def move_paddles(self):
+    def read_inputs(self):
         """
-        Déplace les paddles en fonction des touches pressées.
+        Lit les touches pressées et retourne la direction de chaque paddle.
         - 'Z' et 'S' pour la paddle A (haut et bas).
         - Flèches 'Haut' et 'Bas' pour la paddle B.
+        Un paddle tenu par l'ordinateur suit son contrôleur.
+        En relecture, les directions viennent du replay.
+
+        Returns:
+            tuple: Directions (a, b) : -1 haut, 0 immobile, 1 bas
+            (None quand le replay est terminé).
         """
+        if self.replay_frames is not None:
+            self.replay_frame += 1
+            return next(self.replay_frames, None)
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_z] and self.paddle_a.top > 0:
-            self.paddle_a.y -= self.paddle_a_speed
-        if keys[pygame.K_s] and self.paddle_a.bottom < self.height - 1:
-            self.paddle_a.y += self.paddle_a_speed
-        if keys[pygame.K_UP] and self.paddle_b.top > 0:
-            self.paddle_b.y -= self.paddle_b_speed
-        if keys[pygame.K_DOWN] and self.paddle_b.bottom < self.height - 1:
-            self.paddle_b.y += self.paddle_b_speed
+        inputs = (keys[pygame.K_s] - keys[pygame.K_z],
+                  keys[pygame.K_DOWN] - keys[pygame.K_UP])
+        if self.controllers:
+            inputs = tuple(self.controllers[side].decide(self.state) if side in self.controllers
+                           else direction for side, direction in zip("ab", inputs))
+        return inputs
+
+
+    def advance(self, lag):
+        """
+        Avance la partie d'autant de pas fixes de FRAME_MS que le temps accumulé en contient.
+
+        Args:
+            lag (float): Temps écoulé non encore simulé, en millisecondes.
+
+        Returns:
+            float: Temps restant (moins d'un pas), ou None quand le replay est terminé.
+        """
+        while lag >= FRAME_MS and self.running:
+            inputs = self.read_inputs()
+            if inputs is None:
+                return None
+            self.update(inputs)
+            lag -= FRAME_MS
+        return lag
 
 
-    def move_ball(self):
+    def update(self, inputs, dt=FRAME_MS):
+        """
+        Met à jour l'état du jeu.
+        Args:
+            inputs (tuple): Directions des paddles (voir read_inputs).
+            dt (float): Durée simulée en millisecondes.
+        Fonctionnalités :
+        - Fait avancer la simulation (bonus, accélération, paddles, ball, scores).
+        - Joue les sons correspondant aux collisions et aux points (un par catégorie et par
+          frame, sur des canaux réservés : voir sounds.SoundBoard).
         """
-        Déplace la ball et gère les collisions (murs, paddles).
-        Met à jour les scores et détermine le gagnant si le score limite est atteint.
+        profiler = self.profiler
+        if self.recorder is not None:
+            self.recorder.record(inputs, self.state)
+        self.previous_positions = self.positions()
+        events = simulation.step(self.state, inputs, dt)
+        if simulation.EVENT_POINT in events:
+            self.previous_positions = None  # Balle remise au centre : pas d'interpolation
+        self.sync_rects()
+        profiler.mark("update")
+        for event in events:
+            self.audio.trigger(event)
+        self.audio.flush()
+        profiler.mark("sound")
+
+
+    def seek_replay(self, frame):
         """
-        self.ball.x += self.ball_speed_x
-        self.ball.y += self.ball_speed_y
-
-        if self.ball.top <= 0 or self.ball.bottom >= self.height - 1:
-            self.ball_speed_y *= -1
-            self.pong_b.play()
-
-        if self.ball.colliderect(self.paddle_a):
-            self.ball.left = self.paddle_a.right
-            self.ball_speed_x *= -1
-            self.ping_a.play()
-
-        if self.ball.colliderect(self.paddle_b):
-            self.ball.right = self.paddle_b.left
-            self.ball_speed_x *= -1
-            self.ping_a.play()
-
-        if self.ball.left <= 0:
-            self.ping_pong_c.play()
-            self.score_b += 1
-            self.reset_game()
-            if self.score_b == WIN_SCORE:
-                self.winner = "Joueur B"
-                self.running = False
-
-        if self.ball.right >= self.width:
-            self.ping_pong_c.play()
-            self.score_a += 1
-            self.reset_game()
-            if self.score_a == WIN_SCORE:
-                self.winner = "Joueur A"
-                self.running = False
-
-
-    def reset_game(self):
+        En relecture, saute au pas `frame` du replay (restauration de l'image clé
+        précédente puis re-simulation des pas restants).
         """
-        Réinitialise le jeu en rétablissant la position de la ball, 
-        sa speed, les effets actifs et la taille des paddles.
+        frame = max(0, min(frame, len(self.replay.inputs)))
+        self.state = self.replay.seek(frame)
+        self.bonus = Bonus(self.state.bonus)
+        self.replay_frame = frame
+        self.previous_positions = None
+        self.replay_frames = self.replay.frames(frame)
+        self.previous_rects = None
+        self.sync_rects()
+
+
+    def positions(self):
+        """Retourne les positions mobiles de la simulation : balle (x, y), paddles A et B (y)."""
+        state = self.state
+        return state.ball.x, state.ball.y, state.paddle_a.y, state.paddle_b.y
+
+
+    def sync_rects(self, alpha=1.0):
         """
-        self.ball, self.ball_speed_x, self.ball_speed_y, self.last_speedup = reset_ball(self.width, self.height)
-        pygame.time.delay(RESET_DELAY_MS)
-        # Réinitialiser les effets de bonus
-        for effect in self.active_effects:
-            self.active_effects[effect] = False
-        self.paddle_a.height = settings.get_current_paddle_height()
-        self.paddle_b.height = settings.get_current_paddle_height()
+        Recopie les positions et tailles de la simulation dans les rectangles pygame
+        utilisés pour l'affichage (coordonnées de screen, voir render_scale).
+
+        Args:
+            alpha (float): Fraction du pas en cours déjà écoulée : les positions affichées
+                sont interpolées entre celles du pas précédent et celles du dernier pas.
+        """
+        state = self.state
+        scale = self.render_scale
+        ball_x, ball_y, paddle_a_y, paddle_b_y = current = self.positions()
+        if alpha < 1 and self.previous_positions is not None:
+            ball_x, ball_y, paddle_a_y, paddle_b_y = (
+                previous + (value - previous) * alpha
+                for previous, value in zip(self.previous_positions, current))
+        for rect, paddle, y in ((self.paddle_a, state.paddle_a, paddle_a_y),
+                                (self.paddle_b, state.paddle_b, paddle_b_y)):
+            rect.update(int(paddle.x * scale), int(y * scale),
+                        round(paddle.width * scale), int(paddle.height * scale))
+        size = round(state.ball.size * scale)
+        self.ball.update(int(ball_x * scale), int(ball_y * scale), size, size)
 
 
     def draw(self):
         """
         Dessine les éléments du jeu sur l'écran.
 
-        - Remplit l'écran avec une couleur de fond.
-        - Dessine les paddles, la ball, et une ligne centrale.
+        - Copie le fond statique du terrain (couleur de fond et ligne centrale).
+        - Dessine les paddles, la ball et le bonus.
         - Affiche le score et le temps écoulé.
         - Affiche un message de pause si le jeu est en pause.
+        - En capture vidéo, copie l'image (sans l'overlay) dans l'anneau de la capture.
         - Met à jour l'affichage de l'écran.
+
+        En mode dirty_rects, seules les zones occupées par les éléments mobiles à la frame
+        précédente sont effacées (recopiées depuis le fond), et seules ces zones et les nouvelles sont envoyées à l'écran
+        avec pygame.display.update au lieu de pygame.display.flip.
         """
-        self.screen.fill(BLACK)
-        pygame.draw.rect(self.screen, WHITE, self.paddle_a)
-        pygame.draw.rect(self.screen, WHITE, self.paddle_b)
-        pygame.draw.ellipse(self.screen, WHITE, self.ball)
-        pygame.draw.aaline(self.screen, WHITE, (self.width//2, 0), (self.width//2, self.height))
+        width, height = self.screen.get_size()
+        background = get_background(width, height)
+        if self.dirty_rects and self.previous_rects is not None:
+            self.screen.blits([(background, rect, rect) for rect in self.previous_rects], False)
+        else:
+            self.screen.blit(background, (0, 0))
+
+        rects = self.draw_elements()
+        self.profiler.mark("draw")
+        if self.capture is not None:
+            self.capture.capture(self.screen)  # Copie dans l'anneau, écrite par un thread
+        self.profiler.mark("capture")
+        rects.extend(self.profiler.draw(self.screen))
+        self.profiler.mark("overlay")
+
+        if self.dirty_rects and self.previous_rects is not None and self.window is None:
+            pygame.display.update(self.previous_rects + rects)
+        else:
+            self.present()
+        if self.dirty_rects:
+            self.previous_rects = rects
+        self.profiler.mark("present")
 
-        self.bonus.draw(self.screen)
 
-        score_text = self.font.render(f"{self.score_a} - {self.score_b}", True, WHITE)
-        self.screen.blit(score_text, (self.width//2 - score_text.get_width()//2, 20))
+    def present(self):
+        """
+        Envoie toute l'image à l'écran. En rendu à l'échelle, screen est d'abord agrandie
+        (pygame.transform.scale, sans lissage) dans la zone target de la fenêtre.
+        """
+        if self.window is not None:
+            pygame.transform.scale(self.screen, self.target.get_size(), self.target)
+        pygame.display.flip()
 
-        elapsed_time = format_time(pygame.time.get_ticks() - self.start_time)
-        time_text = self.font.render(f"Time: {elapsed_time}", True, WHITE)
-        time_y = self.height - int(self.height * TIME_Y_OFFSET)
-        self.screen.blit(time_text, (self.width//2 - time_text.get_width()//2, time_y))
 
-        if self.paused:
-            pause_text = self.font.render("PAUSE (SPACE)", True, WHITE)
-            self.screen.blit(pause_text, (self.width//2 - pause_text.get_width()//2, self.height//2))
+    def draw_elements(self):
+        """
+        Dessine les éléments qui changent d'une frame à l'autre (paddles, ball, bonus, textes).
 
-        pygame.display.flip()
+        Returns:
+            list: Rectangles des zones dessinées.
+        """
+        rects = [
+            pygame.draw.rect(self.screen, WHITE, self.paddle_a),
+            pygame.draw.rect(self.screen, WHITE, self.paddle_b)
+        ]
+        if self.state.balls is not None:
+            rects.extend(self.state.balls.draw(self.screen, self.render_scale))
+        else:
+            rects.append(pygame.draw.ellipse(self.screen, WHITE, self.ball))
+
+        rects.extend(self.bonus.draw(self.screen, self.state.time, self.render_scale))
+
+        width, height = self.screen.get_size()
+        score_text = render_text(self.font, f"{self.score_a} - {self.score_b}", WHITE)
+        score_y = round(SCORE_Y * self.render_scale)
+        rects.append(self.screen.blit(score_text, (width//2 - score_text.get_width()//2, score_y)))
+
+        elapsed_time = format_time(int(self.state.time))
+        time_text = render_text(self.font, f"Time: {elapsed_time}", WHITE)
+        time_y = height - int(height * TIME_Y_OFFSET)
+        rects.append(self.screen.blit(time_text, (width//2 - time_text.get_width()//2, time_y)))
+
+        if self.paused:
+            pause_text = render_text(self.font, "PAUSE (SPACE)", WHITE)
+            rects.append(self.screen.blit(pause_text, (width//2 - pause_text.get_width()//2, height//2)))
+        return rects
 
 
-    def show_winner(self):
+    def show_winner(self, prompt=None):
         """
         Affiche l'écran de fin avec le message du gagnant ou un message de fin de partie.
-        Remplit l'écran en noir, affiche le text centré, et attend 3 secondes avant de continuer.
+        Remplit l'écran en noir et affiche le texte centré, suivi du message prompt s'il
+        est donné.
         """
         self.screen.fill(BLACK)
         if self.winner:
             msg = f"{self.winner} GAGNE !"
         else:
             msg = "FIN DE LA PARTIE !"
-        text = self.font.render(msg, True, WHITE)
-        self.screen.blit(text, (self.width//2 - text.get_width()//2, self.height//2 - text.get_height()//2))
-        pygame.display.flip()
-        pygame.time.wait(WINNER_DISPLAY_MS)
+        text = render_text(self.font, msg, WHITE)
+        width, height = self.screen.get_size()
+        self.screen.blit(text, (width//2 - text.get_width()//2, height//2 - text.get_height()//2))
+        if prompt:
+            text = render_text(self.font, prompt, WHITE)
+            self.screen.blit(text, (width//2 - text.get_width()//2,
+                                    height//2 - text.get_height()//2 + round(END_TEXT_OFFSET_Y * self.render_scale)))
+        self.present()
+        self.previous_rects = None
+
+
+class WinnerScene(Scene):
+    """
+    Écran de fin d'une partie : le gagnant est affiché pendant WINNER_DISPLAY_MS
+    millisecondes (minuteur, la fenêtre reste réactive), puis, si prompt est vrai,
+    jusqu'à l'appui sur une touche. La scène se retire ensuite de la pile.
+
+    Attributs :
+        game (PongGame) : Partie terminée.
+        prompt (bool) : Attendre une touche après l'affichage du gagnant.
+        remaining (float) : Temps d'affichage restant avant l'invitation, en millisecondes.
+    """
+    PROMPT = "Appuyez sur une touche pour revenir au menu"
+
+    def __init__(self, game, prompt=True):
+        self.game = game
+        self.prompt = prompt
+        self.remaining = WINNER_DISPLAY_MS
+
+    def wait_ms(self):
+        """Réveille la boucle à la fin du minuteur, puis attend les touches."""
+        if self.remaining > 0:
+            return max(1, min(round(self.remaining), IDLE_REDRAW_MS))
+        return IDLE_REDRAW_MS
+
+    def handle_events(self, events):
+        """Une touche, après le minuteur, revient à la scène précédente."""
+        if self.remaining <= 0 and any(event.type == pygame.KEYDOWN for event in events):
+            self.manager.pop()
+
+    def frame(self, elapsed):
+        """Décompte le minuteur et redessine l'écran de fin."""
+        self.remaining -= elapsed
+        if self.remaining <= 0 and not self.prompt:
+            self.manager.pop()
+            return
+        self.game.show_winner(self.PROMPT if self.remaining <= 0 else None)
@@ -6,9 +6,11 @@ Fonctionnalités :
 - Affiche un menu principal avec jouer, paramètres ou quitter.
 - Gère les interactioxns utilisateur et événements Pygame.
 - Attend une entrée clavier avant de revenir au menu principal.
+- Une seule boucle principale (scenes.SceneManager) : menus, partie et écran de fin
+  sont des scènes empilées, aucune attente ne bloque la fenêtre.
 
 Fonctions :
-- wait_for_key(screen, font): Affiche un message et attend une touche.
+- new_game(): Crée une partie avec les paramètres actuels.
 - main(): Orchestration principale de l'application.
 
 Modules :
@@ -16,9 +18,12 @@ Modules :
 - pygame : Gestion graphique, événements et interactions utilisateur.
 - constants : width et height de l'écran.
 - menu : Menu principal et menu des paramètres.
+- scenes : Pile de scènes et boucle principale.
 - game : Classe PongGame pour la logique du jeu.
 - settings : Gestion des paramètres dynamiques du jeu.
 - os : Pour centrer la fenêtre de Pygame sur l'écran.
+- display : Fenêtre partagée, recréée seulement quand le mode change.
+- assets : Chargement des ressources en arrière-plan.
 
 Exécution :
 - À exécuter directement pour appeler la fonction main().
@@ -28,35 +33,34 @@ import sys
 import os
 # Pour centrer la fenêtre de Pygame sur l'écran
 os.environ['SDL_VIDEO_CENTERED'] = '1'
+import display
 import pygame
-from constants import WHITE, END_TEXT_OFFSET_Y, FONT_SIZE
-from menu import main_menu, parametres_menu
+from constants import FONT_SIZE, WIDTH, HEIGHT
+from menu import MainMenu, SettingsMenu
 from game import PongGame
-from settings import get_current_paddle_height, get_current_screen_size_label, get_current_screen_size
+from scenes import SceneManager
+from settings import get_current_paddle_height, get_current_render_scale
+from fonts import get_font
+from assets import preload
 
 
-def wait_for_key(screen, font):
+def new_game():
     """
-    Affiche un message à l'écran et attend qu'une touche soit pressée pour continuer.
+    Crée une partie avec la taille de paddle, la taille d'écran et l'échelle de rendu
+    actuellement sélectionnées.
 
-    Args:
-        screen (pygame.Surface): La surface de l'écran où le text sera affiché.
-        font (pygame.font.Font): La police utilisée pour rendre le text.
+    Returns:
+        PongGame: La partie, prête à être ajoutée à la pile de scènes.
     """
-    width = screen.get_width()
-    height = screen.get_height()
-    text = font.render("Appuyez sur une touche pour revenir au menu", True, WHITE)
-    screen.blit(text, (width // 2 - text.get_width() // 2,
-                       height // 2 - text.get_height() // 2 + END_TEXT_OFFSET_Y))
-    pygame.display.flip()
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                waiting = False
+    # Récupération de la taille du paddle
+    paddle_height = get_current_paddle_height()
+
+    # La fenêtre n'est recréée que si la taille choisie a changé
+    width, height = display.get_screen().get_size()
+    # Rendu à l'échelle : terrain de taille logique fixe, agrandi à la fenêtre
+    if get_current_render_scale() is not None:
+        width, height = WIDTH, HEIGHT
+    return PongGame(paddle_height, width, height)
 
 
 def main():
@@ -66,7 +70,8 @@ def main():
     Fonctionnalités :
     - Initialise Pygame et configure l'écran.
     - Affiche le menu principal et gère les choix de l'utilisateur.
-    - Lance le jeu Pong si l'utilisateur choisit "jouer".
+    - Lance le jeu Pong si l'utilisateur choisit "jouer" ; l'écran du gagnant puis le
+      retour au menu suivent la partie.
     - Affiche le menu des paramètres si l'utilisateur choisit "paramètres".
     - Quitte l'application si l'utilisateur choisit "quitter".
 
@@ -74,61 +79,23 @@ def main():
     liées à Pygame ou au système doivent être prises en compte dans les fonctions appelées.
 
     """
-    # Initialisation de Pygame
-    pygame.init()
-    # Initialisation de la taille d'écran
-    label = get_current_screen_size_label()
-    width, height = get_current_screen_size()
-    if label == "Fullscreen":
-        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        info = pygame.display.Info()
-        width, height = info.current_w, info.current_h
-    else:
-        screen = pygame.display.set_mode((width, height))
-
-    pygame.display.set_caption("Pong")
-    font = pygame.font.SysFont("Arial", FONT_SIZE)
-
-    # Boucle principale
-    while True:
-        choix = main_menu(screen, font)
-        if choix == "jouer":
-            # Récupération de la taille du paddle
-            paddle_height = get_current_paddle_height()
-
-            # Récupération de la taille de l'écran
-            width, height = get_current_screen_size()
-            label = get_current_screen_size_label()
-            if label == "Fullscreen":
-                screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-                info = pygame.display.Info()
-                width, height = info.current_w, info.current_h
-            else:
-                screen = pygame.display.set_mode((width, height))
-
-            # Création de l'objet PongGame et lancement du jeu
-            jeu = PongGame(paddle_height, width, height)
-            jeu.screen = screen
-            jeu.font = font
-            jeu.run(screen)
-            wait_for_key(screen, font)
-
-        # On entre dans le menu des paramètres
-        elif choix == "paramètres":
-            parametres_menu(screen, font)
-            width, height = get_current_screen_size()
-            label = get_current_screen_size_label()
-            if label == "Fullscreen":
-                screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-                info = pygame.display.Info()
-                width, height = info.current_w, info.current_h
-            else:
-                screen = pygame.display.set_mode((width, height))
-
-        # On quitte le jeu
-        elif choix == "quitter":
-            pygame.quit()
-            sys.exit()
+    # Ouverture de la fenêtre (affichage et polices seulement)
+    display.get_screen()
+    font = get_font("Arial", FONT_SIZE)
+
+    # Chargement des sons et images en arrière-plan pendant le premier menu
+    preload()
+    display.check_cold_start()
+
+    # Boucle principale : le menu principal reste au fond de la pile de scènes
+    manager = SceneManager()
+    manager.push(MainMenu(font, {"jouer": new_game,
+                                 "paramètres": lambda: SettingsMenu(font)}))
+    manager.run()
+
+    # On quitte le jeu
+    pygame.quit()
+    sys.exit()
 
 if __name__ == "__main__":
     main()
@@ -4,31 +4,38 @@ Ce fichier gère les menus du jeu Pong.
 Fonctions:
 - get_pos_x_titre(titre): Calcule la position X pour centrer le titre.
 - get_centered_y(text_surface, arrow_img): Calcule la position Y pour centrer une image par rapport à un text.
-- load_arrow(font): Charge/redimensionne l'image de la flèche.
-- main_menu(screen, font): Affiche le menu principal et gère la navigation.
-- parametres_menu(screen, font): Affiche le menu des paramètres et permet de modifier la taille des paddles.
+- load_arrow(font): Retourne l'image de la flèche à la taille du texte (registre des ressources).
+
+Classes:
+- Menu: Scène de menu (navigation haut/bas dans une liste d'options).
+- MainMenu: Menu principal (jouer, paramètres, quitter).
+- SettingsMenu: Menu des paramètres (tailles, ordinateur, rendu).
 
 Modules:
-- sys: Gestion de l'environnement Python.
-- os: Gestion des chemins de fichiers.
 - pygame: Bibliothèque pour créer des jeux.
 - constants: Contient toutes les constantes du jeu.
 - settings: Gère l'état mutable des paramètres.
+- assets: Registre des ressources (image de la flèche).
+- display: Fenêtre partagée (reprise à chaque retour sur un menu).
+- scenes: Scènes de la boucle principale.
 """
 
-import sys
-import os
 import pygame
 from constants import (
     WHITE, BLACK, POS_Y_TITRE, MENU_OPTIONS_SPACING,
     MENU_OPTIONS_START_Y, ALLIGN_TEXT_PADDING, PADDLE_SIZES
 )
 import settings
+from fonts import render_text
+import assets
+import display
+from scenes import Scene
 
 
 def load_arrow(font):
     """
-    Charge et redimensionne l'image de la flèche pour correspondre à la height du text.
+    Retourne l'image de la flèche redimensionnée à la height du text. L'image et chacune
+    de ses tailles viennent du registre des ressources (aucune lecture disque après la première).
 
     Args:
         font (pygame.font.Font): La police utilisée pour calculer la height du text.
@@ -36,14 +43,11 @@ def load_arrow(font):
     Returns:
         pygame.Surface: L'image redimensionnée de la flèche.
     """
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    arrow_path = os.path.join(base_dir, 'assets', 'arrow.png')
-    image = pygame.image.load(arrow_path).convert_alpha()
-    text_temp = font.render("Test", True, WHITE)
+    image = assets.load_image('arrow.png')
+    text_temp = render_text(font, "Test", WHITE)
     height_text = text_temp.get_height()
     width = int(image.get_width() * (height_text / image.get_height()))
-    image_resized = pygame.transform.smoothscale(image, (width, height_text))
-    return image_resized
+    return assets.get_scaled_image('arrow.png', (width, height_text))
 
 
 def get_pos_x_titre(titre, window_width):
@@ -74,25 +78,79 @@ def get_centered_y(text_surface, arrow_img):
     return (text_surface.get_height() - arrow_img.get_height()) // 2
 
 
-def main_menu(screen, font):
+class Menu(Scene):
+    """
+    Scène de menu : liste d'options parcourue avec les flèches haut et bas, la flèche de
+    sélection devant l'option choisie. Le menu n'est redessiné qu'après une entrée ou
+    toutes les IDLE_REDRAW_MS millisecondes.
+
+    Attributs :
+        font (pygame.font.Font) : Police des textes.
+        options (list) : Options du menu.
+        selection (int) : Index de l'option sélectionnée.
+        top_visible (int) : Index de la première option visible.
+        arrow_img (pygame.Surface) : Flèche de sélection.
+        screen (pygame.Surface) : Fenêtre, reprise chaque fois que le menu redevient actif.
     """
-    Affiche le menu principal du jeu Pong et gère la navigation entre les options.
+    options = []
+
+    def __init__(self, font):
+        self.font = font
+        self.selection = 0
+        self.top_visible = 0
+        self.arrow_img = load_arrow(font)
+        self.screen = None
+
+    def enter(self):
+        """Reprend la fenêtre, dont la taille a pu changer pendant la scène précédente."""
+        self.screen = display.get_screen()
+
+    def handle_events(self, events):
+        """Déplace la sélection (haut/bas) ; les autres touches vont à handle_key."""
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP:
+                    self.selection = (self.selection - 1) % len(self.options)
+                elif event.key == pygame.K_DOWN:
+                    self.selection = (self.selection + 1) % len(self.options)
+                else:
+                    self.handle_key(event.key)
+                if self.manager.top is not self:
+                    return  # Le menu a laissé place à une autre scène
 
-    Args:
-        screen (pygame.Surface): La surface d'affichage où le menu sera dessiné.
-        font (pygame.font.Font): La police utilisée pour afficher le text.
+    def handle_key(self, key):
+        """Traite une touche autre que haut/bas."""
 
-    Returns:
-        str: L'option sélectionnée par l'utilisateur ("jouer", "paramètres" ou "quitter").
+
+class MainMenu(Menu):
+    """
+    Menu principal du jeu Pong.
+
+    Attributs :
+        actions (dict) : Option ("jouer", "paramètres") → fonction retournant la scène à
+            ouvrir. "Quitter" vide la pile de scènes.
     """
     options = ["Jouer", "Paramètres", "Quitter"]
-    selection = 0
-    top_visible = 0  # Index de la première option visible
-    arrow_img = load_arrow(font)
 
-    while True:
+    def __init__(self, font, actions):
+        super().__init__(font)
+        self.actions = actions
+
+    def handle_key(self, key):
+        """Ouvre la scène de l'option validée avec Entrée."""
+        if key == pygame.K_RETURN or key == pygame.K_KP_ENTER:
+            choix = self.options[self.selection].lower()
+            if choix == "quitter":
+                self.manager.clear()
+            else:
+                self.manager.push(self.actions[choix]())
+
+    def frame(self, elapsed):
+        """Dessine le menu principal."""
+        screen, font, arrow_img = self.screen, self.font, self.arrow_img
+        options, selection = self.options, self.selection
         screen.fill(BLACK)
-        titre = font.render("PONG", True, WHITE)
+        titre = render_text(font, "PONG", WHITE)
 
         # Calcul de l'espace disponible et du nombre d'options visibles
         screen_height = screen.get_height()
@@ -101,10 +159,11 @@ def main_menu(screen, font):
         max_visible = max(1, available_height // MENU_OPTIONS_SPACING)  # Au moins 1 option visible
 
         # Ajuster top_visible pour que la sélection soit toujours visible
-        if selection < top_visible:
-            top_visible = selection
-        elif selection >= top_visible + max_visible:
-            top_visible = selection - max_visible + 1
+        if selection < self.top_visible:
+            self.top_visible = selection
+        elif selection >= self.top_visible + max_visible:
+            self.top_visible = selection - max_visible + 1
+        top_visible = self.top_visible
         # Afficher le titre en haut et centré
         title_y = int(screen.get_height() * 0.1)
         screen.blit(titre, (get_pos_x_titre(titre, screen.get_width()), title_y))
@@ -112,7 +171,7 @@ def main_menu(screen, font):
         # Afficher seulement les options visibles
         for i in range(top_visible, min(top_visible + max_visible, len(options))):
             option = options[i]
-            text_surface = font.render(option, True, WHITE)
+            text_surface = render_text(font, option, WHITE)
             x_text = get_pos_x_titre(text_surface, screen.get_width())
             # Espace de l'option = (index visible - 0) * espacement + décalage du titre
             title_gap = title_y + titre.get_height() + 30
@@ -128,61 +187,88 @@ def main_menu(screen, font):
         # Indicateurs de défilement si nécessaire
         if top_visible > 0:
             # Afficher indicateur "plus d'options au-dessus"
-            up_text = font.render("▲", True, WHITE)
+            up_text = render_text(font, "▲", WHITE)
             screen.blit(up_text, (screen.get_width() // 2, title_padding // 4))
 
         if top_visible + max_visible < len(options):
             # Afficher indicateur "plus d'options en-dessous"
-            down_text = font.render("▼", True, WHITE)
+            down_text = render_text(font, "▼", WHITE)
             screen.blit(down_text, (screen.get_width() // 2, screen_height - 20))
 
         pygame.display.flip()
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    selection = (selection - 1) % len(options)
-                elif event.key == pygame.K_DOWN:
-                    selection = (selection + 1) % len(options)
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
-                    return options[selection].lower()
-
 
-def parametres_menu(screen, font):
+class SettingsMenu(Menu):
     """
-    Affiche le menu des paramètres et permet de modifier la taille des paddles.
-    Navigation identique au menu principal.
+    Menu des paramètres : les flèches gauche et droite modifient l'option sélectionnée.
+    Navigation identique au menu principal ; "Retour" revient à la scène précédente.
     """
-    options = ["Taille des paddles", "Taille de la balle", "Taille de l'écran", "Retour"]
-    selection = 0
-    top_visible = 0  # Index de la première option visible
-    arrow_img = load_arrow(font)
-
-    while True:
-        # Affichage du menu
+    options = ["Taille des paddles", "Taille de la balle", "Taille de l'écran",
+               "Ordinateur", "Niveau", "Rendu", "Retour"]
+
+    def handle_key(self, key):
+        """Modifie le paramètre sélectionné (gauche/droite) ou revient au menu (Entrée sur Retour)."""
+        selection = self.selection
+        # Modification de la taille des raquettes
+        if key == pygame.K_LEFT and selection == 0:
+            settings.CURRENT_PADDLE_SIZE_INDEX = (settings.CURRENT_PADDLE_SIZE_INDEX - 1) % len(PADDLE_SIZES)
+        elif key == pygame.K_RIGHT and selection == 0:
+            settings.CURRENT_PADDLE_SIZE_INDEX = (settings.CURRENT_PADDLE_SIZE_INDEX + 1) % len(PADDLE_SIZES)
+
+        # Modification de la taille de la balle
+        elif key == pygame.K_LEFT and selection == 1:
+            settings.CURRENT_BALL_SIZE_INDEX = (settings.CURRENT_BALL_SIZE_INDEX - 1) % len(settings.BALL_SIZES)
+        elif key == pygame.K_RIGHT and selection == 1:
+            settings.CURRENT_BALL_SIZE_INDEX = (settings.CURRENT_BALL_SIZE_INDEX + 1) % len(settings.BALL_SIZES)
+
+        # Modification de la taille de l'écran
+        elif key == pygame.K_LEFT and selection == 2:
+            settings.taille_ecran_precedente()
+        elif key == pygame.K_RIGHT and selection == 2:
+            settings.taille_ecran_suivante()
+
+        # Joueur tenu par l'ordinateur et son niveau
+        elif key in (pygame.K_LEFT, pygame.K_RIGHT) and selection == 3:
+            step = 1 if key == pygame.K_RIGHT else -1
+            settings.CURRENT_AI_SIDE_INDEX = (settings.CURRENT_AI_SIDE_INDEX + step) % len(settings.AI_SIDES)
+        elif key in (pygame.K_LEFT, pygame.K_RIGHT) and selection == 4:
+            step = 1 if key == pygame.K_RIGHT else -1
+            settings.CURRENT_AI_LEVEL_INDEX = (settings.CURRENT_AI_LEVEL_INDEX + step) % len(settings.AI_LEVELS)
+
+        # Échelle du rendu
+        elif key in (pygame.K_LEFT, pygame.K_RIGHT) and selection == 5:
+            step = 1 if key == pygame.K_RIGHT else -1
+            settings.CURRENT_RENDER_SCALE_INDEX = (settings.CURRENT_RENDER_SCALE_INDEX + step) % len(settings.RENDER_SCALES)
+
+        # Retour au menu principal
+        elif (key == pygame.K_RETURN or key == pygame.K_KP_ENTER) and selection == 6:
+            self.manager.pop()
+
+    def frame(self, elapsed):
+        """Dessine le menu des paramètres avec la valeur actuelle de chaque option."""
+        screen, font, arrow_img = self.screen, self.font, self.arrow_img
+        options, selection = self.options, self.selection
         screen.fill(BLACK)
-        titre = font.render("PARAMÈTRES", True, WHITE)
+        titre = render_text(font, "PARAMÈTRES", WHITE)
         titre_height = titre.get_height()
-        
+
         # Calcul de l'espace disponible et du nombre d'options visibles
         screen_height = screen.get_height()
         title_y = int(screen_height * 0.1)  # 10% of screen height for title position
         available_height = screen_height - (title_y + titre_height + 30) - 40  # Available height for options
         max_visible = max(1, available_height // MENU_OPTIONS_SPACING)  # At least 1 option visible
-        
+
         # Ajuster top_visible pour que la sélection soit toujours visible
-        if selection < top_visible:
-            top_visible = selection
-        elif selection >= top_visible + max_visible:
-            top_visible = selection - max_visible + 1
-            
+        if selection < self.top_visible:
+            self.top_visible = selection
+        elif selection >= self.top_visible + max_visible:
+            self.top_visible = selection - max_visible + 1
+        top_visible = self.top_visible
+
         # Afficher le titre en haut et centré
         screen.blit(titre, (get_pos_x_titre(titre, screen.get_width()), title_y))
         title_gap = title_y + titre_height + 30  # 30 pixels extra space
-        
+
         # Préparer et afficher les options visibles avec leurs valeurs actuelles
         for i in range(top_visible, min(top_visible + max_visible, len(options))):
             # Déterminer le texte à afficher selon l'option
@@ -195,62 +281,34 @@ def parametres_menu(screen, font):
             elif i == 2:
                 screen_label = settings.get_current_screen_size_label()
                 text = f"Taille de l'écran : [{screen_label}]"
+            elif i == 3:
+                text = f"Ordinateur : [{settings.get_current_ai_side_name()}]"
+            elif i == 4:
+                text = f"Niveau : [{settings.get_current_ai_level_name()}]"
+            elif i == 5:
+                text = f"Rendu : [{settings.get_current_render_scale_name()}]"
             else:
                 text = options[i]
-                
+
             # Rendu et affichage du texte (USING SCROLLABLE POSITIONING)
-            text_surface = font.render(text, True, WHITE)
+            text_surface = render_text(font, text, WHITE)
             x_text = get_pos_x_titre(text_surface, screen.get_width())
             y_text = (i - top_visible) * MENU_OPTIONS_SPACING + title_gap
             screen.blit(text_surface, (x_text, y_text))
-            
+
             # Afficher la flèche de sélection
             if i == selection:
                 x_arrow = x_text - arrow_img.get_width() - ALLIGN_TEXT_PADDING
                 y_arrow = y_text + get_centered_y(text_surface, arrow_img)
                 screen.blit(arrow_img, (x_arrow, y_arrow))
-                
+
         # Indicateurs de défilement si nécessaire
         if top_visible > 0:
-            up_text = font.render("▲", True, WHITE)
+            up_text = render_text(font, "▲", WHITE)
             screen.blit(up_text, (screen.get_width() // 2, title_y // 2))
-            
+
         if top_visible + max_visible < len(options):
-            down_text = font.render("▼", True, WHITE)
+            down_text = render_text(font, "▼", WHITE)
             screen.blit(down_text, (screen.get_width() // 2, screen_height - 20))
-            
+
         pygame.display.flip()
-        
-        # Gestion des événements
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-                
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    selection = (selection - 1) % len(options)
-                elif event.key == pygame.K_DOWN:
-                    selection = (selection + 1) % len(options)
-                    
-                # Modification de la taille des raquettes
-                elif event.key == pygame.K_LEFT and selection == 0:
-                    settings.CURRENT_PADDLE_SIZE_INDEX = (settings.CURRENT_PADDLE_SIZE_INDEX - 1) % len(PADDLE_SIZES)
-                elif event.key == pygame.K_RIGHT and selection == 0:
-                    settings.CURRENT_PADDLE_SIZE_INDEX = (settings.CURRENT_PADDLE_SIZE_INDEX + 1) % len(PADDLE_SIZES)
-                    
-                # Modification de la taille de la balle
-                elif event.key == pygame.K_LEFT and selection == 1:
-                    settings.CURRENT_BALL_SIZE_INDEX = (settings.CURRENT_BALL_SIZE_INDEX - 1) % len(settings.BALL_SIZES)
-                elif event.key == pygame.K_RIGHT and selection == 1:
-                    settings.CURRENT_BALL_SIZE_INDEX = (settings.CURRENT_BALL_SIZE_INDEX + 1) % len(settings.BALL_SIZES)
-                    
-                # Modification de la taille de l'écran
-                elif event.key == pygame.K_LEFT and selection == 2:
-                    settings.taille_ecran_precedente()
-                elif event.key == pygame.K_RIGHT and selection == 2:
-                    settings.taille_ecran_suivante()
-                    
-                # Retour au menu principal
-                elif (event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER) and selection == 3:
-                    return
@@ -0,0 +1,275 @@
+"""
+Module multiball.py
+Mode multiball : le bonus divise les balles qui le touchent, et des centaines ou des
+milliers de balles peuvent être en jeu en même temps.
+
+Les balles sont stockées dans des tableaux NumPy (position et vitesse, une case par
+balle). Les collisions avec les murs, les paddles et le bonus sont calculées en une
+seule passe vectorisée pour toutes les balles (mêmes règles que simulation.move_ball :
+déplacement balayé, rebonds exacts), et l'affichage copie le même sprite à toutes les
+positions en un seul appel (pygame.Surface.blits).
+
+Règles : chaque balle qui sort du terrain donne un point à l'adversaire et disparaît ;
+quand il n'en reste plus, une balle est servie au centre comme après un point normal.
+state.ball suit la première balle (contrôleurs de l'ordinateur, affichage du score).
+
+Classes:
+    - BallArray: Balles d'une partie en mode multiball.
+Fonctions:
+    - enable(state): Passe une partie en mode multiball.
+    - get_ball_sprite(size): Retourne le sprite d'une balle, dessiné une seule fois.
+
+Dépendances:
+    - numpy
+"""
+
+from itertools import repeat
+import numpy as np
+import pygame
+from constants import WHITE, BLACK, MULTIBALL_SPLIT, MULTIBALL_SPREAD, MULTIBALL_MAX_BALLS
+import simulation
+
+_sprites = {}
+
+
+class BallArray:
+    """
+    Balles d'une partie en mode multiball, en structure de tableaux.
+
+    Attributs :
+        size (int) : Taille des balles.
+        count (int) : Nombre de balles en jeu (les tableaux sont remplis de 0 à count).
+        x, y, speed_x, speed_y (np.ndarray) : Position et vitesse des balles, de taille
+            MULTIBALL_MAX_BALLS.
+
+    Méthodes :
+        reset(ball) : Ne garde qu'une balle, copie de ball (simulation.Ball).
+        add(x, y, speed_x, speed_y) : Ajoute des balles (dans la limite de MULTIBALL_MAX_BALLS).
+        keep(mask) : Ne garde que les balles sélectionnées.
+        split(mask) : Divise les balles sélectionnées.
+        speed_up(factor) : Accélère toutes les balles.
+        move(state, scale, events) : Déplace les balles et gère collisions et points.
+        draw(screen, scale) : Dessine toutes les balles.
+    """
+    def __init__(self, ball, capacity=MULTIBALL_MAX_BALLS):
+        self.size = ball.size
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.speed_x = np.zeros(capacity)
+        self.speed_y = np.zeros(capacity)
+        self.count = 0
+        self.reset(ball)
+
+
+    def reset(self, ball):
+        """Ne garde qu'une balle, copie de ball (simulation.Ball)."""
+        self.count = 0
+        self.add([ball.x], [ball.y], [ball.speed_x], [ball.speed_y])
+
+
+    def add(self, x, y, speed_x, speed_y):
+        """
+        Ajoute des balles. Celles qui dépassent MULTIBALL_MAX_BALLS sont ignorées.
+
+        Args:
+            x, y, speed_x, speed_y (array-like): Position et vitesse des nouvelles balles.
+        """
+        start = self.count
+        count = min(len(x), len(self.x) - start)
+        end = start + count
+        self.x[start:end] = x[:count]
+        self.y[start:end] = y[:count]
+        self.speed_x[start:end] = speed_x[:count]
+        self.speed_y[start:end] = speed_y[:count]
+        self.count = end
+
+
+    def keep(self, mask):
+        """Ne garde que les balles sélectionnées (masque de taille count), dans l'ordre."""
+        n = self.count
+        kept = int(np.count_nonzero(mask))
+        for values in (self.x, self.y, self.speed_x, self.speed_y):
+            values[:kept] = values[:n][mask]
+        self.count = kept
+
+
+    def split(self, mask):
+        """
+        Divise les balles sélectionnées : chacune garde sa trajectoire et est rejointe par
+        MULTIBALL_SPLIT - 1 balles de même vitesse, tournées de ±MULTIBALL_SPREAD,
+        ±2 MULTIBALL_SPREAD... radians.
+        """
+        n = self.count
+        x, y = self.x[:n][mask], self.y[:n][mask]
+        speed_x, speed_y = self.speed_x[:n][mask], self.speed_y[:n][mask]
+        for k in range(1, MULTIBALL_SPLIT):
+            angle = (k + 1) // 2 * MULTIBALL_SPREAD * (1 if k % 2 else -1)
+            cos, sin = np.cos(angle), np.sin(angle)
+            self.add(x, y, speed_x * cos - speed_y * sin, speed_x * sin + speed_y * cos)
+
+
+    def speed_up(self, factor):
+        """Accélère toutes les balles."""
+        n = self.count
+        self.speed_x[:n] *= factor
+        self.speed_y[:n] *= factor
+
+
+    def paddle_impact(self, dx, dy, face, paddle, crossing):
+        """
+        Fraction du déplacement à laquelle chaque balle touche la face avant d'un paddle
+        (inf si pas de contact pendant ce déplacement).
+        """
+        n = self.count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(crossing, (face - self.x[:n]) / dx, np.inf)
+        y = self.y[:n] + dy * np.where(crossing, t, 0)
+        touching = crossing & (y < paddle.y + paddle.height) & (paddle.y < y + self.size)
+        return np.where(touching, t, np.inf)
+
+
+    def move(self, state, scale, events):
+        """
+        Déplace toutes les balles en une passe vectorisée : rebonds sur les murs et les
+        paddles, division des balles qui touchent le bonus, points marqués.
+        Chaque type d'événement est ajouté au plus une fois par pas (un son par frame).
+
+        Args:
+            state (simulation.MatchState): État de la partie.
+            scale (float): Durée du pas en frames de référence.
+            events (list): Événements du pas (voir simulation.step), complétés sur place.
+        """
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        speed_x, speed_y = self.speed_x[:n], self.speed_y[:n]
+        size = self.size
+        bottom = state.height - 1 - size
+        paddle_a, paddle_b = state.paddle_a, state.paddle_b
+        face_a = paddle_a.x + paddle_a.width
+        face_b = paddle_b.x - size
+        wall_hits = paddle_hits = False
+
+        remaining = np.ones(n)
+        for _ in range(simulation.MAX_BOUNCES_PER_STEP):
+            active = remaining > 0
+            if not active.any():
+                break
+            dx = speed_x * scale * remaining
+            dy = speed_y * scale * remaining
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t_wall = np.where((dy < 0) & (y + dy <= 0), np.maximum(0, y / -dy), np.inf)
+                t_wall = np.where((dy > 0) & (y + dy >= bottom), np.maximum(0, (bottom - y) / dy), t_wall)
+            t_a = self.paddle_impact(dx, dy, face_a, paddle_a, (dx < 0) & (x >= face_a) & (x + dx < face_a))
+            t_b = self.paddle_impact(dx, dy, face_b, paddle_b, (dx > 0) & (x <= face_b) & (x + dx > face_b))
+
+            t = np.minimum(np.minimum(t_wall, t_a), t_b)
+            hit = active & (t <= 1)
+            t = np.where(hit, t, 1.0)
+            x += dx * t
+            y += dy * t
+
+            wall = hit & (t_wall == t)
+            paddle = hit & ~wall
+            speed_y[wall] *= -1
+            speed_x[paddle] *= -1
+            wall_hits |= wall.any()
+            paddle_hits |= paddle.any()
+            remaining = np.where(hit, remaining * (1 - t), 0.0)
+
+        # Paddle déplacé sur une balle : on la repousse devant sa face
+        overlap_a = ((y < paddle_a.y + paddle_a.height) & (paddle_a.y < y + size)
+                     & (x < face_a) & (paddle_a.x < x + size))
+        x[overlap_a] = face_a
+        speed_x[overlap_a] = np.abs(speed_x[overlap_a])
+        overlap_b = (~overlap_a & (y < paddle_b.y + paddle_b.height) & (paddle_b.y < y + size)
+                     & (x < paddle_b.x + paddle_b.width) & (paddle_b.x < x + size))
+        x[overlap_b] = face_b
+        speed_x[overlap_b] = -np.abs(speed_x[overlap_b])
+        paddle_hits |= overlap_a.any() or overlap_b.any()
+
+        if wall_hits:
+            events.append(simulation.EVENT_WALL)
+        if paddle_hits:
+            events.append(simulation.EVENT_PADDLE)
+
+        # Balles qui touchent le bonus : elles se divisent et le bonus disparaît
+        bonus = state.bonus
+        if bonus.active:
+            bonus_size = bonus.radius * 2
+            touching = ((x < bonus.x + bonus_size) & (bonus.x < x + size)
+                        & (y < bonus.y + bonus_size) & (bonus.y < y + size))
+            if touching.any():
+                bonus.active = False
+                events.append(simulation.EVENT_BONUS)
+                self.split(touching)
+
+        # Balles sorties : un point par balle, puis service quand il n'en reste plus
+        n = self.count
+        x = self.x[:n]
+        point_b = x <= 0
+        point_a = ~point_b & (x + size >= state.width)
+        out = point_a | point_b
+        if out.any():
+            for player, points in (("a", point_a), ("b", point_b)):
+                for _ in range(int(np.count_nonzero(points))):
+                    if state.running:
+                        simulation.award_point(state, player, events)
+            self.keep(~out)
+            if self.count == 0:
+                simulation.restart_rally(state)
+                self.reset(state.ball)
+        self.sync(state.ball)
+
+
+    def sync(self, ball):
+        """Recopie la première balle dans ball (simulation.Ball)."""
+        if self.count:
+            ball.x, ball.y = float(self.x[0]), float(self.y[0])
+            ball.speed_x, ball.speed_y = float(self.speed_x[0]), float(self.speed_y[0])
+
+
+    def draw(self, screen, scale=1):
+        """
+        Dessine toutes les balles en un seul appel (pygame.Surface.blits).
+
+        Args:
+            screen (pygame.Surface): Surface de destination.
+            scale (float): Facteur entre les coordonnées du terrain et celles de screen.
+
+        Returns:
+            list: Rectangles des zones dessinées.
+        """
+        n = self.count
+        sprite = get_ball_sprite(max(1, round(self.size * scale)))
+        positions = zip((self.x[:n] * scale).astype(int).tolist(), (self.y[:n] * scale).astype(int).tolist())
+        return screen.blits(zip(repeat(sprite), positions))
+
+
+def enable(state):
+    """
+    Passe une partie en mode multiball, à partir de sa balle actuelle.
+
+    Returns:
+        BallArray: Les balles de la partie (aussi dans state.balls).
+    """
+    state.balls = BallArray(state.ball)
+    return state.balls
+
+
+def get_ball_sprite(size):
+    """
+    Retourne le sprite d'une balle de la taille demandée, dessiné une seule fois.
+    La transparence passe par une couleur clé compressée (RLEACCEL) plutôt que par un
+    canal alpha : la copie de milliers de sprites est deux fois plus rapide.
+    """
+    sprite = _sprites.get(size)
+    if sprite is None:
+        sprite = pygame.Surface((size, size))
+        pygame.draw.ellipse(sprite, WHITE, sprite.get_rect())
+        sprite.set_colorkey(BLACK, pygame.RLEACCEL)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+            _sprites[size] = sprite
+    return sprite
+
@@ -0,0 +1,722 @@
+"""
+Jeu en réseau : serveur UDP asyncio faisant autorité, clients avec prédiction locale.
+
+Le serveur fait tourner la simulation de chaque partie (un seul processus peut en héberger
+des centaines) et envoie régulièrement aux deux joueurs un état compact de la partie.
+Chaque client envoie ses directions numérotées, déplace son propre paddle immédiatement
+(prédiction) puis, à chaque état reçu, repart de la position donnée par le serveur et
+réapplique les directions que le serveur n'a pas encore traitées (réconciliation).
+
+Une couche NetworkConditions ajoute une latence, une gigue et des pertes artificielles
+aux envois, pour tester le jeu en local (loopback) dans des conditions réalistes.
+
+Messages (little-endian, premier octet = type) :
+- JOIN (client → serveur) : code de la partie souhaitée (0 = première partie libre).
+- WELCOME (serveur → client) : code de la partie, côté attribué, graine et paramètres.
+- REFUSED (serveur → client) : la partie demandée est complète ou terminée (code, raison).
+- INPUT (client → serveur) : numéro de la dernière direction puis les INPUT_REDUNDANCY
+  dernières directions (les pertes isolées sont ainsi compensées).
+- STATE (serveur → client) : pas du serveur, dernière direction traitée pour ce client,
+  balle, paddles, scores, effets, bonus (apparition et collecte comprises) et événements
+  des pas écoulés depuis l'état précédent (un bit par type, pour les sons du client ;
+  un état perdu perd aussi ses sons).
+- LEAVE (client → serveur) : le client quitte la partie.
+
+Classes :
+- NetworkConditions : Latence, gigue et pertes simulées.
+- PongServer : Serveur hébergeant les parties.
+- PongClient : Client avec prédiction et réconciliation.
+
+Exemple :
+    python network.py server --port 9999
+    python network.py server --port 9999 --broadcast-port 9998 --broadcast-code 1
+    python network.py client 127.0.0.1 9999
+    python network.py loopback --matches 200 --seconds 10 --latency 60 --jitter 10 --loss 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import struct
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from constants import WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, FRAME_MS, WINNER_DISPLAY_MS
+import simulation
+
+JOIN, WELCOME, INPUT, STATE, LEAVE, REFUSED = range(1, 7)
+
+JOIN_PACKET = struct.Struct("<BI")
+WELCOME_PACKET = struct.Struct("<BIBIHHHH")
+REFUSED_PACKET = struct.Struct("<BIB")
+INPUT_HEADER = struct.Struct("<BIB")
+STATE_PACKET = struct.Struct("<BIIIffffffHHBBBBbhhIIB")
+
+INPUT_REDUNDANCY = 8      # Directions renvoyées dans chaque paquet INPUT
+MAX_INPUT_QUEUE = 4       # Directions en attente au-delà desquelles le serveur rattrape son retard
+MAX_PENDING_INPUTS = 120  # Directions non confirmées gardées par le client (2 secondes)
+SNAPSHOT_INTERVAL = 2     # Un état envoyé tous les 2 pas (30 par seconde)
+CLIENT_TIMEOUT_S = 5.0    # Un joueur silencieux pendant cette durée est déconnecté
+FINISHED_LINGER_S = 2.0   # Durée pendant laquelle l'état final est encore envoyé
+JOIN_RETRY_S = 0.5        # Renvoi de JOIN tant que le serveur n'a pas répondu
+
+REFUSED_FULL = 1
+REFUSED_FINISHED = 2
+REFUSED_REASONS = {REFUSED_FULL: "complète", REFUSED_FINISHED: "terminée"}
+
+FLAG_RUNNING = 1
+FLAG_BONUS = 2
+FLAG_WINNER_A = 4
+FLAG_WINNER_B = 8
+FLAG_COLLECTED_A = 16
+FLAG_COLLECTED_B = 32
+
+# Bit de chaque événement de la simulation dans un paquet STATE
+EVENT_BITS = {simulation.EVENT_WALL: 1, simulation.EVENT_PADDLE: 2,
+              simulation.EVENT_POINT: 4, simulation.EVENT_BONUS: 8}
+
+
+class NetworkConditions:
+    """
+    Simule un réseau imparfait sur les envois : latence, gigue et pertes de paquets.
+
+    Attributs :
+        latency_ms (float) : Délai ajouté à chaque paquet.
+        jitter_ms (float) : Variation aléatoire maximale du délai.
+        loss (float) : Probabilité de perte d'un paquet (0 à 1).
+        rng (random.Random) : Générateur aléatoire (graine fixe pour des tests reproductibles).
+        sent, dropped (int) : Compteurs de paquets.
+    """
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, loss=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.sent = 0
+        self.dropped = 0
+
+    def sendto(self, transport, data, addr=None):
+        """Envoie un paquet à travers les conditions simulées."""
+        self.sent += 1
+        if self.loss and self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        if not self.latency_ms and not self.jitter_ms:
+            transport.sendto(data, addr)
+            return
+        delay = (self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+        if delay <= 0:
+            transport.sendto(data, addr)
+            return
+        asyncio.get_running_loop().call_later(delay, deliver, transport, data, addr)
+
+
+def deliver(transport, data, addr):
+    """Envoie un paquet retardé si le transport est toujours ouvert."""
+    if not transport.is_closing():
+        transport.sendto(data, addr)
+
+
+def pack_flags(state):
+    """
+    Regroupe les indicateurs de la partie et les effets actifs en deux champs de bits.
+
+    Returns:
+        tuple: (flags, effects) : FLAG_* combinés, et un bit par effet de EFFECT_NAMES.
+    """
+    flags = FLAG_RUNNING if state.running else 0
+    if state.bonus.active:
+        flags |= FLAG_BONUS
+    if state.winner == "Joueur A":
+        flags |= FLAG_WINNER_A
+    elif state.winner == "Joueur B":
+        flags |= FLAG_WINNER_B
+    if state.bonus.collected_by == "a":
+        flags |= FLAG_COLLECTED_A
+    elif state.bonus.collected_by == "b":
+        flags |= FLAG_COLLECTED_B
+    effects = 0
+    for i, name in enumerate(simulation.EFFECT_NAMES):
+        if state.active_effects[name]:
+            effects |= 1 << i
+    return flags, effects
+
+
+def unpack_flags(state, flags, effects):
+    """
+    Recopie dans la partie les champs de bits produits par pack_flags. Un effet terminé
+    perd sa fin programmée ; un effet activé par le serveur reste actif jusqu'à ce que
+    le serveur le termine.
+    """
+    state.running = bool(flags & FLAG_RUNNING)
+    state.winner = ("Joueur A" if flags & FLAG_WINNER_A
+                    else "Joueur B" if flags & FLAG_WINNER_B else None)
+    state.bonus.active = bool(flags & FLAG_BONUS)
+    state.bonus.collected_by = ("a" if flags & FLAG_COLLECTED_A
+                                else "b" if flags & FLAG_COLLECTED_B else None)
+    for i, name in enumerate(simulation.EFFECT_NAMES):
+        state.active_effects[name] = bool(effects >> i & 1)
+        if not state.active_effects[name]:
+            state.effect_expiry.pop(name, None)
+
+
+def encode_state(state, tick, ack, events=0):
+    """
+    Encode l'état d'une partie dans un paquet STATE.
+
+    Args:
+        state (MatchState): Partie à encoder.
+        tick (int): Numéro du pas du serveur.
+        ack (int): Numéro de la dernière direction du destinataire appliquée.
+        events (int): Événements survenus depuis l'état précédent (bits de EVENT_BITS).
+    """
+    ball, paddle_a, paddle_b, bonus = state.ball, state.paddle_a, state.paddle_b, state.bonus
+    flags, effects = pack_flags(state)
+    return STATE_PACKET.pack(
+        STATE, tick, ack, int(state.time),
+        ball.x, ball.y, ball.speed_x, ball.speed_y, paddle_a.y, paddle_b.y,
+        int(paddle_a.height), int(paddle_b.height), state.score_a, state.score_b,
+        flags, effects, -1 if bonus.type is None else bonus.type, int(bonus.x), int(bonus.y),
+        int(bonus.spawn_time), int(bonus.collected_time), events)
+
+
+def apply_state(state, data):
+    """
+    Recopie un paquet STATE dans une partie locale.
+
+    Returns:
+        tuple: (tick, ack, events) du paquet.
+    """
+    (_, tick, ack, game_time, ball_x, ball_y, speed_x, speed_y, paddle_a_y, paddle_b_y,
+     paddle_a_height, paddle_b_height, score_a, score_b, flags, effects,
+     bonus_type, bonus_x, bonus_y, spawn_time, collected_time, events) = STATE_PACKET.unpack(data)
+    state.time = game_time
+    ball = state.ball
+    ball.x, ball.y, ball.speed_x, ball.speed_y = ball_x, ball_y, speed_x, speed_y
+    state.paddle_a.y, state.paddle_b.y = paddle_a_y, paddle_b_y
+    state.score_a, state.score_b = score_a, score_b
+    unpack_flags(state, flags, effects)
+    simulation.apply_effects(state)
+    state.paddle_a.height, state.paddle_b.height = paddle_a_height, paddle_b_height
+    bonus = state.bonus
+    bonus.type = None if bonus_type < 0 else bonus_type
+    bonus.x, bonus.y = bonus_x, bonus_y
+    bonus.spawn_time, bonus.collected_time = spawn_time, collected_time
+    return tick, ack, events
+
+
+class PlayerSlot:
+    """
+    Joueur connecté à une partie du serveur.
+
+    Attributs :
+        addr (tuple) : Adresse UDP du client.
+        queue (deque) : Directions reçues, pas encore appliquées.
+        last_seq (int) : Numéro de la dernière direction reçue.
+        ack (int) : Numéro de la dernière direction appliquée.
+        last_seen (float) : Instant du dernier paquet reçu.
+    """
+    def __init__(self, addr, now):
+        self.addr = addr
+        self.queue = deque()
+        self.last_seq = 0
+        self.ack = 0
+        self.last_seen = now
+
+    def receive(self, seq, directions, now):
+        """Ajoute à la file les directions plus récentes que la dernière reçue."""
+        self.last_seen = now
+        first_seq = seq - len(directions) + 1
+        for offset, direction in enumerate(directions):
+            if first_seq + offset > self.last_seq:
+                self.queue.append((first_seq + offset, direction))
+        self.last_seq = max(self.last_seq, seq)
+
+    def catch_up(self, paddle, height):
+        """
+        Applique tout de suite les directions en retard au-delà de MAX_INPUT_QUEUE
+        (paquets arrivés en rafale après une gigue), sans en perdre aucune.
+        """
+        while len(self.queue) > MAX_INPUT_QUEUE:
+            self.ack, direction = self.queue.popleft()
+            simulation.move_paddle(paddle, direction, height, 1)
+
+    def next_direction(self):
+        """
+        Retourne la direction à appliquer pour ce pas. Chaque direction reçue est appliquée
+        une seule fois (immobile si la file est vide), comme dans la prédiction du client.
+        """
+        if not self.queue:
+            return 0
+        self.ack, direction = self.queue.popleft()
+        return direction
+
+
+class ServerMatch:
+    """
+    Partie hébergée par le serveur.
+
+    Attributs :
+        code (int) : Code de la partie.
+        state (MatchState) : Simulation de la partie.
+        players (dict) : Côté ("a", "b") → PlayerSlot.
+        tick (int) : Nombre de pas simulés.
+        finished_at (float) : Instant de fin de la partie (None si en cours).
+        events (int) : Événements des pas pas encore envoyés (bits de EVENT_BITS).
+    """
+    def __init__(self, code, seed):
+        self.code = code
+        self.state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, seed)
+        self.players = {}
+        self.tick = 0
+        self.finished_at = None
+        self.events = 0
+
+    def free_side(self):
+        """Retourne le premier côté libre, ou None si la partie est complète."""
+        for side in ("a", "b"):
+            if side not in self.players:
+                return side
+        return None
+
+
+class PongServer(asyncio.DatagramProtocol):
+    """
+    Serveur UDP hébergeant plusieurs parties simulées en parallèle dans une seule boucle.
+
+    Attributs :
+        matches (dict) : Code → ServerMatch.
+        clients (dict) : Adresse → (ServerMatch, côté).
+        conditions (NetworkConditions) : Conditions réseau simulées sur les envois.
+        publishers (dict) : Code → fonctions appelées avec l'état de la partie à chaque pas
+            (voir add_publisher).
+        tick_time (float) : Temps total passé à simuler et envoyer (secondes).
+        ticks (int) : Nombre de pas de la boucle serveur.
+    """
+    def __init__(self, conditions=None, seed=None):
+        self.transport = None
+        self.matches = {}
+        self.clients = {}
+        self.conditions = conditions or NetworkConditions()
+        self.rng = random.Random(seed)
+        self.next_code = 1
+        self.publishers = {}
+        self.tick_time = 0.0
+        self.ticks = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def add_publisher(self, code, publish):
+        """
+        Publie la partie `code` à chaque pas (par exemple BroadcastServer.publish, pour
+        la diffuser aux spectateurs).
+
+        Args:
+            code (int): Code de la partie.
+            publish (callable): Fonction appelée avec l'état (MatchState) après chaque pas.
+        """
+        self.publishers.setdefault(code, []).append(publish)
+
+    def send(self, data, addr):
+        """Envoie un paquet à un client."""
+        self.conditions.sendto(self.transport, data, addr)
+
+    def datagram_received(self, data, addr):
+        if not data:
+            return
+        kind = data[0]
+        now = time.monotonic()
+        if kind == JOIN and len(data) == JOIN_PACKET.size:
+            self.join(addr, JOIN_PACKET.unpack(data)[1], now)
+        elif kind == INPUT and len(data) >= INPUT_HEADER.size and addr in self.clients:
+            _, seq, count = INPUT_HEADER.unpack_from(data)
+            if len(data) - INPUT_HEADER.size != count:
+                return  # Paquet tronqué ou mal formé
+            directions = [max(-1, min(1, direction))
+                          for direction in struct.unpack_from(f"<{count}b", data, INPUT_HEADER.size)]
+            match, side = self.clients[addr]
+            match.players[side].receive(seq, directions, now)
+        elif kind == LEAVE and addr in self.clients:
+            self.disconnect(addr)
+
+    def join(self, addr, code, now):
+        """
+        Place un client dans une partie (celle demandée ou la première libre) et lui répond.
+        Une partie demandée par son code qui est complète ou terminée est refusée : elle
+        n'est jamais remplacée par une nouvelle partie du même code.
+        """
+        if addr in self.clients:
+            match, side = self.clients[addr]
+        else:
+            if code:
+                match = self.matches.get(code)
+                if match is not None and match.finished_at is not None:
+                    self.send(REFUSED_PACKET.pack(REFUSED, code, REFUSED_FINISHED), addr)
+                    return
+                if match is not None and match.free_side() is None:
+                    self.send(REFUSED_PACKET.pack(REFUSED, code, REFUSED_FULL), addr)
+                    return
+            else:
+                match = next((m for m in self.matches.values()
+                              if m.free_side() is not None and m.finished_at is None), None)
+            if match is None:
+                match = ServerMatch(code or self.next_code, self.rng.randrange(2**32))
+                self.next_code = max(self.next_code, match.code) + 1
+                self.matches[match.code] = match
+            side = match.free_side()
+            match.players[side] = PlayerSlot(addr, now)
+            self.clients[addr] = (match, side)
+        state = match.state
+        self.send(WELCOME_PACKET.pack(WELCOME, match.code, ord(side), state.seed, state.width,
+                                      state.height, state.base_paddle_height, state.ball.size), addr)
+
+    def disconnect(self, addr):
+        """Retire un client ; sa partie se termine."""
+        match, side = self.clients.pop(addr)
+        del match.players[side]
+        if match.finished_at is None:
+            match.state.running = False
+            match.finished_at = time.monotonic()
+
+    def tick(self):
+        """Avance d'un pas toutes les parties complètes et envoie les états."""
+        start = time.perf_counter()
+        now = time.monotonic()
+        for code, match in list(self.matches.items()):
+            for side, slot in list(match.players.items()):
+                if now - slot.last_seen > CLIENT_TIMEOUT_S:
+                    self.disconnect(slot.addr)
+            if match.finished_at is not None:
+                if now - match.finished_at > FINISHED_LINGER_S or not match.players:
+                    for slot in list(match.players.values()):
+                        self.clients.pop(slot.addr, None)
+                    del self.matches[code]
+                    continue
+            elif len(match.players) == 2:
+                slot_a, slot_b = match.players["a"], match.players["b"]
+                slot_a.catch_up(match.state.paddle_a, match.state.height)
+                slot_b.catch_up(match.state.paddle_b, match.state.height)
+                events = simulation.step(match.state, (slot_a.next_direction(), slot_b.next_direction()))
+                for event in events:
+                    match.events |= EVENT_BITS[event]
+                match.tick += 1
+                for publish in self.publishers.get(code, ()):
+                    publish(match.state)
+                if not match.state.running:
+                    match.finished_at = now
+            else:
+                continue
+            if match.tick % SNAPSHOT_INTERVAL == 0 or match.finished_at is not None:
+                for slot in match.players.values():
+                    self.send(encode_state(match.state, match.tick, slot.ack, match.events), slot.addr)
+                match.events = 0
+        self.tick_time += time.perf_counter() - start
+        self.ticks += 1
+
+    async def serve_forever(self, duration=None):
+        """Boucle de simulation du serveur, à FRAME_MS par pas (sans fin si duration est None)."""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        end = None if duration is None else next_tick + duration
+        while end is None or next_tick < end:
+            self.tick()
+            next_tick += FRAME_MS / 1000
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+
+class PongClient(asyncio.DatagramProtocol):
+    """
+    Client UDP : rejoint une partie, envoie ses directions et tient une copie locale de
+    l'état, avec prédiction de son propre paddle.
+
+    Attributs :
+        state (MatchState) : Copie locale de la partie (None avant WELCOME).
+        side (str) : Côté attribué par le serveur.
+        seq (int) : Numéro de la dernière direction envoyée.
+        pending (deque) : Directions envoyées pas encore confirmées par le serveur.
+        last_tick (int) : Pas du dernier état reçu (les états plus anciens sont ignorés).
+        corrections (int), correction_total (float) : Écarts entre prédiction et serveur.
+        snapshots (int) : Nombre d'états reçus.
+        refused (int) : Raison du refus du serveur (REFUSED_FULL, REFUSED_FINISHED ou None).
+        events (int) : Événements reçus pas encore lus (bits de EVENT_BITS, voir take_events).
+    """
+    def __init__(self, code=0, conditions=None):
+        self.transport = None
+        self.code = code
+        self.conditions = conditions or NetworkConditions()
+        self.state = None
+        self.side = None
+        self.seq = 0
+        self.pending = deque()
+        self.history = deque(maxlen=INPUT_REDUNDANCY)
+        self.last_tick = -1
+        self.snapshots = 0
+        self.corrections = 0
+        self.correction_total = 0.0
+        self.last_join = 0.0
+        self.refused = None
+        self.events = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.join()
+
+    def join(self):
+        """Demande à rejoindre une partie."""
+        self.last_join = time.monotonic()
+        self.conditions.sendto(self.transport, JOIN_PACKET.pack(JOIN, self.code))
+
+    def own_paddle(self):
+        """Paddle contrôlé par ce client."""
+        return self.state.paddle_a if self.side == "a" else self.state.paddle_b
+
+    def datagram_received(self, data, addr):
+        if not data:
+            return
+        if data[0] == WELCOME and len(data) == WELCOME_PACKET.size and self.state is None:
+            _, code, side, seed, width, height, paddle_height, ball_size = WELCOME_PACKET.unpack(data)
+            self.code, self.side = code, chr(side)
+            self.state = simulation.new_match(width, height, paddle_height, ball_size, seed)
+        elif data[0] == REFUSED and len(data) == REFUSED_PACKET.size and self.state is None:
+            self.refused = REFUSED_PACKET.unpack(data)[2]
+        elif data[0] == STATE and len(data) == STATE_PACKET.size and self.state is not None:
+            tick = STATE_PACKET.unpack_from(data)[1]
+            if tick < self.last_tick:
+                return  # Paquet arrivé dans le désordre
+            paddle = self.own_paddle()
+            predicted_y = paddle.y
+            self.last_tick, ack, events = apply_state(self.state, data)
+            self.events |= events
+            self.snapshots += 1
+            # Réconciliation : on réapplique les directions pas encore traitées par le serveur
+            while self.pending and self.pending[0][0] <= ack:
+                self.pending.popleft()
+            for _, direction in self.pending:
+                simulation.move_paddle(paddle, direction, self.state.height, 1)
+            error = abs(paddle.y - predicted_y)
+            if error > 0.5:
+                self.corrections += 1
+                self.correction_total += error
+
+    def take_events(self):
+        """Retourne les événements reçus depuis le dernier appel (pour les sons)."""
+        events = [event for event, bit in EVENT_BITS.items() if self.events & bit]
+        self.events = 0
+        return events
+
+    def send_input(self, direction):
+        """
+        Envoie la direction de ce pas et l'applique immédiatement au paddle local.
+        Avant l'accueil du serveur, renvoie JOIN régulièrement (sauf après un refus).
+        """
+        if self.state is None:
+            if self.refused is None and time.monotonic() - self.last_join > JOIN_RETRY_S:
+                self.join()
+            return
+        self.seq += 1
+        self.pending.append((self.seq, direction))
+        while len(self.pending) > MAX_PENDING_INPUTS:
+            self.pending.popleft()
+        self.history.append(direction)
+        simulation.move_paddle(self.own_paddle(), direction, self.state.height, 1)
+        packet = INPUT_HEADER.pack(INPUT, self.seq, len(self.history)) + \
+            struct.pack(f"<{len(self.history)}b", *self.history)
+        self.conditions.sendto(self.transport, packet)
+
+    def leave(self):
+        """Quitte la partie."""
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.sendto(bytes([LEAVE]))
+
+
+async def run_server(host, port, broadcast_port=None, broadcast_code=1):
+    """
+    Lance un serveur et le fait tourner indéfiniment. Avec broadcast_port, la partie
+    broadcast_code est aussi diffusée en direct aux spectateurs (broadcast.py watch).
+    """
+    loop = asyncio.get_running_loop()
+    transport, server = await loop.create_datagram_endpoint(PongServer, local_addr=(host, port))
+    print(f"Serveur Pong en écoute sur {host}:{port}")
+    broadcast_transport = None
+    if broadcast_port is not None:
+        from broadcast import BroadcastServer
+        broadcast_transport, broadcaster = await loop.create_datagram_endpoint(
+            BroadcastServer, local_addr=(host, broadcast_port))
+        server.add_publisher(broadcast_code, broadcaster.publish)
+        print(f"Partie {broadcast_code} diffusée sur {host}:{broadcast_port}")
+    try:
+        await server.serve_forever()
+    finally:
+        transport.close()
+        if broadcast_transport is not None:
+            broadcast_transport.close()
+
+
+async def run_client(host, port, code=0):
+    """Rejoint une partie en ligne et l'affiche dans une fenêtre pygame."""
+    import pygame
+    from game import PongGame
+    from bonus import Bonus
+    loop = asyncio.get_running_loop()
+    transport, client = await loop.create_datagram_endpoint(
+        lambda: PongClient(code), remote_addr=(host, port))
+    game = PongGame(PADDLE_HEIGHT, WIDTH, HEIGHT)
+    game.recorder = None
+    game.controllers = {}
+    pygame.display.set_caption("Pong - en attente d'un adversaire")
+    next_frame = loop.time()
+    try:
+        while client.state is None or client.state.running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+            if client.refused is not None:
+                print(f"Partie {client.code} {REFUSED_REASONS.get(client.refused, 'indisponible')} : "
+                      "connexion refusée par le serveur")
+                return
+            if client.state is not None and game.state is not client.state:
+                game.state = client.state
+                game.bonus = Bonus(client.state.bonus)
+                pygame.display.set_caption(f"Pong - partie {client.code}, joueur {client.side.upper()}")
+            keys_a, keys_b = game.read_inputs()
+            client.send_input(max(-1, min(1, keys_a + keys_b)))
+            if client.state is not None:
+                for event in client.take_events():
+                    game.audio.trigger(event)
+                game.audio.flush()
+                game.sync_rects()
+                game.draw()
+            next_frame = max(next_frame + FRAME_MS / 1000, loop.time())
+            await asyncio.sleep(next_frame - loop.time())
+        # Écran du gagnant : la fenêtre reste réactive pendant l'affichage
+        game.show_winner()
+        deadline = loop.time() + WINNER_DISPLAY_MS / 1000
+        while loop.time() < deadline:
+            if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                return
+            await asyncio.sleep(FRAME_MS / 1000)
+    finally:
+        client.leave()
+        transport.close()
+
+
+async def run_bots(host, port, count, duration, latency_ms, jitter_ms, loss, seed):
+    """
+    Fait jouer `count` clients automatiques (contrôleur suiveur) pendant `duration` secondes,
+    tous pilotés par une seule boucle. Une frame en retard est sautée plutôt que rattrapée,
+    pour ne pas envoyer des rafales de directions.
+
+    Returns:
+        dict: Statistiques cumulées des clients.
+    """
+    from controllers import FollowController
+    loop = asyncio.get_running_loop()
+    conditions = NetworkConditions(latency_ms / 2, jitter_ms / 2, loss, seed)
+    endpoints = [await loop.create_datagram_endpoint(lambda: PongClient(0, conditions),
+                                                     remote_addr=(host, port))
+                 for _ in range(count)]
+    clients = [client for _, client in endpoints]
+    controllers = [None] * count
+    end = loop.time() + duration
+    next_frame = loop.time()
+    while loop.time() < end:
+        for i, client in enumerate(clients):
+            if client.state is not None and controllers[i] is None:
+                controllers[i] = FollowController(client.side, random.Random(seed + i))
+            client.send_input(controllers[i].decide(client.state) if controllers[i] else 0)
+        next_frame = max(next_frame + FRAME_MS / 1000, loop.time())
+        await asyncio.sleep(next_frame - loop.time())
+    for transport, client in endpoints:
+        client.leave()
+        transport.close()
+    return {
+        "clients": count,
+        "unwelcomed": sum(client.state is None for client in clients),
+        "snapshots": sum(client.snapshots for client in clients),
+        "corrections": sum(client.corrections for client in clients),
+        "correction_total": sum(client.correction_total for client in clients),
+        "sent": conditions.sent,
+        "dropped": conditions.dropped,
+    }
+
+
+def bot_process(host, port, count, duration, latency_ms, jitter_ms, loss, seed):
+    """Lance run_bots dans sa propre boucle asyncio (pour un processus séparé)."""
+    return asyncio.run(run_bots(host, port, count, duration, latency_ms, jitter_ms, loss, seed))
+
+
+async def run_loopback(matches, duration, latency_ms, jitter_ms, loss, seed=0, workers=None):
+    """
+    Test en local : un serveur et 2 × `matches` clients automatiques, avec des conditions
+    réseau simulées dans les deux sens. Les clients tournent dans d'autres processus
+    pour que la mesure du serveur ne soit pas faussée. Affiche le débit, le coût d'un
+    pas du serveur et la qualité de la prédiction.
+    """
+    loop = asyncio.get_running_loop()
+    server_conditions = NetworkConditions(latency_ms / 2, jitter_ms / 2, loss, seed)
+    transport, server = await loop.create_datagram_endpoint(
+        lambda: PongServer(server_conditions, seed), local_addr=("127.0.0.1", 0))
+    host, port = transport.get_extra_info("sockname")[:2]
+    server_task = asyncio.ensure_future(server.serve_forever(duration + 1))
+    workers = workers or min(4, os.cpu_count() or 1)
+    counts = [matches * 2 // workers + (i < matches * 2 % workers) for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, bot_process, host, port, count, duration,
+                                 latency_ms, jitter_ms, loss, seed + 1 + i * count)
+            for i, count in enumerate(counts) if count))
+    await server_task
+    transport.close()
+
+    total = {key: sum(result[key] for result in results) for key in results[0]}
+    print(f"{server.next_code - 1} parties hébergées, {total['clients']} clients "
+          f"({total['unwelcomed']} sans partie), {duration:.0f} s")
+    print(f"Pas serveur : {server.ticks}, {server.tick_time / max(1, server.ticks) * 1000:.3f} ms par pas "
+          f"(budget {FRAME_MS:.1f} ms)")
+    print(f"États reçus : {total['snapshots'] / total['clients'] / duration:.1f} par client et par seconde")
+    print(f"Paquets perdus : {server_conditions.dropped + total['dropped']} / "
+          f"{server_conditions.sent + total['sent']}")
+    corrections = total["corrections"]
+    print(f"Corrections de prédiction : {corrections}, écart moyen "
+          f"{total['correction_total'] / corrections if corrections else 0:.1f} px")
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande (server, client ou loopback)."""
+    parser = argparse.ArgumentParser(description="Pong en réseau (UDP).")
+    commands = parser.add_subparsers(dest="command", required=True)
+    server_parser = commands.add_parser("server", help="Héberge des parties")
+    server_parser.add_argument("--host", default="0.0.0.0")
+    server_parser.add_argument("--port", type=int, default=9999)
+    server_parser.add_argument("--broadcast-port", type=int, default=None,
+                               help="Diffuse une partie aux spectateurs sur ce port")
+    server_parser.add_argument("--broadcast-code", type=int, default=1,
+                               help="Code de la partie diffusée")
+    client_parser = commands.add_parser("client", help="Rejoint une partie")
+    client_parser.add_argument("host")
+    client_parser.add_argument("port", type=int)
+    client_parser.add_argument("--match", type=int, default=0, help="Code de la partie (0 = automatique)")
+    loopback_parser = commands.add_parser("loopback", help="Test local avec des clients automatiques")
+    loopback_parser.add_argument("--matches", type=int, default=100)
+    loopback_parser.add_argument("--seconds", type=float, default=10.0)
+    loopback_parser.add_argument("--latency", type=float, default=50.0, help="Latence aller-retour (ms)")
+    loopback_parser.add_argument("--jitter", type=float, default=10.0, help="Gigue (ms)")
+    loopback_parser.add_argument("--loss", type=float, default=0.02, help="Taux de perte (0 à 1)")
+    loopback_parser.add_argument("--workers", type=int, default=None, help="Processus des clients")
+    args = parser.parse_args(argv)
+
+    if args.command == "server":
+        asyncio.run(run_server(args.host, args.port, args.broadcast_port, args.broadcast_code))
+    elif args.command == "client":
+        asyncio.run(run_client(args.host, args.port, args.match))
+    else:
+        asyncio.run(run_loopback(args.matches, args.seconds, args.latency, args.jitter, args.loss,
+                                 workers=args.workers))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Module profiler.py
+Mesure du temps passé dans chaque phase d'une frame du jeu.
+
+Chaque frame est découpée en phases (événements, attente de l'horloge, simulation, sons,
+dessin, copie pour la capture vidéo, affichage de l'overlay, envoi à l'écran) : begin()
+démarre la frame, mark(phase) attribue à la phase le temps écoulé depuis la marque
+précédente et end() enregistre la frame dans un tampon circulaire de taille fixe (les
+dernières PROFILER_CAPACITY frames).
+
+Les statistiques (p50, p95, p99 par phase) portent sur le tampon ; le nombre de frames
+dont le travail (tout sauf l'attente de l'horloge) dépasse le budget de 1000 / FPS ms est
+compté sur toute la partie. Elles s'affichent dans un overlay (touche F3) et le tampon
+peut être écrit en CSV à la fin de la partie.
+
+Classes:
+    - FrameProfiler: Tampon des temps de frame et statistiques.
+"""
+
+import csv
+import os
+import time
+from array import array
+from constants import WHITE, FRAME_MS, PROFILER_CAPACITY, PROFILER_REFRESH_MS, PROFILER_FONT_SIZE
+from fonts import get_font
+
+# Phases d'une frame, dans l'ordre où elles sont marquées
+PHASES = ("events", "wait", "update", "sound", "draw", "capture", "overlay", "present")
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+
+
+def percentile(sorted_values, fraction):
+    """Retourne le percentile (fraction entre 0 et 1) d'une liste déjà triée."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """
+    Temps de chaque phase des dernières frames, en millisecondes.
+
+    Attributs :
+        capacity (int) : Nombre de frames gardées.
+        budget_ms (float) : Budget d'une frame (1000 / FPS).
+        samples (dict) : Phase → tampon circulaire (array) des temps, plus "total" et "work".
+        count (int) : Nombre de frames enregistrées depuis le début.
+        missed (int) : Frames dont le travail a dépassé le budget, depuis le début.
+        visible (bool) : Affichage de l'overlay.
+    """
+    def __init__(self, capacity=PROFILER_CAPACITY, budget_ms=FRAME_MS):
+        self.capacity = capacity
+        self.budget_ms = budget_ms
+        self.columns = PHASES + ("work", "total")
+        self.samples = {name: array("d", bytes(8 * capacity)) for name in self.columns}
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.count = 0
+        self.missed = 0
+        self.frame_start = self.last_mark = time.perf_counter()
+        self.visible = False
+        self.overlay = []
+        self.overlay_time = 0.0
+
+    def begin(self):
+        """Démarre une nouvelle frame."""
+        for phase in self.current:
+            self.current[phase] = 0.0
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """Attribue à la phase le temps écoulé depuis la marque précédente."""
+        now = time.perf_counter()
+        self.current[phase] += (now - self.last_mark) * 1000
+        self.last_mark = now
+
+    def end(self):
+        """Enregistre la frame en cours dans le tampon."""
+        total = (time.perf_counter() - self.frame_start) * 1000
+        work = total - self.current["wait"]
+        index = self.count % self.capacity
+        samples = self.samples
+        for phase, value in self.current.items():
+            samples[phase][index] = value
+        samples["work"][index] = work
+        samples["total"][index] = total
+        self.count += 1
+        if work > self.budget_ms:
+            self.missed += 1
+
+    def recorded(self, column):
+        """Retourne les temps gardés d'une colonne, du plus ancien au plus récent."""
+        values = self.samples[column]
+        if self.count <= self.capacity:
+            return values[:self.count]
+        start = self.count % self.capacity
+        return values[start:] + values[:start]
+
+    def stats(self):
+        """
+        Returns:
+            dict: Colonne → (p50, p95, p99) en millisecondes, sur les frames du tampon.
+        """
+        result = {}
+        for column in self.columns:
+            values = sorted(self.recorded(column))
+            result[column] = tuple(percentile(values, p) for p in (0.5, 0.95, 0.99))
+        return result
+
+    def toggle(self):
+        """Affiche ou masque l'overlay."""
+        self.visible = not self.visible
+        self.overlay_time = 0.0
+
+    def draw(self, screen):
+        """
+        Dessine l'overlay des statistiques en haut à gauche. Les textes ne sont recalculés
+        que toutes les PROFILER_REFRESH_MS millisecondes.
+
+        Returns:
+            list: Rectangles des zones dessinées.
+        """
+        if not self.visible:
+            return []
+        now = time.perf_counter()
+        if now - self.overlay_time > PROFILER_REFRESH_MS / 1000:
+            self.overlay_time = now
+            stats = self.stats()
+            lines = [f"{name:<8}{p50:6.2f}{p95:6.2f}{p99:6.2f}" for name, (p50, p95, p99) in stats.items()]
+            lines.insert(0, "phase    p50   p95   p99 (ms)")
+            lines.append(f"hors budget : {self.missed} / {self.count}")
+            font = get_font("Courier New", PROFILER_FONT_SIZE)
+            self.overlay = [font.render(line, True, WHITE) for line in lines]
+        rects = []
+        y = 5
+        for surface in self.overlay:
+            rects.append(screen.blit(surface, (5, y)))
+            y += surface.get_height()
+        return rects
+
+    def save_csv(self, path=None):
+        """
+        Écrit les frames du tampon au format CSV (une ligne par frame, une colonne par phase).
+
+        Args:
+            path (str): Fichier de destination (par défaut : PROFILE_DIR/<date>.csv).
+
+        Returns:
+            str: Chemin du fichier écrit.
+        """
+        if path is None:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            path = os.path.join(PROFILE_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}.csv")
+        first = max(0, self.count - self.capacity)
+        columns = [self.recorded(column) for column in self.columns]
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame",) + self.columns)
+            for i, row in enumerate(zip(*columns)):
+                writer.writerow([first + i] + [f"{value:.3f}" for value in row])
+        return path
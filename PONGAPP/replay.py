@@ -0,0 +1,273 @@
+"""
+Enregistrement et relecture des parties.
+
+Une partie est entièrement déterminée par sa graine (générateur aléatoire propre à la
+partie, voir simulation.new_match), ses paramètres (terrain, paddles, balle, durée d'un pas)
+et les directions des paddles à chaque pas. Le replay ne stocke que ces données :
+un octet par pas dans un tableau en ajout seul, compressé à l'écriture (quelques Ko par partie).
+
+Pour pouvoir se déplacer rapidement dans un replay, l'état complet de la partie
+(simulation.snapshot) est aussi enregistré tous les KEYFRAME_INTERVAL pas. Aller à un
+instant donné restaure l'image clé précédente et ne rejoue qu'au plus KEYFRAME_INTERVAL pas.
+
+Format du fichier (little-endian) :
+- en-tête HEADER : "PRPL", version, graine, largeur, hauteur, hauteur des paddles,
+  taille de la balle, durée d'un pas (ms), nombre de pas ;
+- taille (u32) puis directions des pas compressées avec zlib, un octet par pas :
+  (a + 1) * 3 + (b + 1) ;
+- images clés : KEYFRAMES_HEADER (intervalle, nombre), index KEYFRAME_ENTRY (pas, taille)
+  pour chaque image, puis les états compressés avec zlib, bout à bout.
+
+Classes :
+- ReplayRecorder : Enregistre les entrées d'une partie.
+- Replay : Replay chargé, rejouable avec la simulation.
+
+Exemple :
+    python replay.py replays/20261018-154500-1234.pongreplay            (relecture à l'écran,
+                                                                         flèches gauche/droite : -/+ 5 s)
+    python replay.py replays/*.pongreplay --headless                    (re-simulation en lot)
+"""
+
+import argparse
+import bisect
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+from constants import FRAME_MS
+import simulation
+
+MAGIC = b"PRPL"
+VERSION = 4
+HEADER = struct.Struct("<4sBIHHHHdI")
+SIZE = struct.Struct("<I")
+KEYFRAMES_HEADER = struct.Struct("<II")
+KEYFRAME_ENTRY = struct.Struct("<II")
+KEYFRAME_INTERVAL = 600  # 10 secondes à 60 pas par seconde
+EXTENSION = ".pongreplay"
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "replays")
+
+# Directions (a, b) correspondant à chaque octet enregistré
+INPUT_CODES = [(a, b) for a in (-1, 0, 1) for b in (-1, 0, 1)]
+
+
+def encode_inputs(inputs):
+    """Code les directions (a, b) d'un pas sur un octet."""
+    return (inputs[0] + 1) * 3 + inputs[1] + 1
+
+
+class ReplayRecorder:
+    """
+    Enregistre les directions des paddles d'une partie, pas par pas.
+
+    Attributs :
+        seed (int) : Graine de la partie.
+        width, height (int) : Dimensions du terrain.
+        paddle_height, ball_size (int) : Tailles des paddles et de la balle.
+        dt (float) : Durée d'un pas en millisecondes.
+        inputs (array) : Directions codées, un octet par pas.
+        keyframe_interval (int) : Nombre de pas entre deux images clés.
+        keyframe_frames (list) : Pas de chaque image clé (état avant ce pas).
+        keyframes (list) : États compressés (simulation.snapshot) des images clés.
+    """
+    def __init__(self, seed, width, height, paddle_height, ball_size, dt=FRAME_MS,
+                 keyframe_interval=KEYFRAME_INTERVAL):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.paddle_height = paddle_height
+        self.ball_size = ball_size
+        self.dt = dt
+        self.inputs = array("B")
+        self.keyframe_interval = keyframe_interval
+        self.keyframe_frames = []
+        self.keyframes = []
+
+    @classmethod
+    def from_state(cls, state, dt=FRAME_MS):
+        """Crée un enregistreur pour une partie qui vient d'être créée."""
+        return cls(state.seed, state.width, state.height,
+                   state.base_paddle_height, state.ball.size, dt)
+
+    def add_keyframe(self, state):
+        """Enregistre l'état de la partie comme image clé du pas courant."""
+        self.keyframe_frames.append(len(self.inputs))
+        self.keyframes.append(zlib.compress(simulation.snapshot(state)))
+
+    def record(self, inputs, state=None):
+        """
+        Ajoute les directions (a, b) d'un pas.
+
+        Args:
+            inputs (tuple): Directions du pas.
+            state (MatchState): État de la partie avant ce pas ; une image clé en est
+                tirée tous les keyframe_interval pas.
+        """
+        if state is not None and len(self.inputs) % self.keyframe_interval == 0:
+            self.add_keyframe(state)
+        self.inputs.append(encode_inputs(inputs))
+
+    def to_bytes(self):
+        """Retourne le replay au format binaire."""
+        header = HEADER.pack(MAGIC, VERSION, self.seed, self.width, self.height,
+                             self.paddle_height, self.ball_size, self.dt, len(self.inputs))
+        inputs = zlib.compress(self.inputs.tobytes(), 9)
+        parts = [header, SIZE.pack(len(inputs)), inputs,
+                 KEYFRAMES_HEADER.pack(self.keyframe_interval, len(self.keyframes))]
+        for frame, keyframe in zip(self.keyframe_frames, self.keyframes):
+            parts.append(KEYFRAME_ENTRY.pack(frame, len(keyframe)))
+        parts.extend(self.keyframes)
+        return b"".join(parts)
+
+    def save(self, path=None):
+        """
+        Écrit le replay sur le disque.
+
+        Args:
+            path (str): Fichier de destination (par défaut : REPLAY_DIR/<date>-<graine>.pongreplay).
+
+        Returns:
+            str: Chemin du fichier écrit.
+        """
+        if path is None:
+            os.makedirs(REPLAY_DIR, exist_ok=True)
+            name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.seed}{EXTENSION}"
+            path = os.path.join(REPLAY_DIR, name)
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+        return path
+
+
+class Replay(ReplayRecorder):
+    """
+    Replay chargé depuis un fichier, rejouable à l'identique avec la simulation.
+
+    Méthodes :
+        load(path) / from_bytes(data) : Charge un replay.
+        new_state() : Crée l'état initial de la partie enregistrée.
+        frames(start) : Itère sur les directions (a, b) de chaque pas.
+        play(state, until) : Rejoue la partie et retourne l'état obtenu.
+        seek(frame) / seek_time(ms) : État de la partie à un pas ou un instant donné.
+    """
+    @classmethod
+    def from_bytes(cls, data):
+        """Décode un replay binaire."""
+        if len(data) < HEADER.size:
+            raise ValueError("Replay tronqué")
+        magic, version, seed, width, height, paddle_height, ball_size, dt, count = \
+            HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Ce fichier n'est pas un replay Pong")
+        if version != VERSION:
+            raise ValueError(f"Version de replay non supportée : {version}")
+        replay = cls(seed, width, height, paddle_height, ball_size, dt)
+        offset = HEADER.size
+        (size,) = SIZE.unpack_from(data, offset)
+        offset += SIZE.size
+        replay.inputs.frombytes(zlib.decompress(data[offset:offset + size]))
+        offset += size
+        replay.keyframe_interval, keyframe_count = KEYFRAMES_HEADER.unpack_from(data, offset)
+        offset += KEYFRAMES_HEADER.size
+        entries = [KEYFRAME_ENTRY.unpack_from(data, offset + i * KEYFRAME_ENTRY.size)
+                   for i in range(keyframe_count)]
+        offset += keyframe_count * KEYFRAME_ENTRY.size
+        for frame, size in entries:
+            replay.keyframe_frames.append(frame)
+            replay.keyframes.append(data[offset:offset + size])
+            offset += size
+        if len(replay.inputs) != count:
+            raise ValueError("Replay corrompu : nombre de pas incohérent")
+        return replay
+
+    @classmethod
+    def load(cls, path):
+        """Charge un replay depuis un fichier."""
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+    def new_state(self):
+        """Crée l'état initial de la partie enregistrée."""
+        return simulation.new_match(self.width, self.height, self.paddle_height,
+                                    self.ball_size, self.seed)
+
+    def frames(self, start=0):
+        """Itère sur les directions (a, b) des pas, à partir du pas `start`."""
+        codes = INPUT_CODES
+        for i in range(start, len(self.inputs)):
+            yield codes[self.inputs[i]]
+
+    def play(self, state=None, until=None):
+        """
+        Rejoue la partie avec la simulation.
+
+        Args:
+            state (MatchState): État de départ (par défaut : état initial de la partie).
+            until (int): Nombre de pas à rejouer (par défaut : tous).
+
+        Returns:
+            MatchState: L'état après les pas rejoués.
+        """
+        return self.play_from(self.new_state() if state is None else state, 0, until)
+
+    def play_from(self, state, start, until=None):
+        """Rejoue les pas start à until (exclu) sur l'état donné et le retourne."""
+        until = len(self.inputs) if until is None else min(until, len(self.inputs))
+        step, codes, inputs, dt = simulation.step, INPUT_CODES, self.inputs, self.dt
+        for i in range(start, until):
+            step(state, codes[inputs[i]], dt)
+        return state
+
+    def seek(self, frame):
+        """
+        Retourne l'état de la partie avant le pas `frame`, en partant de l'image clé
+        précédente : au plus keyframe_interval pas sont rejoués.
+
+        Args:
+            frame (int): Numéro du pas (borné à la durée du replay).
+
+        Returns:
+            MatchState: Une nouvelle partie dans l'état demandé.
+        """
+        frame = max(0, min(frame, len(self.inputs)))
+        index = bisect.bisect_right(self.keyframe_frames, frame) - 1
+        if index < 0:
+            return self.play_from(self.new_state(), 0, frame)
+        state = simulation.restore(zlib.decompress(self.keyframes[index]))
+        return self.play_from(state, self.keyframe_frames[index], frame)
+
+    def seek_time(self, milliseconds):
+        """Retourne l'état de la partie à l'instant donné (en millisecondes de jeu)."""
+        return self.seek(int(milliseconds // self.dt))
+
+
+def main(argv=None):
+    """
+    Point d'entrée en ligne de commande : relit un replay à l'écran, ou re-simule
+    une série de replays sans affichage et affiche leur résultat.
+    """
+    parser = argparse.ArgumentParser(description="Relecture des replays Pong.")
+    parser.add_argument("files", nargs="+", help="Fichiers .pongreplay")
+    parser.add_argument("--headless", action="store_true",
+                        help="Re-simule les parties sans affichage et affiche leur résultat")
+    args = parser.parse_args(argv)
+
+    if args.headless:
+        for path in args.files:
+            replay = Replay.load(path)
+            state = replay.play()
+            print(f"{path} : graine {replay.seed}, {len(replay.inputs)} pas, "
+                  f"{state.score_a} - {state.score_b}, gagnant : {state.winner or 'aucun'}")
+        return 0
+
+    from game import PongGame
+    for path in args.files:
+        replay = Replay.load(path)
+        game = PongGame(replay.paddle_height, replay.width, replay.height, replay=replay)
+        game.run(game.screen)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
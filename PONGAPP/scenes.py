@@ -0,0 +1,127 @@
+"""
+Module scenes.py
+Boucle principale unique de l'application et pile de scènes.
+
+Chaque écran (menu principal, paramètres, partie, fin de partie) est une scène. Le
+SceneManager garde une pile de scènes et fait tourner une seule boucle : à chaque frame,
+il lit les événements, les donne à la scène du sommet, avance l'horloge et fait avancer
+puis dessiner cette scène. Aucune scène ne bloque : les attentes (affichage du gagnant,
+écran statique) sont des minuteurs décomptés frame après frame, et la file d'événements
+est lue à chaque tour, si bien que la fenêtre répond toujours.
+
+Une scène statique (menu, pause, fin de partie) indique combien de temps la boucle peut
+attendre le prochain événement (wait_ms) : la boucle dort jusqu'à une entrée ou jusqu'à
+l'échéance de son minuteur au lieu de redessiner en continu. Une partie en cours est
+animée à settings.RENDER_FPS images par seconde.
+
+Classes:
+    - Scene: Écran de l'application, piloté par le SceneManager.
+    - SceneManager: Pile de scènes et boucle principale.
+"""
+
+import sys
+import pygame
+from constants import IDLE_REDRAW_MS
+import settings
+from utils import wait_events
+
+
+class Scene:
+    """
+    Écran de l'application. Les sous-classes redéfinissent les méthodes utiles ; une scène
+    change d'écran en appelant self.manager.push, pop ou replace.
+
+    Attributs :
+        manager (SceneManager) : Gestionnaire de la pile, fixé quand la scène y est ajoutée.
+
+    Méthodes :
+        enter() : Appelée chaque fois que la scène passe au sommet de la pile.
+        wait_ms() : Attente maximale d'un événement en millisecondes (None : animation continue).
+        handle_events(events) : Traite les événements de la frame.
+        frame(elapsed) : Avance de elapsed millisecondes et dessine la scène.
+    """
+    manager = None
+
+    def enter(self):
+        """Appelée chaque fois que la scène passe au sommet de la pile."""
+
+    def wait_ms(self):
+        """Retourne l'attente maximale d'un événement (None : animation continue)."""
+        return IDLE_REDRAW_MS
+
+    def handle_events(self, events):
+        """Traite les événements de la frame."""
+
+    def frame(self, elapsed):
+        """Avance de elapsed millisecondes et dessine la scène."""
+
+
+class SceneManager:
+    """
+    Pile de scènes et boucle principale de l'application.
+
+    Attributs :
+        stack (list) : Scènes, la scène active au sommet.
+        clock (pygame.time.Clock) : Horloge de la boucle, remise à zéro à chaque changement
+            de scène : le temps passé dans l'ancienne n'est pas compté dans la nouvelle.
+
+    Méthodes :
+        push(scene), pop(), replace(scene), clear() : Modifient la pile.
+        run() : Boucle principale, jusqu'à ce que la pile soit vide.
+        step() : Une frame de la boucle.
+    """
+    def __init__(self):
+        self.stack = []
+        self.clock = pygame.time.Clock()
+
+    @property
+    def top(self):
+        """Scène active (None si la pile est vide)."""
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        """Ajoute une scène au sommet de la pile."""
+        scene.manager = self
+        self.stack.append(scene)
+        self.clock.tick()
+        scene.enter()
+
+    def pop(self):
+        """Retire la scène active et revient à la précédente."""
+        self.stack.pop()
+        self.clock.tick()
+        if self.stack:
+            self.stack[-1].enter()
+
+    def replace(self, scene):
+        """Remplace la scène active."""
+        self.stack.pop()
+        self.push(scene)
+
+    def clear(self):
+        """Vide la pile : la boucle principale s'arrête."""
+        self.stack.clear()
+
+    def run(self):
+        """Boucle principale, jusqu'à ce que la pile soit vide."""
+        while self.stack:
+            self.step()
+
+    def step(self):
+        """
+        Une frame : événements, horloge, avance et dessin de la scène active.
+        Fermer la fenêtre quitte l'application.
+        """
+        scene = self.top
+        timeout = scene.wait_ms()
+        events = wait_events(timeout) if timeout is not None else pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+        scene.handle_events(events)
+
+        elapsed = self.clock.tick(0 if timeout is not None else settings.RENDER_FPS)
+        scene = self.top
+        if scene is not None:
+            scene.frame(elapsed)
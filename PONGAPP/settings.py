@@ -5,11 +5,36 @@ Ce module gère les paramètres dynamiques du jeu Pong,
 notamment la taille courante des paddles sélectionnée dans le menu des paramètres.
 """
 
-from constants import PADDLE_SIZES
+from constants import PADDLE_SIZES, FPS
 
 # Index de la taille de paddle actuellement sélectionnée (par défaut : Moyen)
 CURRENT_PADDLE_SIZE_INDEX = 1
 
+# Enregistrement des replays de chaque partie (dossier replays/)
+RECORD_REPLAYS = True
+
+# Rendu par zones modifiées (pygame.display.update sur les seuls éléments mobiles)
+DIRTY_RECT_RENDERING = False
+
+# Mixer audio (fixé avant son initialisation) : fréquence en Hz et taille du tampon en
+# échantillons. Un petit tampon réduit le retard du son ; l'augmenter (512, 1024) si le son grésille.
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER_SIZE = 256
+
+# Mode multiball : le bonus divise les balles qui le touchent (parties non enregistrées)
+MULTIBALL = False
+
+# Images affichées par seconde (0 : pas de limite). La simulation avance toujours par pas
+# fixes de constants.FRAME_MS ; l'affichage interpole les positions entre deux pas.
+RENDER_FPS = FPS
+
+# Capture vidéo des parties (dossier captures/) : None, "png" (une image par frame) ou
+# "raw" (flux RGB brut). Écrite par un thread ; F12 enregistre une capture d'écran.
+CAPTURE_MODE = None
+
+# Export CSV des temps de frame à la fin de chaque partie (dossier profiles/, overlay : F3)
+EXPORT_FRAME_PROFILES = False
+
 
 def get_current_paddle_height():
     """Retourne la hauteur de paddle actuellement sélectionnée."""
@@ -64,4 +89,56 @@ def get_current_ball_size():
 
 def get_current_ball_name():
     """Retourne le nom affiché de la taille de balle actuellement sélectionnée."""
-    return BALL_SIZES[CURRENT_BALL_SIZE_INDEX][0]
\ No newline at end of file
+    return BALL_SIZES[CURRENT_BALL_SIZE_INDEX][0]
+
+# Échelle du rendu (nom affiché, facteur). "Natif" : le terrain a la taille de la fenêtre.
+# Sinon le terrain a toujours la taille logique constants.WIDTH x HEIGHT (même physique sur
+# tous les écrans) et il est dessiné sur une surface de cette taille multipliée par le
+# facteur, agrandie à la taille de la fenêtre une fois par frame.
+RENDER_SCALES = [
+    ("Natif", None),
+    ("100 %", 1.0),
+    ("75 %", 0.75),
+    ("50 %", 0.5)
+]
+CURRENT_RENDER_SCALE_INDEX = 0  # Natif par défaut
+
+def get_current_render_scale():
+    """Retourne le facteur de rendu actuellement sélectionné (None : rendu natif)."""
+    return RENDER_SCALES[CURRENT_RENDER_SCALE_INDEX][1]
+
+def get_current_render_scale_name():
+    """Retourne le nom affiché de l'échelle de rendu actuellement sélectionnée."""
+    return RENDER_SCALES[CURRENT_RENDER_SCALE_INDEX][0]
+
+# Joueur tenu par l'ordinateur (nom affiché, côté : None, "a" ou "b")
+AI_SIDES = [
+    ("Aucun", None),
+    ("Joueur A", "a"),
+    ("Joueur B", "b")
+]
+CURRENT_AI_SIDE_INDEX = 0  # Deux joueurs humains par défaut
+
+# Niveaux de l'ordinateur (nom affiché, clé de controllers.DIFFICULTIES)
+AI_LEVELS = [
+    ("Facile", "facile"),
+    ("Moyen", "moyen"),
+    ("Difficile", "difficile")
+]
+CURRENT_AI_LEVEL_INDEX = 1  # Moyen par défaut
+
+def get_current_ai_side():
+    """Retourne le côté tenu par l'ordinateur (None si aucun)."""
+    return AI_SIDES[CURRENT_AI_SIDE_INDEX][1]
+
+def get_current_ai_side_name():
+    """Retourne le nom affiché du joueur tenu par l'ordinateur."""
+    return AI_SIDES[CURRENT_AI_SIDE_INDEX][0]
+
+def get_current_ai_level():
+    """Retourne le niveau de l'ordinateur actuellement sélectionné."""
+    return AI_LEVELS[CURRENT_AI_LEVEL_INDEX][1]
+
+def get_current_ai_level_name():
+    """Retourne le nom affiché du niveau de l'ordinateur."""
+    return AI_LEVELS[CURRENT_AI_LEVEL_INDEX][0]
@@ -0,0 +1,658 @@
+"""
+Module simulation.py
+Moteur de simulation du Pong indépendant de pygame : l'état d'une partie (balle,
+paddles, scores, bonus, effets) est stocké sous forme de données simples et avancé
+par la fonction step(state, inputs, dt). PongGame s'appuie sur ce moteur pour
+l'affichage et le son, et les outils sans écran (tests d'équilibrage, régression)
+peuvent l'utiliser directement, sans fenêtre ni audio.
+
+Classes:
+    - Ball: Position, taille et vitesse de la balle.
+    - Paddle: Position, taille et vitesse d'un paddle.
+    - BonusState: État du bonus présent sur le terrain.
+    - MatchRandom: Générateur aléatoire d'une partie, qui compte les mots tirés.
+    - MatchState: État complet d'une partie.
+Fonctions:
+    - new_match(width, height, paddle_height, ball_size, seed): Crée l'état initial d'une partie.
+    - step(state, inputs, dt): Avance la partie d'un pas de simulation.
+    - serve_velocity(rng): Tire la vitesse initiale de la balle.
+    - spawn_bonus(bonus, width, height, rng, now): Fait apparaître un bonus.
+    - collect_bonus(bonus, paddle, player, now): Teste la collecte d'un bonus par un paddle.
+    - start_effect(state, name, now): Active l'effet d'un bonus collecté et programme sa fin.
+    - expire_effects(state, now): Termine les effets dont la durée est écoulée.
+    - clear_effects(state): Termine tous les effets.
+    - apply_effects(state): Recalcule la vitesse et la taille des paddles à partir des effets actifs.
+    - snapshot(state) / restore(data): Sauvegarde et restaure l'état complet d'une partie.
+
+Les vitesses sont exprimées en pixels par frame de référence (FRAME_MS) et les
+déplacements sont proportionnels à dt. Les temps sont en millisecondes de jeu.
+Les collisions de la balle sont calculées en continu (instant exact de contact) :
+la simulation reste exacte avec des pas plus longs qu'une frame.
+
+Les effets des bonus sont décrits par la table EFFECT_TYPES (constants.py). Leurs fins
+sont rangées dans une file de priorité (heapq) : un pas ne fait que comparer le temps à
+la prochaine expiration, et les attributs des paddles ne sont recalculés que lorsqu'un
+effet commence ou se termine.
+
+En mode multiball (state.balls, voir multiball.py), toutes les balles sont déplacées
+ensemble, en une passe vectorisée, à la place de move_ball.
+"""
+
+import heapq
+
+import random
+import struct
+from constants import (
+    FRAME_MS, PADDLE_WIDTH, PADDLE_SPEED, EFFECT_TYPES,
+    PADDEL_MARGIN_X, PADDLE_HEIGHT, WIN_SCORE, SPEEDUP_INTERVAL, SPEEDUP_FACTOR,
+    BALL_SPEED_INIT_X, BALL_SPEED_INIT_Y, RESET_DELAY_MS,
+    BONUS_TYPES, BONUS_RADIUS, BONUS_DURATION, BONUS_SPAWN_INTERVAL,
+    BONUS_MARGIN_X, BONUS_LEFT_ZONE, BONUS_RIGHT_ZONE
+)
+
+# Événements renvoyés par step() (utilisés par PongGame pour jouer les sons)
+EVENT_WALL = "wall"
+EVENT_PADDLE = "paddle"
+EVENT_POINT = "point"
+EVENT_BONUS = "bonus"
+
+# Effets par joueur ("increase_speed_a", ...) et (effet, joueur) de chacun
+EFFECT_NAMES = tuple(effect + "_" + player for player in "ab" for effect in EFFECT_TYPES)
+EFFECT_OWNERS = {effect + "_" + player: (effect, player)
+                 for player in "ab" for effect in EFFECT_TYPES}
+
+# Format binaire d'un état complet (voir snapshot) : terrain, balle, paddles, scores,
+# timers, bonus, effets (un bit par effet, puis leurs fins) et nombre de mots tirés du
+# générateur aléatoire
+SNAPSHOT = struct.Struct("<HHdI" "ddHdd" "5d" "5d" "HHB?ddddd" "?bddHddBd" f"B{len(EFFECT_NAMES)}d" "Q")
+WINNERS = (None, "Joueur A", "Joueur B")
+PLAYERS = (None, "a", "b")
+OPPONENTS = {"a": "b", "b": "a"}
+
+# Nombre maximal de rebonds calculés pendant un pas de simulation
+MAX_BOUNCES_PER_STEP = 8
+
+
+class Ball:
+    """
+    Balle carrée définie par son coin supérieur gauche, sa taille et sa vitesse.
+    """
+    __slots__ = ("x", "y", "size", "speed_x", "speed_y")
+
+    def __init__(self, x, y, size, speed_x, speed_y):
+        self.x = x
+        self.y = y
+        self.size = size
+        self.speed_x = speed_x
+        self.speed_y = speed_y
+
+
+class Paddle:
+    """
+    Paddle défini par son coin supérieur gauche, ses dimensions et sa vitesse.
+    """
+    __slots__ = ("x", "y", "width", "height", "speed")
+
+    def __init__(self, x, y, width, height, speed=PADDLE_SPEED):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.speed = speed
+
+
+class BonusState:
+    """
+    État du bonus : position de son rectangle englobant, type (index dans BONUS_TYPES),
+    temps d'apparition et de collecte, et joueur qui l'a collecté.
+    """
+    __slots__ = ("active", "type", "x", "y", "radius", "spawn_time", "collected_time",
+                 "collected_by", "duration")
+
+    def __init__(self):
+        self.active = False
+        self.type = None
+        self.x = 0
+        self.y = 0
+        self.radius = BONUS_RADIUS
+        self.spawn_time = 0
+        self.collected_time = 0
+        self.collected_by = None
+        self.duration = BONUS_DURATION
+
+
+class MatchRandom(random.Random):
+    """
+    Générateur aléatoire d'une partie (Mersenne Twister) qui compte les mots de 32 bits
+    tirés depuis sa graine : l'état du générateur se résume alors à (graine, words),
+    et peut être retrouvé en recréant le générateur puis en l'avançant de words mots.
+
+    Attributs :
+    - words : Nombre de mots de 32 bits tirés depuis la graine.
+    """
+    def seed(self, a=None, version=2):
+        super().seed(a, version)
+        self.words = 0
+
+    def random(self):
+        # Un flottant sur 53 bits consomme deux mots
+        self.words += 2
+        return super().random()
+
+    def getrandbits(self, k):
+        self.words += (k + 31) // 32
+        return super().getrandbits(k)
+
+    def advance(self, words):
+        """Tire et ignore `words` mots de 32 bits."""
+        if words > 0:
+            self.getrandbits(32 * words)
+
+
+class MatchState:
+    """
+    État complet d'une partie de Pong.
+
+    Attributs :
+    - width, height : Dimensions du terrain.
+    - base_paddle_height : Hauteur des paddles sans bonus.
+    - ball : Balle (Ball).
+    - paddle_a, paddle_b : Paddles des joueurs (Paddle).
+    - score_a, score_b : Scores des joueurs.
+    - winner : Gagnant de la partie ou None.
+    - running : Indique si la partie est en cours.
+    - time : Temps de jeu écoulé en millisecondes.
+    - last_speedup : Temps de la dernière accélération de la balle.
+    - last_bonus_spawn : Temps du dernier spawn de bonus.
+    - bonus_spawn_interval : Intervalle entre les spawns de bonus.
+    - serve_timer : Temps restant avant que la balle reparte après un point.
+    - bonus : État du bonus (BonusState).
+    - active_effects : Effets actifs des bonus (nom de EFFECT_NAMES → bool).
+    - effect_expiry : Temps de fin de chaque effet actif.
+    - effect_queue : File de priorité (heapq) des fins d'effets, (temps, nom) ; les entrées
+      qui ne correspondent plus à effect_expiry (effet relancé ou terminé) sont ignorées.
+    - seed, rng : Graine et générateur aléatoire (MatchRandom) propres à la partie.
+    - balls : Balles du mode multiball (multiball.BallArray) ou None ; ball suit alors
+      la première balle (non sauvegardé par snapshot).
+    """
+    __slots__ = (
+        "width", "height", "base_paddle_height", "ball", "paddle_a", "paddle_b",
+        "score_a", "score_b", "winner", "running", "time", "last_speedup",
+        "last_bonus_spawn", "bonus_spawn_interval", "serve_timer", "bonus",
+        "active_effects", "effect_expiry", "effect_queue", "seed", "rng",
+        "balls"
+    )
+
+    def __init__(self, width, height, paddle_height, ball_size, seed=None):
+        self.width = width
+        self.height = height
+        self.base_paddle_height = paddle_height
+        self.seed = seed
+        self.rng = MatchRandom(seed)
+        self.paddle_a = Paddle(PADDEL_MARGIN_X,
+                               height//2 - paddle_height//2,
+                               PADDLE_WIDTH,
+                               paddle_height)
+        self.paddle_b = Paddle(width - PADDEL_MARGIN_X - PADDLE_WIDTH,
+                               height//2 - paddle_height//2,
+                               PADDLE_WIDTH,
+                               paddle_height)
+        self.ball = Ball(0, 0, ball_size, 0, 0)
+        self.score_a, self.score_b = 0, 0
+        self.winner = None
+        self.running = True
+        self.time = 0
+        self.last_speedup = 0
+        self.last_bonus_spawn = 0
+        self.bonus_spawn_interval = BONUS_SPAWN_INTERVAL
+        self.serve_timer = 0
+        self.bonus = BonusState()
+        self.active_effects = dict.fromkeys(EFFECT_NAMES, False)
+        self.effect_expiry = {}
+        self.effect_queue = []
+        self.balls = None
+        serve(self)
+
+
+def new_match(width, height, paddle_height, ball_size, seed=None):
+    """
+    Crée l'état initial d'une partie.
+
+    Args:
+        width, height (int): Dimensions du terrain.
+        paddle_height (int): Hauteur des paddles.
+        ball_size (int): Taille de la balle.
+        seed (int): Graine du générateur aléatoire de la partie (None = tirée au hasard,
+            et conservée dans state.seed pour pouvoir rejouer la partie).
+
+    Returns:
+        MatchState: L'état de la partie, balle au centre.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    return MatchState(width, height, paddle_height, ball_size, seed)
+
+
+def snapshot(state):
+    """
+    Sauvegarde l'état complet d'une partie. Le générateur aléatoire est sauvegardé par
+    le nombre de mots tirés depuis la graine (voir MatchRandom).
+
+    Returns:
+        bytes: L'état au format SNAPSHOT.
+    """
+    ball, paddle_a, paddle_b, bonus = state.ball, state.paddle_a, state.paddle_b, state.bonus
+    effects = 0
+    for i, name in enumerate(EFFECT_NAMES):
+        if state.active_effects[name]:
+            effects |= 1 << i
+    return SNAPSHOT.pack(
+        state.width, state.height, state.base_paddle_height, state.seed,
+        ball.x, ball.y, ball.size, ball.speed_x, ball.speed_y,
+        paddle_a.x, paddle_a.y, paddle_a.width, paddle_a.height, paddle_a.speed,
+        paddle_b.x, paddle_b.y, paddle_b.width, paddle_b.height, paddle_b.speed,
+        state.score_a, state.score_b, WINNERS.index(state.winner), state.running,
+        state.time, state.last_speedup, state.last_bonus_spawn,
+        state.bonus_spawn_interval, state.serve_timer,
+        bonus.active, -1 if bonus.type is None else bonus.type, bonus.x, bonus.y, bonus.radius,
+        bonus.spawn_time, bonus.collected_time, PLAYERS.index(bonus.collected_by), bonus.duration,
+        effects, *(state.effect_expiry.get(name, 0.0) for name in EFFECT_NAMES),
+        state.rng.words)
+
+
+def restore(data):
+    """
+    Restaure une partie sauvegardée avec snapshot.
+
+    Args:
+        data (bytes): État au format SNAPSHOT.
+
+    Returns:
+        MatchState: Une nouvelle partie, identique à celle sauvegardée.
+    """
+    values = SNAPSHOT.unpack(data)
+    (width, height, base_paddle_height, seed,
+     ball_x, ball_y, ball_size, speed_x, speed_y) = values[:9]
+    paddle_a, paddle_b = values[9:14], values[14:19]
+    (score_a, score_b, winner, running, time, last_speedup, last_bonus_spawn,
+     bonus_spawn_interval, serve_timer) = values[19:28]
+    (bonus_active, bonus_type, bonus_x, bonus_y, bonus_radius, spawn_time, collected_time,
+     collected_by, bonus_duration, effects) = values[28:38]
+    offset = 38 + len(EFFECT_NAMES)
+    expiries = values[38:offset]
+    rng_words = values[offset]
+
+    state = MatchState.__new__(MatchState)
+    state.width, state.height = width, height
+    state.base_paddle_height = base_paddle_height
+    state.seed = seed
+    state.rng = MatchRandom(seed)
+    state.rng.advance(rng_words)
+    state.balls = None
+    state.ball = Ball(ball_x, ball_y, ball_size, speed_x, speed_y)
+    state.paddle_a = Paddle(*paddle_a)
+    state.paddle_b = Paddle(*paddle_b)
+    state.score_a, state.score_b = score_a, score_b
+    state.winner = WINNERS[winner]
+    state.running = running
+    state.time = time
+    state.last_speedup = last_speedup
+    state.last_bonus_spawn = last_bonus_spawn
+    state.bonus_spawn_interval = bonus_spawn_interval
+    state.serve_timer = serve_timer
+    bonus = state.bonus = BonusState()
+    bonus.active = bonus_active
+    bonus.type = None if bonus_type < 0 else bonus_type
+    bonus.x, bonus.y = bonus_x, bonus_y
+    bonus.radius = bonus_radius
+    bonus.spawn_time = spawn_time
+    bonus.collected_time = collected_time
+    bonus.collected_by = PLAYERS[collected_by]
+    bonus.duration = bonus_duration
+    state.active_effects = {name: bool(effects >> i & 1) for i, name in enumerate(EFFECT_NAMES)}
+    state.effect_expiry = {name: end for name, end in zip(EFFECT_NAMES, expiries)
+                           if state.active_effects[name]}
+    state.effect_queue = [(end, name) for name, end in state.effect_expiry.items()]
+    heapq.heapify(state.effect_queue)
+    return state
+
+
+def serve_velocity(rng):
+    """
+    Tire la vitesse initiale de la balle (direction aléatoire sur chaque axe).
+
+    Args:
+        rng: Générateur aléatoire (random.Random ou module random).
+
+    Returns:
+        tuple: (speed_x, speed_y)
+    """
+    speed_x = rng.choice([-1, 1]) * BALL_SPEED_INIT_X
+    speed_y = rng.choice([-1, 1]) * BALL_SPEED_INIT_Y
+    return speed_x, speed_y
+
+
+def serve(state):
+    """
+    Replace la balle au centre du terrain avec une vitesse aléatoire.
+    """
+    ball = state.ball
+    ball.x = state.width//2 - ball.size//2
+    ball.y = state.height//2 - ball.size//2
+    ball.speed_x, ball.speed_y = serve_velocity(state.rng)
+    state.last_speedup = state.time
+
+
+def spawn_bonus(bonus, width, height, rng, now):
+    """
+    Fait apparaître un bonus d'un type aléatoire, à gauche ou à droite du terrain.
+
+    Args:
+        bonus (BonusState): Bonus à faire apparaître.
+        width, height (int): Dimensions du terrain.
+        rng: Générateur aléatoire.
+        now (int): Temps actuel en millisecondes.
+    """
+    if bonus.active:
+        return
+    bonus.type = rng.randrange(len(BONUS_TYPES))
+    spawn_side = rng.choice(["left", "right"])
+
+    if spawn_side == "left":
+        bonus.x = rng.randint(BONUS_MARGIN_X, BONUS_LEFT_ZONE)
+    else:
+        bonus.x = rng.randint(BONUS_RIGHT_ZONE, width - BONUS_MARGIN_X)
+
+    bonus.y = rng.randint(PADDLE_HEIGHT, height - PADDLE_HEIGHT)
+    bonus.active = True
+    bonus.spawn_time = now
+
+
+def collect_bonus(bonus, paddle, player, now):
+    """
+    Vérifie la collision entre le bonus et un paddle. Si le bonus est actif et touché,
+    il est désactivé et l'effet gagné est retourné.
+
+    Args:
+        bonus (BonusState): Bonus à tester.
+        paddle (Paddle): Paddle du joueur.
+        player (str): "a" ou "b".
+        now (int): Temps actuel en millisecondes.
+
+    Returns:
+        Optional[str]: Nom de l'effet gagné (ex : "increase_speed_a") ou None.
+    """
+    if not bonus.active:
+        return None
+    size = bonus.radius * 2
+    if (bonus.x < paddle.x + paddle.width and paddle.x < bonus.x + size
+            and bonus.y < paddle.y + paddle.height and paddle.y < bonus.y + size):
+        bonus.active = False
+        bonus.collected_time = now
+        bonus.collected_by = player
+        return BONUS_TYPES[bonus.type]["effect"] + "_" + player
+    return None
+
+
+def start_effect(state, name, now):
+    """
+    Active l'effet d'un bonus collecté selon sa règle de cumul (EFFECT_TYPES) et
+    programme sa fin dans la file des expirations.
+
+    Args:
+        state (MatchState): État de la partie.
+        name (str): Effet gagné, pour un joueur (ex : "increase_speed_a").
+        now (float): Temps actuel en millisecondes.
+    """
+    effect, player = EFFECT_OWNERS[name]
+    spec = EFFECT_TYPES[effect]
+    active, expiry = state.active_effects, state.effect_expiry
+    if spec["stacking"] == "replace":
+        for other, other_spec in EFFECT_TYPES.items():
+            key = other + "_" + player
+            if other_spec["stacking"] == "replace" and active[key]:
+                active[key] = False
+                expiry.pop(key, None)
+    start = expiry.get(name, now) if spec["stacking"] == "extend" and active[name] else now
+    active[name] = True
+    expiry[name] = start + spec["duration"]
+    heapq.heappush(state.effect_queue, (expiry[name], name))
+    apply_effects(state)
+
+
+def expire_effects(state, now):
+    """
+    Termine les effets dont la fin est atteinte. Sans expiration, ne coûte qu'une
+    comparaison avec la tête de la file.
+
+    Returns:
+        bool: True si au moins un effet s'est terminé.
+    """
+    queue = state.effect_queue
+    changed = False
+    while queue and queue[0][0] <= now:
+        end, name = heapq.heappop(queue)
+        if state.effect_expiry.get(name) == end:
+            del state.effect_expiry[name]
+            state.active_effects[name] = False
+            changed = True
+    if changed:
+        apply_effects(state)
+    return changed
+
+
+def clear_effects(state):
+    """Termine tous les effets et rend aux paddles leur vitesse et leur taille de base."""
+    for name in state.active_effects:
+        state.active_effects[name] = False
+    state.effect_expiry.clear()
+    state.effect_queue.clear()
+    apply_effects(state)
+
+
+def apply_effects(state):
+    """
+    Recalcule la vitesse et la taille des paddles à partir des effets actifs : chaque
+    attribut part de sa valeur de base et prend le facteur de l'effet actif de plus haute
+    priorité qui le vise. Appelée seulement quand un effet commence ou se termine.
+    """
+    chosen = {}
+    for name, is_active in state.active_effects.items():
+        if is_active:
+            effect, player = EFFECT_OWNERS[name]
+            spec = EFFECT_TYPES[effect]
+            target = player if spec["target"] == "self" else OPPONENTS[player]
+            key = (target, spec["attribute"])
+            if key not in chosen or spec["priority"] > chosen[key]["priority"]:
+                chosen[key] = spec
+
+    bases = {"speed": PADDLE_SPEED, "height": state.base_paddle_height}
+    for player, paddle in (("a", state.paddle_a), ("b", state.paddle_b)):
+        for attribute, base in bases.items():
+            spec = chosen.get((player, attribute))
+            setattr(paddle, attribute, base * spec["factor"] if spec else base)
+
+
+def move_paddle(paddle, direction, height, scale):
+    """
+    Déplace un paddle vers le haut (-1) ou le bas (1) s'il n'a pas atteint le bord.
+    """
+    if direction < 0 and paddle.y > 0:
+        paddle.y -= paddle.speed * scale
+    elif direction > 0 and paddle.y + paddle.height < height - 1:
+        paddle.y += paddle.speed * scale
+
+
+def overlaps(ball, paddle):
+    """Indique si la balle chevauche le paddle."""
+    return (ball.x < paddle.x + paddle.width and paddle.x < ball.x + ball.size
+            and ball.y < paddle.y + paddle.height and paddle.y < ball.y + ball.size)
+
+
+def award_point(state, player, events):
+    """
+    Attribue un point au joueur et termine la partie si le score limite est atteint.
+    """
+    events.append(EVENT_POINT)
+    if player == "a":
+        state.score_a += 1
+        score = state.score_a
+    else:
+        state.score_b += 1
+        score = state.score_b
+    if score == WIN_SCORE:
+        state.winner = "Joueur A" if player == "a" else "Joueur B"
+        state.running = False
+
+
+def restart_rally(state):
+    """Remet la balle au centre, relance le délai avant le service et termine les effets."""
+    serve(state)
+    state.serve_timer = RESET_DELAY_MS
+    clear_effects(state)
+
+
+def score_point(state, player, events):
+    """
+    Attribue un point au joueur, réinitialise la balle et les effets,
+    et termine la partie si le score limite est atteint.
+    """
+    award_point(state, player, events)
+    restart_rally(state)
+
+
+def time_of_impact(state, dx, dy):
+    """
+    Calcule le premier contact de la balle pendant un déplacement (dx, dy) :
+    murs haut et bas, face avant du paddle A (balle allant à gauche) et du paddle B
+    (balle allant à droite). Les paddles sont considérés immobiles pendant le déplacement.
+
+    Returns:
+        tuple: (t, obstacle) avec t dans [0, 1] la fraction du déplacement parcourue
+        au moment du contact, et obstacle parmi "wall", "a", "b" ou None sans contact.
+    """
+    ball = state.ball
+    t_hit, obstacle = 1.0, None
+
+    bottom = state.height - 1 - ball.size
+    if dy < 0 and ball.y + dy <= 0:
+        t_hit, obstacle = max(0.0, ball.y / -dy), "wall"
+    elif dy > 0 and ball.y + dy >= bottom:
+        t_hit, obstacle = max(0.0, (bottom - ball.y) / dy), "wall"
+
+    if dx < 0:
+        paddle, face, side = state.paddle_a, state.paddle_a.x + state.paddle_a.width, "a"
+        crossing = ball.x >= face > ball.x + dx
+        t = (face - ball.x) / dx if crossing else 1.0
+    elif dx > 0:
+        paddle, face, side = state.paddle_b, state.paddle_b.x - ball.size, "b"
+        crossing = ball.x <= face < ball.x + dx
+        t = (face - ball.x) / dx if crossing else 1.0
+    else:
+        crossing = False
+    if crossing and t < t_hit:
+        y = ball.y + dy * t
+        if y < paddle.y + paddle.height and paddle.y < y + ball.size:
+            t_hit, obstacle = t, side
+    return t_hit, obstacle
+
+
+def move_ball(state, scale, events):
+    """
+    Déplace la balle et gère les collisions (murs, paddles) et les points marqués.
+
+    Le déplacement est balayé : l'instant exact de chaque contact est calculé, la balle
+    y est placée puis rebondit et parcourt le reste du déplacement. La balle ne peut donc
+    pas traverser un paddle, quelle que soit sa vitesse ou la durée du pas.
+    """
+    ball = state.ball
+    paddle_a, paddle_b = state.paddle_a, state.paddle_b
+    remaining = 1.0
+    for _ in range(MAX_BOUNCES_PER_STEP):
+        dx = ball.speed_x * scale * remaining
+        dy = ball.speed_y * scale * remaining
+        t, obstacle = time_of_impact(state, dx, dy)
+        ball.x += dx * t
+        ball.y += dy * t
+        if obstacle is None:
+            break
+        if obstacle == "wall":
+            ball.speed_y *= -1
+            events.append(EVENT_WALL)
+        else:
+            ball.speed_x *= -1
+            events.append(EVENT_PADDLE)
+        remaining *= 1 - t
+
+    # Paddle déplacé sur la balle : on la repousse devant sa face
+    if overlaps(ball, paddle_a):
+        ball.x = paddle_a.x + paddle_a.width
+        ball.speed_x = abs(ball.speed_x)
+        events.append(EVENT_PADDLE)
+    elif overlaps(ball, paddle_b):
+        ball.x = paddle_b.x - ball.size
+        ball.speed_x = -abs(ball.speed_x)
+        events.append(EVENT_PADDLE)
+
+    if ball.x <= 0:
+        score_point(state, "b", events)
+    elif ball.x + ball.size >= state.width:
+        score_point(state, "a", events)
+
+
+def step(state, inputs, dt=FRAME_MS):
+    """
+    Avance la partie d'un pas de simulation.
+
+    Args:
+        state (MatchState): État de la partie, modifié sur place.
+        inputs (tuple): Directions des paddles (a, b) : -1 haut, 0 immobile, 1 bas.
+        dt (float): Durée du pas en millisecondes.
+
+    Returns:
+        list: Événements survenus pendant le pas (EVENT_WALL, EVENT_PADDLE, EVENT_POINT, EVENT_BONUS).
+    """
+    events = []
+    if not state.running:
+        return events
+    state.time += dt
+    now = state.time
+    scale = dt / FRAME_MS
+    bonus = state.bonus
+
+    # Gestion du bonus
+    if now - state.last_bonus_spawn > state.bonus_spawn_interval and not bonus.active:
+        spawn_bonus(bonus, state.width, state.height, state.rng, now)
+        state.last_bonus_spawn = now
+
+    if state.effect_queue:
+        expire_effects(state, now)
+
+    if bonus.active:
+        effect = (collect_bonus(bonus, state.paddle_a, "a", now)
+                  or collect_bonus(bonus, state.paddle_b, "b", now))
+        if effect:
+            events.append(EVENT_BONUS)
+            start_effect(state, effect, now)
+
+    if now - state.last_speedup > SPEEDUP_INTERVAL:
+        state.ball.speed_x *= SPEEDUP_FACTOR
+        state.ball.speed_y *= SPEEDUP_FACTOR
+        if state.balls is not None:
+            state.balls.speed_up(SPEEDUP_FACTOR)
+        state.last_speedup = now
+
+    move_paddle(state.paddle_a, inputs[0], state.height, scale)
+    move_paddle(state.paddle_b, inputs[1], state.height, scale)
+
+    if state.serve_timer > 0:
+        state.serve_timer -= dt
+    elif state.balls is not None:
+        state.balls.move(state, scale, events)
+    else:
+        move_ball(state, scale, events)
+
+    # Faire disparaître le bonus après sa durée de vie
+    if bonus.active and now - bonus.spawn_time > bonus.duration:
+        bonus.active = False
+    return events
@@ -1,31 +1,121 @@
 """
-Initialise et charge les sons du jeu depuis le dossier 'assets' en utilisant pygame.mixer.
+Sons du jeu, fournis par le registre des ressources (assets.py) : chaque fichier du
+dossier 'assets' n'est chargé qu'une seule fois par processus.
+
+La lecture passe par un SoundBoard : chaque catégorie de son (rebond sur un paddle,
+sur un mur, point marqué) a ses propres canaux réservés, que les autres sons ne peuvent
+pas voler. Les déclenchements d'une frame sont regroupés (un son par catégorie et par
+frame) et une catégorie n'est pas rejouée avant son intervalle minimal : une balle
+rapide qui rebondit toutes les quelques frames ne sature plus les canaux.
+
+Classes:
+    - SoundBoard: Canaux réservés, regroupement des déclenchements et estimation de latence.
 """
 
-import os
+import time
 import pygame
+from constants import SOUND_CATEGORIES
+import settings
+from assets import get_sound, init_mixer
 
 
-def init_sounds():
+class SoundBoard:
     """
-    Initialise les sons pour le jeu Pong.
+    Lecture des sons du jeu sur des canaux réservés par catégorie.
 
-    Cette fonction configure le module mixer de Pygame, détermine les chemins absolus
-    des fichiers audio nécessaires et charge ces sons pour une utilisation ultérieure.
+    trigger(category) note qu'un son est demandé pendant la frame ; flush() joue, une
+    seule fois, chaque catégorie demandée dont l'intervalle minimal est écoulé. Si tous
+    les canaux d'une catégorie sont occupés, le plus ancien est réutilisé.
 
-    Returns:
-        tuple : Contient trois objets pygame.mixer.Sound correspondant aux sons chargés.
+    La latence déclenchement → sortie n'est qu'estimée : l'attente moyenne jusqu'à flush()
+    est mesurée, mais SDL ne dit pas quand le son quitte réellement le mixer ; la durée
+    du tampon du mixer est ajoutée comme borne de ce délai.
+
+    Attributs :
+        categories (dict) : Catégorie → réglages (voir constants.SOUND_CATEGORIES).
+        sounds (dict) : Catégorie → pygame.mixer.Sound.
+        channels (dict) : Catégorie → liste de ses canaux réservés.
+        buffer_ms (float) : Durée du tampon du mixer (settings.AUDIO_BUFFER_SIZE) en millisecondes.
+        pending (dict) : Catégorie → instant du premier déclenchement de la frame.
+        wait_ms (float) : Attente totale entre déclenchement et flush() des sons joués.
+        played, coalesced, limited (int) : Sons joués, déclenchements regroupés dans une
+            frame et sons ignorés à cause de l'intervalle minimal.
     """
-    pygame.mixer.init()
-    # Récupérer le dossier où se trouve ce script
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    # Construire le chemin absolu vers chaque fichier son
-    ping_a_path = os.path.join(base_dir, 'assets', 'ping_a.wav')
-    pong_b_path = os.path.join(base_dir, 'assets', 'pong_b.wav')
-    ping_pong_c_path = os.path.join(base_dir, 'assets', 'ping_pong_c.wav')
-
-    # load les sons avec les chemins absolus
-    ping_a = pygame.mixer.Sound(ping_a_path)
-    pong_b = pygame.mixer.Sound(pong_b_path)
-    ping_pong_c = pygame.mixer.Sound(ping_pong_c_path)
-    return ping_a, pong_b, ping_pong_c
+    def __init__(self, categories=SOUND_CATEGORIES):
+        init_mixer()
+        self.categories = categories
+        self.sounds = {name: get_sound(category["file"]) for name, category in categories.items()}
+
+        # Canaux réservés : Sound.play() sans canal explicite ne peut pas les prendre
+        reserved = sum(category["channels"] for category in categories.values())
+        if pygame.mixer.get_num_channels() < reserved:
+            pygame.mixer.set_num_channels(reserved)
+        pygame.mixer.set_reserved(reserved)
+        self.channels = {}
+        index = 0
+        for name, category in categories.items():
+            self.channels[name] = [pygame.mixer.Channel(index + i) for i in range(category["channels"])]
+            index += category["channels"]
+        self.started = {name: [0.0] * len(channels) for name, channels in self.channels.items()}
+
+        frequency, _, _ = pygame.mixer.get_init()
+        self.buffer_ms = settings.AUDIO_BUFFER_SIZE / frequency * 1000
+        self.pending = {}
+        self.last_played = dict.fromkeys(categories, float("-inf"))
+        self.wait_ms = 0.0
+        self.played = 0
+        self.coalesced = 0
+        self.limited = 0
+
+
+    def trigger(self, category):
+        """
+        Demande un son de la catégorie pour cette frame. Les catégories sans son sont ignorées.
+        """
+        if category not in self.sounds:
+            return
+        if category in self.pending:
+            self.coalesced += 1
+        else:
+            self.pending[category] = time.perf_counter()
+
+
+    def flush(self):
+        """Joue les sons demandés depuis le dernier appel, au plus un par catégorie."""
+        if not self.pending:
+            return
+        now = time.perf_counter()
+        for category, triggered in self.pending.items():
+            if (now - self.last_played[category]) * 1000 < self.categories[category]["min_interval_ms"]:
+                self.limited += 1
+                continue
+            self.play(category, now)
+            self.wait_ms += (now - triggered) * 1000
+            self.played += 1
+        self.pending.clear()
+
+
+    def play(self, category, now):
+        """Joue le son de la catégorie sur un canal libre, sinon sur le plus ancien des siens."""
+        channels, started = self.channels[category], self.started[category]
+        index = next((i for i, channel in enumerate(channels) if not channel.get_busy()), None)
+        if index is None:
+            index = min(range(len(channels)), key=started.__getitem__)
+        channels[index].play(self.sounds[category])
+        started[index] = now
+        self.last_played[category] = now
+
+
+    def stats(self):
+        """
+        Returns:
+            dict: Latence estimée (attente moyenne jusqu'à flush() plus durée du tampon,
+            en ms), durée du tampon et compteurs (joués, regroupés, limités).
+        """
+        return {
+            "latency_estimate_ms": self.wait_ms / max(1, self.played) + self.buffer_ms,
+            "buffer_ms": self.buffer_ms,
+            "played": self.played,
+            "coalesced": self.coalesced,
+            "limited": self.limited,
+        }
@@ -0,0 +1,104 @@
+"""
+Tests de la simulation vectorisée (batch.py) : à tirages aléatoires identiques,
+chaque partie du lot doit suivre exactement la partie scalaire de simulation.step.
+
+Exemple :
+    python -m unittest discover -s PONGAPP/tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import simulation
+from batch import BatchSimulation
+
+WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE = 800, 400, 100, 15
+
+
+def sync_serve(batch, i, state):
+    """Recopie dans la partie i du lot la vitesse de service tirée par la partie scalaire."""
+    batch.speed_x[i], batch.speed_y[i] = state.ball.speed_x, state.ball.speed_y
+
+
+def sync_bonus(batch, i, state):
+    """
+    Fait apparaître dans la partie i du lot, avant son pas, le bonus tiré par la partie
+    scalaire pendant le même pas (il peut être ramassé dès ce pas).
+    """
+    bonus = state.bonus
+    batch.bonus_active[i] = True
+    batch.bonus_type[i] = bonus.type
+    batch.bonus_x[i], batch.bonus_y[i] = bonus.x, bonus.y
+    batch.bonus_spawn_time[i] = batch.last_bonus_spawn[i] = bonus.spawn_time
+
+
+def follow(paddle, ball, lag):
+    """Direction d'un paddle qui suit la balle avec un retard (pour varier les échanges)."""
+    target = ball.y + ball.size / 2 + lag
+    center = paddle.y + paddle.height / 2
+    return 0 if abs(target - center) < paddle.speed else (1 if target > center else -1)
+
+
+class BatchEquivalenceTest(unittest.TestCase):
+    """Le lot et les parties scalaires avancent du même pas."""
+
+    def assert_same(self, batch, i, state, step):
+        ball, paddle_a, paddle_b = state.ball, state.paddle_a, state.paddle_b
+        expected = (ball.x, ball.y, ball.speed_x, ball.speed_y,
+                    paddle_a.y, paddle_b.y, paddle_a.height, paddle_b.height,
+                    paddle_a.speed, paddle_b.speed, state.score_a, state.score_b,
+                    state.bonus.active)
+        actual = (batch.ball_x[i], batch.ball_y[i], batch.speed_x[i], batch.speed_y[i],
+                  batch.paddle_a_y[i], batch.paddle_b_y[i],
+                  batch.paddle_a_height[i], batch.paddle_b_height[i],
+                  batch.paddle_a_speed[i], batch.paddle_b_speed[i],
+                  batch.score_a[i], batch.score_b[i], batch.bonus_active[i])
+        for name, want, got in zip(("ball_x", "ball_y", "speed_x", "speed_y",
+                                    "paddle_a_y", "paddle_b_y", "paddle_a_height",
+                                    "paddle_b_height", "paddle_a_speed", "paddle_b_speed",
+                                    "score_a", "score_b", "bonus_active"), expected, actual):
+            self.assertAlmostEqual(float(want), float(got), places=6,
+                                   msg="partie %d, pas %d : %s" % (i, step, name))
+
+    def run_lockstep(self, dt, steps=20000):
+        n = 4
+        states = [simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, seed=i)
+                  for i in range(n)]
+        batch = BatchSimulation(n, WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, seed=0)
+        for i, state in enumerate(states):
+            sync_serve(batch, i, state)
+        lags = [(-40, 25), (10, -60), (55, 0), (-5, 70)]
+        points = 0
+
+        for step in range(steps):
+            inputs = np.array([(follow(state.paddle_a, state.ball, lag_a),
+                                follow(state.paddle_b, state.ball, lag_b))
+                               for state, (lag_a, lag_b) in zip(states, lags)])
+            for i, state in enumerate(states):
+                events = simulation.step(state, tuple(inputs[i]), dt)
+                points += simulation.EVENT_POINT in events
+                if state.last_bonus_spawn == state.time:
+                    sync_bonus(batch, i, state)
+            batch.step(inputs, dt)
+            if any(not state.running for state in states):
+                break
+            for i, state in enumerate(states):
+                if batch.serve_timer[i] == simulation.RESET_DELAY_MS:
+                    sync_serve(batch, i, state)
+                self.assert_same(batch, i, state, step)
+        return points
+
+    def test_lockstep_at_reference_frame(self):
+        self.assertGreater(self.run_lockstep(simulation.FRAME_MS), 0)
+
+    def test_lockstep_with_large_steps(self):
+        self.assertGreater(self.run_lockstep(3 * simulation.FRAME_MS), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+"""
+Tests de la diffusion (broadcast.py).
+
+Exemple :
+    python -m unittest discover -s PONGAPP/tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import broadcast
+import network
+import simulation
+from constants import WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, FRAME_MS
+
+RALLY_MS = 10 * 60 * 1000  # Échange de 10 minutes sans point
+
+
+class FakeTransport:
+    """Transport qui garde les paquets envoyés au lieu de les émettre."""
+
+    def __init__(self):
+        self.sent = []
+
+    def sendto(self, data, addr=None):
+        self.sent.append((data, addr))
+
+    def is_closing(self):
+        return False
+
+
+class LongRallyTest(unittest.TestCase):
+    """Une balle qui accélère pendant un long échange doit rester encodable."""
+
+    def test_long_rally(self):
+        # Des paddles de la hauteur du terrain renvoient toutes les balles : aucun point
+        state = simulation.new_match(WIDTH, HEIGHT, HEIGHT, BALL_SIZE, 1)
+        previous = None
+        for seq in range(1, int(RALLY_MS / FRAME_MS) + 1):
+            simulation.step(state, (0, 0), FRAME_MS)
+            values = broadcast.quantize(state)
+            packet = broadcast.encode_frame(seq, values, seq - 1 if previous else 0, previous)
+            self.assertEqual(broadcast.decode_frame(packet, previous), values)
+            previous = values
+        self.assertEqual((state.score_a, state.score_b), (0, 0))
+        # La vitesse a dépassé ce que le champ peut contenir : elle est bornée, signe compris
+        self.assertGreater(abs(state.ball.speed_x) * broadcast.SPEED_SCALE, broadcast.SPEED_LIMIT)
+        self.assertEqual(abs(values[3]), broadcast.SPEED_LIMIT)
+        self.assertEqual(values[3] > 0, state.ball.speed_x > 0)
+
+
+class FrameTest(unittest.TestCase):
+    """Le spectateur retrouve l'état diffusé, bonus compris."""
+
+    def test_bonus_timing_round_trip(self):
+        state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, 2)
+        bonus = state.bonus
+        bonus.active, bonus.type, bonus.x, bonus.y = False, 1, 120, 180
+        bonus.spawn_time, bonus.collected_time, bonus.collected_by = 15017, 18250, "b"
+        state.time = 18300
+
+        spectator = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, 0)
+        packet = broadcast.encode_frame(1, broadcast.quantize(state))
+        broadcast.dequantize(spectator, broadcast.decode_frame(packet))
+        received = spectator.bonus
+        self.assertEqual((received.spawn_time, received.collected_time, received.collected_by),
+                         (15017, 18250, "b"))
+        self.assertEqual((received.type, received.x, received.y), (1, 120, 180))
+
+    def test_delta_carries_only_changed_fields(self):
+        state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, 3)
+        first = broadcast.quantize(state)
+        state.bonus.collected_time = 900
+        second = broadcast.quantize(state)
+        delta = broadcast.encode_frame(2, second, 1, first)
+        full = broadcast.encode_frame(2, second)
+        self.assertLess(len(delta), len(full))
+        self.assertEqual(broadcast.decode_frame(delta, first), second)
+
+
+class FlowControlTest(unittest.TestCase):
+    """Un spectateur sans perte reçoit toutes les frames, quel que soit son RTT."""
+
+    def run_subscriber(self, rtt_frames, frames=600):
+        """
+        Diffuse `frames` frames à un spectateur sans perte dont les confirmations mettent
+        rtt_frames frames à revenir, avec une horloge simulée (une frame par pas).
+
+        Returns:
+            tuple: (serveur, spectateur, frames sautées après le premier aller-retour)
+        """
+        clock = [0.0]
+        server = broadcast.BroadcastServer()
+        server.connection_made(FakeTransport())
+        spectator = broadcast.Spectator(decode=False)
+        spectator.connection_made(FakeTransport())
+        addr = ("127.0.0.1", 5000)
+        in_transit = []  # (frame d'arrivée au serveur, paquet)
+        state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, 4)
+        skipped_after_warmup = 0
+        with mock.patch.object(broadcast.time, "monotonic", lambda: clock[0]):
+            server.datagram_received(bytes([broadcast.SUBSCRIBE]), addr)
+            for frame in range(frames):
+                clock[0] = frame * FRAME_MS / 1000
+                while in_transit and in_transit[0][0] <= frame:
+                    server.datagram_received(in_transit.pop(0)[1], addr)
+                skipped = server.skipped
+                simulation.step(state, (0, 0))
+                server.transport.sent.clear()
+                server.publish(state)
+                if frame > 2 * rtt_frames + broadcast.ACK_INTERVAL:
+                    skipped_after_warmup += server.skipped - skipped
+                for data, _ in server.transport.sent:
+                    spectator.datagram_received(data, None)
+                for data, _ in spectator.transport.sent:
+                    in_transit.append((frame + rtt_frames, data))
+                spectator.transport.sent.clear()
+        return server, spectator, skipped_after_warmup
+
+    def test_lossless_subscriber_gets_every_frame(self):
+        for rtt_frames in (1, 6, 40, 150):
+            with self.subTest(rtt_frames=rtt_frames):
+                server, spectator, skipped = self.run_subscriber(rtt_frames)
+                self.assertEqual(skipped, 0)
+                self.assertAlmostEqual(server.subscribers[("127.0.0.1", 5000)].rtt,
+                                       rtt_frames * FRAME_MS / 1000)
+                self.assertEqual(spectator.missing_base, 0)
+
+    def test_short_rtt_gets_every_frame_from_the_start(self):
+        server, spectator, _ = self.run_subscriber(6)
+        self.assertEqual(server.skipped, 0)
+        self.assertEqual(spectator.received, server.seq)
+
+    def test_window_grows_with_rtt(self):
+        short = broadcast.in_flight_window(0.02)
+        long = broadcast.in_flight_window(0.5)
+        self.assertGreater(short, broadcast.ACK_INTERVAL)
+        self.assertGreater(long, short + 2 * 0.48 * 1000 / FRAME_MS - 1)
+
+    def test_rtt_follows_acknowledgements(self):
+        subscriber = broadcast.Subscriber(("127.0.0.1", 5000), 0, 0.0)
+        self.assertIsNone(subscriber.rtt)
+        subscriber.acknowledge(1, 0.0, 0.5)
+        self.assertAlmostEqual(subscriber.rtt, 0.5)
+        for seq in range(2, 200):
+            subscriber.acknowledge(seq, seq * 0.016, seq * 0.016 + 0.3)
+        self.assertAlmostEqual(subscriber.rtt, 0.3, places=3)
+        self.assertEqual(subscriber.window, broadcast.in_flight_window(subscriber.rtt))
+
+    def test_silent_subscriber_is_slowed_down(self):
+        server = broadcast.BroadcastServer()
+        server.connection_made(FakeTransport())
+        addr = ("127.0.0.1", 5000)
+        server.datagram_received(bytes([broadcast.SUBSCRIBE]), addr)
+        state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, 5)
+        for _ in range(120):
+            server.publish(state)
+        window = server.subscribers[addr].window
+        self.assertGreater(server.skipped, 0)
+        self.assertLessEqual(len(server.transport.sent), window + (120 - window) // broadcast.SLOW_INTERVAL + 2)
+
+
+class PublishHookTest(unittest.TestCase):
+    """Diffusion d'une partie jouée sur le serveur réseau."""
+
+    def test_server_publishes_each_step(self):
+        server = network.PongServer(seed=3)
+        server.connection_made(FakeTransport())
+        for port in (5001, 5002):
+            server.datagram_received(network.JOIN_PACKET.pack(network.JOIN, 7), ("127.0.0.1", port))
+        published = []
+        server.add_publisher(7, published.append)
+        server.add_publisher(8, self.fail)
+        for _ in range(5):
+            server.tick()
+        match = server.matches[7]
+        self.assertEqual(len(published), 5)
+        self.assertTrue(all(state is match.state for state in published))
+
+    def test_broadcaster_receives_server_match(self):
+        server = network.PongServer(seed=3)
+        server.connection_made(FakeTransport())
+        for port in (5001, 5002):
+            server.datagram_received(network.JOIN_PACKET.pack(network.JOIN, 7), ("127.0.0.1", port))
+        broadcaster = broadcast.BroadcastServer()
+        broadcaster.connection_made(FakeTransport())
+        broadcaster.datagram_received(bytes([broadcast.SUBSCRIBE]), ("127.0.0.1", 6000))
+        server.add_publisher(7, broadcaster.publish)
+        sent = len(broadcaster.transport.sent)
+        server.tick()
+        self.assertEqual(broadcaster.seq, 1)
+        self.assertEqual(len(broadcaster.transport.sent), sent + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
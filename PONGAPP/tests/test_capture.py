@@ -0,0 +1,78 @@
+"""
+Tests de la capture vidéo et des captures d'écran (capture.py).
+
+Exemple :
+    python -m unittest discover -s PONGAPP/tests
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import capture
+from capture import FrameCapture
+
+SIZE = (64, 32)
+
+
+class CaptureTest(unittest.TestCase):
+    """Anneau d'images, surface des captures d'écran et dossiers de capture."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.surface = pygame.Surface(SIZE)
+        self.surface.fill((200, 100, 50))
+
+    def test_screenshot_is_kept_when_the_ring_is_full(self):
+        release = threading.Event()
+        write = FrameCapture.write
+
+        def slow_write(self, surface, kind, index):
+            release.wait()
+            write(self, surface, kind, index)
+
+        with mock.patch.object(FrameCapture, "write", slow_write):
+            frames = FrameCapture(SIZE, "png", self.directory.name, capacity=2)
+            results = [frames.capture(self.surface) for _ in range(6)]
+            self.assertTrue(frames.screenshot(self.surface))
+            release.set()
+            stats = frames.close()
+        self.assertEqual(results[:2], [True, True])
+        self.assertEqual(stats["dropped"], results.count(False))
+        self.assertGreater(stats["dropped"], 0)
+        self.assertEqual(stats["written"], 3)
+        self.assertEqual(sorted(os.listdir(frames.path)),
+                         ["frame-000001.png", "frame-000002.png", "screenshot-1.png"])
+
+    def test_same_second_captures_do_not_collide(self):
+        with mock.patch.object(capture.time, "strftime", lambda fmt: "20261018-120000"):
+            captures = [FrameCapture(SIZE, None, self.directory.name) for _ in range(3)]
+        for frames in captures:
+            frames.screenshot(self.surface)
+            frames.close()
+        paths = [frames.path for frames in captures]
+        self.assertEqual(len(set(paths)), 3)
+        self.assertEqual(sorted(os.path.basename(path) for path in paths),
+                         ["20261018-120000", "20261018-120000-2", "20261018-120000-3"])
+        for path in paths:
+            self.assertEqual(os.listdir(path), ["screenshot-1.png"])
+
+    def test_png_round_trip(self):
+        frames = FrameCapture(SIZE, None, self.directory.name)
+        frames.screenshot(self.surface)
+        frames.close()
+        image = pygame.image.load(os.path.join(frames.path, "screenshot-1.png"))
+        self.assertEqual(image.get_size(), SIZE)
+        self.assertEqual(tuple(image.get_at((10, 10)))[:3], (200, 100, 50))
+
+
+if __name__ == "__main__":
+    unittest.main()
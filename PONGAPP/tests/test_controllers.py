@@ -0,0 +1,93 @@
+"""
+Tests des contrôleurs de paddle (controllers.py).
+
+Exemple :
+    python -m unittest discover -s PONGAPP/tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import simulation
+from constants import FRAME_MS
+from controllers import PredictController, predict_crossing, DIFFICULTIES
+
+WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE = 800, 400, 100, 15
+BOTTOM = HEIGHT - 1 - BALL_SIZE
+
+
+def bounce(y, speed_y, frames, bottom):
+    """Hauteur de la balle après `frames` frames, rebond par rebond (référence)."""
+    for _ in range(frames):
+        y += speed_y
+        if y < 0:
+            y, speed_y = -y, -speed_y
+        elif y > bottom:
+            y, speed_y = 2 * bottom - y, -speed_y
+    return y
+
+
+class PredictCrossingTest(unittest.TestCase):
+    """Repli des rebonds sur les murs en une seule opération."""
+
+    def test_matches_bounce_by_bounce(self):
+        cases = [(200, 0, 50), (200, 7, 10), (10, -9, 30), (300, 13, 400),
+                 (0, -25, 1000), (BOTTOM, 40, 333), (150.5, -3.25, 77)]
+        for y, speed_y, frames in cases:
+            with self.subTest(y=y, speed_y=speed_y, frames=frames):
+                self.assertAlmostEqual(predict_crossing(y, speed_y, frames, BOTTOM),
+                                       bounce(y, speed_y, frames, BOTTOM), places=6)
+
+    def test_stays_on_the_field(self):
+        for speed_y in (-97.0, -5.5, 5.5, 97.0):
+            for frames in range(0, 500, 7):
+                y = predict_crossing(100, speed_y, frames, BOTTOM)
+                self.assertGreaterEqual(y, 0)
+                self.assertLessEqual(y, BOTTOM)
+
+    def test_arrays_match_scalars(self):
+        y = np.array([10.0, 200.0, 384.0, 50.0])
+        speed_y = np.array([-9.0, 13.0, 40.0, 0.0])
+        frames = np.array([30.0, 400.0, 333.0, 12.0])
+        expected = [predict_crossing(*values, BOTTOM) for values in zip(y, speed_y, frames)]
+        np.testing.assert_allclose(predict_crossing(y, speed_y, frames, BOTTOM), expected)
+
+
+class PredictControllerTest(unittest.TestCase):
+    """L'ordinateur sans retard ni erreur renvoie les balles rapides."""
+
+    def play_until_crossing(self, controller, state):
+        """Fait jouer le contrôleur jusqu'à ce que la balle revienne ou marque."""
+        for _ in range(600):
+            events = simulation.step(state, (controller.decide(state), 0))
+            if simulation.EVENT_PADDLE in events or simulation.EVENT_POINT in events:
+                return events
+        self.fail("La balle n'a pas atteint le paddle")
+
+    def test_returns_balls_after_several_bounces(self):
+        for seed, speed_y in ((1, 23.0), (2, -31.0), (3, 47.0)):
+            with self.subTest(speed_y=speed_y):
+                state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, seed)
+                state.serve_timer = 0
+                ball = state.ball
+                ball.x, ball.y, ball.speed_x, ball.speed_y = WIDTH - 100, 180, -9.0, speed_y
+                events = self.play_until_crossing(PredictController("a"), state)
+                self.assertIn(simulation.EVENT_PADDLE, events)
+                self.assertEqual(state.score_b, 0)
+
+    def test_reaction_delay_follows_step_duration(self):
+        state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, 1)
+        controller = PredictController("a", **DIFFICULTIES["moyen"])
+        controller.decide(state)
+        self.assertEqual(controller.observations.maxlen, 9)
+        controller.decide(state, 4 * FRAME_MS)
+        self.assertEqual(controller.observations.maxlen, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
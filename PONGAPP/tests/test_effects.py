@@ -0,0 +1,108 @@
+"""
+Tests des effets des bonus (simulation.start_effect et file des expirations).
+
+Exemple :
+    python -m unittest discover -s PONGAPP/tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import simulation
+from constants import (
+    PADDLE_SPEED, PADDLE_HEIGHT, BONUS_DURATION, SPEED_BOOST, SPEED_SLOW, SIZE_BOOST,
+    EFFECT_TYPES
+)
+
+WIDTH, HEIGHT, BALL_SIZE = 800, 400, 15
+
+
+def new_state():
+    """Partie neuve, sans effet actif."""
+    return simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, 1)
+
+
+def active(state):
+    """Noms des effets actifs."""
+    return {name for name, is_active in state.active_effects.items() if is_active}
+
+
+class StackingTest(unittest.TestCase):
+    """Règles de cumul "replace" et "extend"."""
+
+    def test_replace_ends_the_players_other_effects(self):
+        state = new_state()
+        simulation.start_effect(state, "increase_speed_a", 0)
+        simulation.start_effect(state, "slow_opponent_b", 0)
+        simulation.start_effect(state, "increase_size_a", 1000)
+        self.assertEqual(active(state), {"increase_size_a", "slow_opponent_b"})
+        self.assertAlmostEqual(state.paddle_a.height, PADDLE_HEIGHT * SIZE_BOOST)
+        self.assertAlmostEqual(state.paddle_a.speed, PADDLE_SPEED * SPEED_SLOW)
+
+    def test_replace_restarts_the_duration(self):
+        state = new_state()
+        simulation.start_effect(state, "increase_speed_a", 0)
+        simulation.start_effect(state, "increase_speed_a", 4000)
+        self.assertEqual(state.effect_expiry["increase_speed_a"], 4000 + BONUS_DURATION)
+        self.assertFalse(simulation.expire_effects(state, BONUS_DURATION))
+        self.assertIn("increase_speed_a", active(state))
+        self.assertTrue(simulation.expire_effects(state, 4000 + BONUS_DURATION))
+        self.assertEqual(active(state), set())
+        self.assertEqual(state.paddle_a.speed, PADDLE_SPEED)
+
+    def test_extend_adds_to_the_remaining_time(self):
+        spec = dict(EFFECT_TYPES["increase_speed"], stacking="extend")
+        with mock.patch.dict(EFFECT_TYPES, increase_speed=spec):
+            state = new_state()
+            simulation.start_effect(state, "increase_size_a", 0)
+            simulation.start_effect(state, "increase_speed_a", 0)
+            simulation.start_effect(state, "increase_speed_a", 4000)
+        self.assertEqual(state.effect_expiry["increase_speed_a"], 2 * BONUS_DURATION)
+        self.assertEqual(active(state), {"increase_size_a", "increase_speed_a"})
+        self.assertAlmostEqual(state.paddle_a.speed, PADDLE_SPEED * SPEED_BOOST)
+
+    def test_priority_wins_on_the_same_attribute(self):
+        state = new_state()
+        simulation.start_effect(state, "slow_opponent_b", 0)
+        simulation.start_effect(state, "increase_speed_a", 0)
+        self.assertAlmostEqual(state.paddle_a.speed, PADDLE_SPEED * SPEED_SLOW)
+
+
+class ExpiryQueueTest(unittest.TestCase):
+    """Les effets se terminent dans l'ordre de leur fin, une fois chacun."""
+
+    def test_effects_end_in_order(self):
+        state = new_state()
+        spec = dict(EFFECT_TYPES["increase_size"], stacking="extend")
+        with mock.patch.dict(EFFECT_TYPES, increase_size=spec):
+            simulation.start_effect(state, "increase_speed_a", 3000)
+            simulation.start_effect(state, "slow_opponent_b", 1000)
+            simulation.start_effect(state, "increase_size_b", 2000)
+        ends = sorted(state.effect_expiry.values())
+        self.assertEqual(ends, [1000 + BONUS_DURATION, 2000 + BONUS_DURATION, 3000 + BONUS_DURATION])
+        self.assertEqual(state.effect_queue[0], (ends[0], "slow_opponent_b"))
+        remaining = [{"increase_size_b", "increase_speed_a"}, {"increase_speed_a"}, set()]
+        for end, expected in zip(ends, remaining):
+            self.assertFalse(simulation.expire_effects(state, end - 1))
+            self.assertTrue(simulation.expire_effects(state, end))
+            self.assertEqual(active(state), expected)
+        self.assertEqual(state.effect_queue, [])
+        self.assertEqual((state.paddle_a.speed, state.paddle_b.height), (PADDLE_SPEED, PADDLE_HEIGHT))
+
+    def test_replaced_entries_are_ignored(self):
+        state = new_state()
+        simulation.start_effect(state, "increase_speed_a", 0)
+        simulation.start_effect(state, "increase_size_a", 500)
+        self.assertEqual(len(state.effect_queue), 2)
+        self.assertFalse(simulation.expire_effects(state, BONUS_DURATION))
+        self.assertEqual(active(state), {"increase_size_a"})
+        self.assertTrue(simulation.expire_effects(state, 500 + BONUS_DURATION))
+        self.assertEqual(state.effect_queue, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests des replays (replay.py) : aller-retour binaire, relecture à l'identique et
+déplacement dans un replay à partir des images clés.
+
+Exemple :
+    python -m unittest discover -s PONGAPP/tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import replay
+import simulation
+
+WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE = 800, 400, 100, 15
+
+
+def snapshot(state):
+    """Valeurs observables d'une partie, pour comparer deux états."""
+    ball, bonus = state.ball, state.bonus
+    return (state.time, ball.x, ball.y, ball.speed_x, ball.speed_y,
+            state.paddle_a.y, state.paddle_b.y, state.paddle_a.height, state.paddle_b.height,
+            state.score_a, state.score_b, state.winner, state.serve_timer,
+            bonus.active, bonus.type, bonus.x, bonus.y)
+
+
+def record_match(seed=7, steps=3000):
+    """Joue une partie avec des directions variées et retourne (enregistreur, état final)."""
+    state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, seed)
+    recorder = replay.ReplayRecorder.from_state(state)
+    for i in range(steps):
+        if not state.running:
+            break
+        inputs = ((i // 7) % 3 - 1, (i * 5 // 11) % 3 - 1)
+        recorder.record(inputs, state)
+        simulation.step(state, inputs)
+    return recorder, state
+
+
+class ReplayTest(unittest.TestCase):
+    """Un replay relu redonne exactement la partie enregistrée."""
+
+    def test_round_trip(self):
+        recorder, state = record_match()
+        loaded = replay.Replay.from_bytes(recorder.to_bytes())
+        self.assertEqual(loaded.seed, recorder.seed)
+        self.assertEqual((loaded.width, loaded.height, loaded.paddle_height, loaded.ball_size),
+                         (WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE))
+        self.assertEqual(loaded.dt, recorder.dt)
+        self.assertEqual(loaded.inputs, recorder.inputs)
+        self.assertEqual(snapshot(loaded.play()), snapshot(state))
+
+    def test_frames_decode_recorded_inputs(self):
+        recorder, _ = record_match(steps=50)
+        expected = [((i // 7) % 3 - 1, (i * 5 // 11) % 3 - 1) for i in range(50)]
+        self.assertEqual(list(replay.Replay.from_bytes(recorder.to_bytes()).frames()), expected)
+
+    def test_partial_play_matches_live_state(self):
+        recorder, _ = record_match(seed=3)
+        loaded = replay.Replay.from_bytes(recorder.to_bytes())
+        state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, 3)
+        for inputs in list(loaded.frames())[:1234]:
+            simulation.step(state, inputs)
+        self.assertEqual(snapshot(loaded.play(until=1234)), snapshot(state))
+
+    def test_save_and_load(self):
+        recorder, state = record_match(seed=11, steps=500)
+        with tempfile.TemporaryDirectory() as directory:
+            path = recorder.save(os.path.join(directory, "partie" + replay.EXTENSION))
+            loaded = replay.Replay.load(path)
+        self.assertEqual(snapshot(loaded.play()), snapshot(state))
+
+    def test_rejects_invalid_data(self):
+        data = record_match(steps=100)[0].to_bytes()
+        with self.assertRaises(ValueError):
+            replay.Replay.from_bytes(data[:10])
+        with self.assertRaises(ValueError):
+            replay.Replay.from_bytes(b"XXXX" + data[4:])
+        with self.assertRaises(ValueError):
+            replay.Replay.from_bytes(data[:4] + bytes([replay.VERSION + 1]) + data[5:])
+
+
+class SeekTest(unittest.TestCase):
+    """Aller à un pas donne le même état que rejouer la partie depuis le début."""
+
+    @classmethod
+    def setUpClass(cls):
+        recorder, _ = record_match(seed=5, steps=3 * replay.KEYFRAME_INTERVAL + 17)
+        cls.replay = replay.Replay.from_bytes(recorder.to_bytes())
+
+    def live_state(self, frame):
+        return self.replay.play(until=frame)
+
+    def test_keyframes_are_stored(self):
+        interval = self.replay.keyframe_interval
+        self.assertEqual(interval, replay.KEYFRAME_INTERVAL)
+        self.assertEqual(self.replay.keyframe_frames,
+                         list(range(0, len(self.replay.inputs), interval)))
+
+    def test_seek_at_and_around_keyframes(self):
+        interval = self.replay.keyframe_interval
+        for keyframe in range(0, len(self.replay.inputs), interval):
+            for frame in (keyframe - 1, keyframe, keyframe + 1):
+                if frame < 0:
+                    continue
+                with self.subTest(frame=frame):
+                    self.assertEqual(snapshot(self.replay.seek(frame)),
+                                     snapshot(self.live_state(frame)))
+
+    def test_seek_past_the_end(self):
+        last = len(self.replay.inputs)
+        self.assertEqual(snapshot(self.replay.seek(last + 1000)), snapshot(self.live_state(last)))
+
+    def test_seek_time(self):
+        frame = 2 * self.replay.keyframe_interval + 40
+        self.assertEqual(snapshot(self.replay.seek_time((frame + 0.5) * self.replay.dt)),
+                         snapshot(self.live_state(frame)))
+
+    def test_play_continues_after_seek(self):
+        # Le générateur aléatoire restauré doit donner les mêmes tirages (services, bonus)
+        state = self.replay.seek(self.replay.keyframe_interval + 3)
+        self.replay.play_from(state, self.replay.keyframe_interval + 3)
+        self.assertEqual(snapshot(state), snapshot(self.replay.play()))
+        self.assertEqual(state.rng.getstate(), self.replay.play().rng.getstate())
+
+    def test_snapshot_restores_the_random_generator(self):
+        state = self.live_state(2 * self.replay.keyframe_interval)
+        self.assertGreater(state.rng.words, 0)
+        restored = simulation.restore(simulation.snapshot(state))
+        self.assertEqual(restored.rng.words, state.rng.words)
+        self.assertEqual(restored.rng.getstate(), state.rng.getstate())
+        self.assertEqual(simulation.snapshot(restored), simulation.snapshot(state))
+
+
+if __name__ == "__main__":
+    unittest.main()
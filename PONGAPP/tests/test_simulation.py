@@ -0,0 +1,161 @@
+"""
+Tests du moteur de simulation (simulation.py).
+
+Exemple :
+    python -m unittest discover -s PONGAPP/tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import simulation
+from constants import FRAME_MS, PADDLE_SPEED, RESET_DELAY_MS, WIN_SCORE
+
+WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE = 800, 400, 100, 15
+
+
+def new_state(seed=1):
+    """Partie dont la balle est déjà en jeu (sans attente de service)."""
+    state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, seed)
+    state.serve_timer = 0
+    return state
+
+
+def place_ball(state, x, y, speed_x, speed_y):
+    """Place la balle à une position et une vitesse données."""
+    ball = state.ball
+    ball.x, ball.y, ball.speed_x, ball.speed_y = x, y, speed_x, speed_y
+
+
+class StepTest(unittest.TestCase):
+    """Avance d'un pas : paddles, rebonds, points et fin de partie."""
+
+    def test_same_seed_same_match(self):
+        states = [new_state(seed=42), new_state(seed=42)]
+        for i in range(600):
+            inputs = ((i // 30) % 3 - 1, (i // 45) % 3 - 1)
+            for state in states:
+                simulation.step(state, inputs)
+        first, second = states
+        self.assertEqual((first.ball.x, first.ball.y, first.ball.speed_x, first.ball.speed_y),
+                         (second.ball.x, second.ball.y, second.ball.speed_x, second.ball.speed_y))
+        self.assertEqual((first.score_a, first.score_b), (second.score_a, second.score_b))
+
+    def test_paddle_moves_in_proportion_to_dt(self):
+        state = new_state()
+        start = state.paddle_a.y
+        simulation.step(state, (1, -1), 2 * FRAME_MS)
+        self.assertAlmostEqual(state.paddle_a.y, start + 2 * PADDLE_SPEED)
+        self.assertAlmostEqual(state.paddle_b.y, start - 2 * PADDLE_SPEED)
+
+    def test_paddle_stops_at_the_edges(self):
+        state = new_state()
+        for _ in range(200):
+            simulation.step(state, (-1, 1))
+        self.assertLess(state.paddle_a.y, PADDLE_SPEED)
+        self.assertGreater(state.paddle_b.y + state.paddle_b.height, HEIGHT - 1 - PADDLE_SPEED)
+        self.assertGreater(state.paddle_a.y, -PADDLE_SPEED)
+        self.assertLess(state.paddle_b.y + state.paddle_b.height, HEIGHT + PADDLE_SPEED)
+
+    def test_ball_bounces_on_walls(self):
+        state = new_state()
+        place_ball(state, WIDTH / 2, 3, 5, -5)
+        events = simulation.step(state, (0, 0))
+        self.assertIn(simulation.EVENT_WALL, events)
+        self.assertGreater(state.ball.speed_y, 0)
+
+    def test_ball_bounces_on_paddle(self):
+        state = new_state()
+        paddle = state.paddle_a
+        place_ball(state, paddle.x + paddle.width + 5, paddle.y + paddle.height / 2, -10, 0)
+        events = simulation.step(state, (0, 0))
+        self.assertIn(simulation.EVENT_PADDLE, events)
+        self.assertGreater(state.ball.speed_x, 0)
+        self.assertGreaterEqual(state.ball.x, paddle.x + paddle.width)
+
+    def test_missed_ball_scores_and_serves_again(self):
+        state = new_state()
+        state.paddle_a.y = HEIGHT - state.paddle_a.height - 1
+        place_ball(state, 5, 10, -10, 0)
+        events = simulation.step(state, (0, 0))
+        self.assertIn(simulation.EVENT_POINT, events)
+        self.assertEqual((state.score_a, state.score_b), (0, 1))
+        self.assertEqual(state.serve_timer, RESET_DELAY_MS)
+        self.assertEqual(state.ball.x, WIDTH // 2 - BALL_SIZE // 2)
+        # La balle attend la fin du délai de service
+        x = state.ball.x
+        simulation.step(state, (0, 0))
+        self.assertEqual(state.ball.x, x)
+
+    def test_match_ends_at_win_score(self):
+        state = new_state()
+        state.score_a = WIN_SCORE - 1
+        state.paddle_b.y = 0
+        place_ball(state, WIDTH - BALL_SIZE - 5, HEIGHT - BALL_SIZE - 20, 10, 0)
+        simulation.step(state, (0, 0))
+        self.assertFalse(state.running)
+        self.assertEqual(state.winner, "Joueur A")
+        time = state.time
+        self.assertEqual(simulation.step(state, (0, 0)), [])
+        self.assertEqual(state.time, time)
+
+
+class SweptCollisionTest(unittest.TestCase):
+    """La balle ne traverse ni les murs ni les paddles, même très rapide."""
+
+    def test_fast_ball_bounces_on_paddle_a(self):
+        state = new_state()
+        paddle = state.paddle_a
+        face = paddle.x + paddle.width
+        place_ball(state, 600, paddle.y + paddle.height / 2, -1000, 0)
+        events = simulation.step(state, (0, 0))
+        self.assertEqual(events, [simulation.EVENT_PADDLE])
+        self.assertEqual((state.score_a, state.score_b), (0, 0))
+        self.assertGreater(state.ball.speed_x, 0)
+        # Contact à la face du paddle puis reste du trajet vers la droite
+        self.assertAlmostEqual(state.ball.x, face + 1000 - (600 - face))
+
+    def test_fast_ball_bounces_on_paddle_b(self):
+        state = new_state()
+        paddle = state.paddle_b
+        place_ball(state, 100, paddle.y + paddle.height / 2, 800, 0)
+        events = simulation.step(state, (0, 0))
+        self.assertIn(simulation.EVENT_PADDLE, events)
+        self.assertNotIn(simulation.EVENT_POINT, events)
+        self.assertLess(state.ball.speed_x, 0)
+        self.assertLessEqual(state.ball.x + BALL_SIZE, paddle.x)
+
+    def test_large_step_does_not_tunnel(self):
+        state = new_state()
+        paddle = state.paddle_a
+        place_ball(state, 300, paddle.y + paddle.height / 2, -10, 0)
+        events = simulation.step(state, (0, 0), 40 * FRAME_MS)
+        self.assertIn(simulation.EVENT_PADDLE, events)
+        self.assertEqual(state.score_b, 0)
+        self.assertGreater(state.ball.speed_x, 0)
+
+    def test_fast_ball_bounces_on_wall(self):
+        state = new_state()
+        place_ball(state, WIDTH / 2, 20, 0, -50)
+        events = simulation.step(state, (0, 0))
+        self.assertEqual(events, [simulation.EVENT_WALL])
+        self.assertGreater(state.ball.speed_y, 0)
+        self.assertAlmostEqual(state.ball.y, 30)
+
+    def test_fast_diagonal_ball_stays_on_the_field(self):
+        state = new_state()
+        paddle = state.paddle_a
+        place_ball(state, 400, paddle.y + paddle.height / 2, -37, 120)
+        for _ in range(200):
+            events = simulation.step(state, (0, 0))
+            if simulation.EVENT_POINT in events:
+                break
+            self.assertGreaterEqual(state.ball.y, 0)
+            self.assertLessEqual(state.ball.y + BALL_SIZE, HEIGHT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,253 @@
+"""
+Tournois entre contrôleurs de paddle, joués sans affichage sur plusieurs processus.
+
+Chaque partie est simulée avec le moteur simulation et une graine fixe, ce qui la rend
+reproductible. Les parties sont réparties sur un ProcessPoolExecutor et leurs résultats
+(victoires, longueur des échanges, bonus ramassés) sont fusionnés dans un rapport.
+
+Fonctions :
+- play_match(name_a, name_b, seed, dt, max_time): Joue une partie et retourne ses statistiques.
+- round_robin(names, matches, seed, ...): Toutes les paires de contrôleurs s'affrontent.
+- bracket(names, matches, seed, ...): Tableau à élimination directe.
+- build_report(results): Fusionne les statistiques des parties.
+- main(): Point d'entrée en ligne de commande.
+
+Exemple :
+    python tournament.py suiveur aleatoire immobile --matches 20 --seed 42
+    python tournament.py suiveur aleatoire immobile suiveur --mode bracket --json rapport.json
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from constants import WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, FRAME_MS
+import simulation
+from controllers import CONTROLLERS, create_controller
+
+# Durée de jeu maximale d'une partie (au-delà, la partie est déclarée nulle)
+MAX_MATCH_TIME_MS = 10 * 60 * 1000
+
+
+def play_match(name_a, name_b, seed, dt=FRAME_MS, max_time=MAX_MATCH_TIME_MS):
+    """
+    Joue une partie complète entre deux contrôleurs.
+
+    Args:
+        name_a, name_b (str): Noms des contrôleurs des paddles A et B.
+        seed (int): Graine de la partie (simulation et contrôleurs).
+        dt (float): Durée d'un pas de simulation en millisecondes.
+        max_time (float): Durée de jeu maximale en millisecondes.
+
+    Returns:
+        dict: Joueurs, graine, gagnant (nom ou None), scores, durée,
+        longueurs des échanges et nombre de bonus ramassés.
+    """
+    state = simulation.new_match(WIDTH, HEIGHT, PADDLE_HEIGHT, BALL_SIZE, seed)
+    rng = random.Random(seed)
+    controller_a = create_controller(name_a, "a", random.Random(rng.getrandbits(32)))
+    controller_b = create_controller(name_b, "b", random.Random(rng.getrandbits(32)))
+
+    rallies = []
+    hits = 0
+    bonus_pickups = 0
+    step = simulation.step
+    while state.running and state.time < max_time:
+        for event in step(state, (controller_a.decide(state, dt), controller_b.decide(state, dt)), dt):
+            if event == simulation.EVENT_PADDLE:
+                hits += 1
+            elif event == simulation.EVENT_POINT:
+                rallies.append(hits)
+                hits = 0
+            elif event == simulation.EVENT_BONUS:
+                bonus_pickups += 1
+
+    winner = None
+    if state.winner == "Joueur A":
+        winner = name_a
+    elif state.winner == "Joueur B":
+        winner = name_b
+    return {
+        "player_a": name_a,
+        "player_b": name_b,
+        "seed": seed,
+        "winner": winner,
+        "score_a": state.score_a,
+        "score_b": state.score_b,
+        "time_ms": state.time,
+        "rallies": rallies,
+        "bonus_pickups": bonus_pickups,
+    }
+
+
+def run_matches(pairings, executor, dt=FRAME_MS):
+    """
+    Joue une liste de parties sur l'exécuteur.
+
+    Args:
+        pairings (list): Tuples (name_a, name_b, seed).
+        executor (concurrent.futures.Executor): Exécuteur des parties.
+        dt (float): Durée d'un pas de simulation en millisecondes.
+
+    Returns:
+        list: Résultats de play_match, dans l'ordre de pairings.
+    """
+    names_a, names_b, seeds = zip(*pairings) if pairings else ((), (), ())
+    return list(executor.map(partial(play_match, dt=dt), names_a, names_b, seeds,
+                             chunksize=max(1, len(pairings) // 64)))
+
+
+def round_robin(names, matches, seed, executor, dt=FRAME_MS):
+    """
+    Fait s'affronter chaque paire de contrôleurs sur `matches` parties,
+    en alternant les côtés. La graine de chaque partie est seed + son numéro.
+
+    Returns:
+        list: Résultats de toutes les parties.
+    """
+    pairings = []
+    for name_1, name_2 in itertools.combinations(names, 2):
+        for i in range(matches):
+            name_a, name_b = (name_1, name_2) if i % 2 == 0 else (name_2, name_1)
+            pairings.append((name_a, name_b, seed + len(pairings)))
+    return run_matches(pairings, executor, dt)
+
+
+def bracket(names, matches, seed, executor, dt=FRAME_MS):
+    """
+    Tableau à élimination directe : à chaque tour les contrôleurs sont appariés dans
+    l'ordre, celui qui gagne le plus de parties sur `matches` passe au tour suivant
+    (le joueur de gauche en cas d'égalité). Un joueur sans adversaire est qualifié d'office.
+
+    Returns:
+        tuple: (résultats de toutes les parties, liste des tours, vainqueur)
+    """
+    results = []
+    rounds = []
+    remaining = list(names)
+    match_seed = seed
+    while len(remaining) > 1:
+        duels = [remaining[i:i + 2] for i in range(0, len(remaining), 2)]
+        pairings = []
+        for duel in duels:
+            if len(duel) == 2:
+                for i in range(matches):
+                    name_a, name_b = duel if i % 2 == 0 else duel[::-1]
+                    pairings.append((name_a, name_b, match_seed))
+                    match_seed += 1
+        round_results = run_matches(pairings, executor, dt)
+        results.extend(round_results)
+
+        qualified = []
+        for duel in duels:
+            if len(duel) == 1:
+                qualified.append(duel[0])
+                continue
+            wins = [0, 0]
+            for result in round_results:
+                if {result["player_a"], result["player_b"]} == set(duel) and result["winner"]:
+                    wins[duel.index(result["winner"])] += 1
+            qualified.append(duel[1] if wins[1] > wins[0] else duel[0])
+        rounds.append({"duels": duels, "qualified": qualified})
+        remaining = qualified
+    return results, rounds, remaining[0] if remaining else None
+
+
+def build_report(results):
+    """
+    Fusionne les résultats des parties en un rapport.
+
+    Args:
+        results (list): Résultats de play_match.
+
+    Returns:
+        dict: Statistiques par contrôleur (parties, victoires, nuls, taux de victoire)
+        et globales (longueur moyenne et maximale des échanges, bonus par partie et par minute).
+    """
+    players = {}
+    rallies = []
+    bonus_pickups = 0
+    total_time = 0
+    for result in results:
+        for name in (result["player_a"], result["player_b"]):
+            stats = players.setdefault(name, {"matches": 0, "wins": 0, "draws": 0})
+            stats["matches"] += 1
+            if result["winner"] is None:
+                stats["draws"] += 1
+            elif result["winner"] == name and result["player_a"] != result["player_b"]:
+                stats["wins"] += 1
+        rallies.extend(result["rallies"])
+        bonus_pickups += result["bonus_pickups"]
+        total_time += result["time_ms"]
+
+    for stats in players.values():
+        stats["win_rate"] = stats["wins"] / stats["matches"] if stats["matches"] else 0.0
+
+    return {
+        "matches": len(results),
+        "players": players,
+        "mean_rally": sum(rallies) / len(rallies) if rallies else 0.0,
+        "max_rally": max(rallies, default=0),
+        "bonus_per_match": bonus_pickups / len(results) if results else 0.0,
+        "bonus_per_minute": bonus_pickups / (total_time / 60000) if total_time else 0.0,
+    }
+
+
+def print_report(report):
+    """Affiche le rapport du tournoi dans la console."""
+    print(f"{report['matches']} parties")
+    print(f"{'Contrôleur':<16}{'Parties':>8}{'Victoires':>10}{'Nuls':>6}{'Taux':>8}")
+    ranking = sorted(report["players"].items(), key=lambda item: item[1]["win_rate"], reverse=True)
+    for name, stats in ranking:
+        print(f"{name:<16}{stats['matches']:>8}{stats['wins']:>10}{stats['draws']:>6}"
+              f"{stats['win_rate']:>8.1%}")
+    print(f"Échange moyen : {report['mean_rally']:.2f} frappes (max {report['max_rally']})")
+    print(f"Bonus ramassés : {report['bonus_per_match']:.2f} par partie, "
+          f"{report['bonus_per_minute']:.2f} par minute")
+    if "champion" in report:
+        print(f"Vainqueur du tableau : {report['champion']}")
+
+
+def main(argv=None):
+    """
+    Point d'entrée en ligne de commande : lance le tournoi, affiche le rapport
+    et l'écrit éventuellement au format JSON.
+    """
+    parser = argparse.ArgumentParser(description="Tournoi de contrôleurs Pong sans affichage.")
+    parser.add_argument("controllers", nargs="+", choices=sorted(CONTROLLERS),
+                        help="Contrôleurs participants")
+    parser.add_argument("--mode", choices=("round-robin", "bracket"), default="round-robin")
+    parser.add_argument("--matches", type=int, default=10, help="Parties par confrontation")
+    parser.add_argument("--seed", type=int, default=0, help="Graine de la première partie")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus")
+    parser.add_argument("--frames-per-step", type=int, default=1,
+                        help="Frames simulées par pas (collisions continues : les pas longs restent exacts)")
+    parser.add_argument("--json", help="Fichier où écrire le rapport JSON")
+    args = parser.parse_args(argv)
+
+    if len(args.controllers) < 2:
+        parser.error("il faut au moins deux contrôleurs")
+    dt = FRAME_MS * args.frames_per_step
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        if args.mode == "round-robin":
+            results = round_robin(args.controllers, args.matches, args.seed, executor, dt)
+            report = build_report(results)
+        else:
+            results, rounds, champion = bracket(args.controllers, args.matches, args.seed, executor, dt)
+            report = build_report(results)
+            report["rounds"] = rounds
+            report["champion"] = champion
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
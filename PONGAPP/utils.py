@@ -2,35 +2,11 @@
 Module utilitaire pour le jeu Pong.
 
 Fonctions:
-- reset_ball: Réinitialise la ball au centre avec une speed aléatoire.
 - format_time: Formate une durée en millisecondes en "minutes:secondes".
+- wait_events: Attend le prochain événement sans consommer de CPU.
 """
 
-import random
 import pygame
-from constants import BALL_SIZE, BALL_SPEED_INIT_X, BALL_SPEED_INIT_Y
-import settings
-
-
-def reset_ball(width, height):
-    """
-    Réinitialise la ball au centre avec une speed aléatoire et retourne ses paramètres initiaux.
-    """
-    ball_size = settings.get_current_ball_size()
-
-    # Position initiale de la ball au centre de l'écran
-    ball = pygame.Rect(width//2 - ball_size//2,
-                    height//2 - ball_size//2,
-                    ball_size,
-                    ball_size)
-
-    # Vitesse initiale aléatoire
-    ball_speed_x = random.choice([-1, 1]) * BALL_SPEED_INIT_X
-    ball_speed_y = random.choice([-1, 1]) * BALL_SPEED_INIT_Y
-
-    last_speedup = pygame.time.get_ticks()
-
-    return ball, ball_speed_x, ball_speed_y, last_speedup
 
 
 def format_time(milliseconds):
@@ -48,3 +24,21 @@ def format_time(milliseconds):
     minutes = total_seconds // 60
     seconds = total_seconds % 60
     return f"{minutes}:{seconds:02d}"
+
+
+def wait_events(timeout=0):
+    """
+    Bloque jusqu'au prochain événement pygame (ou jusqu'à l'expiration du délai)
+    et retourne tous les événements en attente. Utilisée par les écrans d'attente
+    (menus, pause, fin de partie) pour ne pas tourner en boucle à vide.
+
+    Args:
+        timeout (int): Délai maximal d'attente en millisecondes (0 = sans limite).
+
+    Returns:
+        list: Événements reçus (vide si le délai a expiré).
+    """
+    event = pygame.event.wait(timeout) if timeout else pygame.event.wait()
+    events = [] if event.type == pygame.NOEVENT else [event]
+    events.extend(pygame.event.get())
+    return events